@@ -297,9 +297,11 @@ pub fn replay(tick_loop: &mut TickLoop, log: &ReplayLog) -> Result<ReplayResult,
     // Step 1: Validate the replay log BEFORE mutating the TickLoop.
     // This ensures that on any validation error the caller's state is untouched.
 
-    // 1a: Build lookup maps from entries, rejecting duplicates.
-    let mut input_map: BTreeMap<u64, InputFrame> = BTreeMap::new();
-    let mut checkpoint_map: BTreeMap<u64, String> = BTreeMap::new();
+    // 1a: Build per-kind lookup maps from entries, rejecting duplicates.
+    // The maps borrow from the log, so building them copies no input
+    // frames or hashes; each input is cloned once, when it is applied.
+    let mut input_map: BTreeMap<u64, &InputFrame> = BTreeMap::new();
+    let mut checkpoint_map: BTreeMap<u64, &str> = BTreeMap::new();
 
     for entry in &log.entries {
         match entry {
@@ -309,7 +311,7 @@ pub fn replay(tick_loop: &mut TickLoop, log: &ReplayLog) -> Result<ReplayResult,
                         "replay log contains duplicate Input entry at tick {tick}"
                     ));
                 }
-                input_map.insert(*tick, input.clone());
+                input_map.insert(*tick, input);
             }
             ReplayEntry::Checkpoint { tick, state_hash } => {
                 if checkpoint_map.contains_key(tick) {
@@ -317,7 +319,7 @@ pub fn replay(tick_loop: &mut TickLoop, log: &ReplayLog) -> Result<ReplayResult,
                         "replay log contains duplicate Checkpoint entry at tick {tick}"
                     ));
                 }
-                checkpoint_map.insert(*tick, state_hash.clone());
+                checkpoint_map.insert(*tick, state_hash);
             }
         }
     }
@@ -354,20 +356,23 @@ pub fn replay(tick_loop: &mut TickLoop, log: &ReplayLog) -> Result<ReplayResult,
         // 4a: Set input for this tick BEFORE checking the checkpoint, because
         // during recording the state hash was computed after set_input but
         // before tick execution. The hash includes the current_input field.
-        let input = input_map.get(&tick).cloned().unwrap_or_default();
+        let input = input_map
+            .get(&tick)
+            .map(|input| (*input).clone())
+            .unwrap_or_default();
         tick_loop.set_input(input);
 
         // 4b: Check checkpoint BEFORE executing the tick (checkpoints are
         // recorded before tick execution, after input is set).
-        if let Some(expected_hash) = checkpoint_map.get(&tick) {
+        if let Some(&expected_hash) = checkpoint_map.get(&tick) {
             let actual_hash = tick_loop.state_hash();
-            if &actual_hash != expected_hash {
+            if actual_hash != expected_hash {
                 return Ok(ReplayResult {
                     completed: false,
                     ticks_replayed,
                     first_divergence: Some(ReplayDivergence {
                         tick,
-                        expected_hash: expected_hash.clone(),
+                        expected_hash: expected_hash.to_owned(),
                         actual_hash,
                     }),
                 });
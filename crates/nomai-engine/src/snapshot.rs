@@ -133,10 +133,14 @@ fn compute_hash(
         current_input: input,
     };
 
-    let json_bytes = serde_json::to_vec(&hashable)
+    // Stream the JSON straight into the hasher instead of materializing the
+    // whole serialized world first. The byte stream is identical to
+    // `serde_json::to_vec`, so digests are unchanged.
+    let mut hasher = blake3::Hasher::new();
+    serde_json::to_writer(&mut hasher, &hashable)
         .expect("EngineSnapshot state should always be JSON-serializable");
 
-    blake3::hash(&json_bytes).to_hex().to_string()
+    hasher.finalize().to_hex().to_string()
 }
 
 // ---------------------------------------------------------------------------
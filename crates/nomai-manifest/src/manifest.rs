@@ -274,6 +274,20 @@ pub struct ManifestPipeline {
     history: VecDeque<TickManifest>,
     /// Maximum number of tick manifests to retain in history.
     max_history: usize,
+    /// Causality index over `history`: for each `(entity, component id)`
+    /// pair, the changes to it, oldest first, as
+    /// `(manifest sequence number, change index within that manifest)`.
+    ///
+    /// Maintained in [`end_tick`](Self::end_tick) so
+    /// [`build_causal_chain`](Self::build_causal_chain) walks only the
+    /// matching changes instead of scanning the whole history window.
+    causal_index: HashMap<(EntityId, u32), VecDeque<(u64, usize)>>,
+    /// Interned component type names for `causal_index` keys, so indexing
+    /// a tick's changes looks names up by `&str` instead of cloning them.
+    /// Grows only with the number of distinct component types.
+    component_ids: HashMap<String, u32>,
+    /// Sequence number of `history[0]` (the count of evicted manifests).
+    history_base: u64,
     /// Registered custom aggregate functions.
     custom_aggregates: Vec<(String, AggregateFn)>,
     /// Diagnostic entries accumulated during the current tick.
@@ -301,6 +315,9 @@ impl ManifestPipeline {
             current_commands_succeeded: 0,
             history: VecDeque::new(),
             max_history,
+            causal_index: HashMap::new(),
+            component_ids: HashMap::new(),
+            history_base: 0,
             custom_aggregates: Vec::new(),
             diagnostics: Vec::new(),
         }
@@ -534,14 +551,62 @@ impl ManifestPipeline {
         };
 
         // Push to history, trimming if necessary.
+        let seq = self.history_base + self.history.len() as u64;
+        self.index_changes(seq, &manifest);
         self.history.push_back(manifest.clone());
         while self.history.len() > self.max_history {
-            self.history.pop_front();
+            if let Some(evicted) = self.history.pop_front() {
+                let evicted_seq = self.history_base;
+                self.unindex_changes(evicted_seq, &evicted);
+            }
+            self.history_base += 1;
         }
 
         manifest
     }
 
+    /// Record a manifest's component changes in the causality index.
+    fn index_changes(&mut self, seq: u64, manifest: &TickManifest) {
+        for (i, change) in manifest.component_changes.iter().enumerate() {
+            let id = self.component_id(&change.component_type_name);
+            self.causal_index
+                .entry((change.entity_id, id))
+                .or_default()
+                .push_back((seq, i));
+        }
+    }
+
+    /// Drop an evicted manifest's entries from the causality index.
+    ///
+    /// The evicted manifest is always the oldest, so its entries (if any)
+    /// are at the front of each affected list.
+    fn unindex_changes(&mut self, seq: u64, manifest: &TickManifest) {
+        for change in &manifest.component_changes {
+            let Some(&id) = self.component_ids.get(change.component_type_name.as_str()) else {
+                continue;
+            };
+            let key = (change.entity_id, id);
+            if let Some(entries) = self.causal_index.get_mut(&key) {
+                while entries.front().is_some_and(|&(s, _)| s == seq) {
+                    entries.pop_front();
+                }
+                if entries.is_empty() {
+                    self.causal_index.remove(&key);
+                }
+            }
+        }
+    }
+
+    /// Interned id for a component type name, assigning one on first use.
+    fn component_id(&mut self, name: &str) -> u32 {
+        if let Some(&id) = self.component_ids.get(name) {
+            return id;
+        }
+        let id = self.component_ids.len() as u32;
+        self.component_ids.insert(name.to_owned(), id);
+        id
+    }
+
     /// Build a causal chain for a given component change.
     ///
     /// Starts with the given change and walks backward through manifest
@@ -562,34 +627,44 @@ impl ManifestPipeline {
             ),
         });
 
-        // Walk backward through history for prior changes to the same
-        // entity + component.
-        for manifest in self.history.iter().rev() {
+        // Walk backward through the history changes to the same entity +
+        // component, using the causality index. Entries come newest first,
+        // so each manifest's run of steps is reversed back into command
+        // order once the walk moves past it.
+        let entries = self
+            .component_ids
+            .get(change.component_type_name.as_str())
+            .and_then(|&id| self.causal_index.get(&(change.entity_id, id)));
+        let mut run_start = steps.len();
+        let mut run_seq = None;
+        for &(seq, i) in entries.into_iter().flatten().rev() {
+            if run_seq != Some(seq) {
+                steps[run_start..].reverse();
+                run_start = steps.len();
+                run_seq = Some(seq);
+            }
+            let manifest = &self.history[(seq - self.history_base) as usize];
             // Skip manifests at or after the change's tick (we want prior).
             if manifest.tick >= change.tick {
                 continue;
             }
 
-            for prior_change in &manifest.component_changes {
-                if prior_change.entity_id == change.entity_id
-                    && prior_change.component_type_name == change.component_type_name
-                {
-                    steps.push(CausalStep {
-                        tick: prior_change.tick,
-                        command_index: prior_change.command_index,
-                        system_id: prior_change.changed_by,
-                        reason: prior_change.reason.clone(),
-                        description: format!(
-                            "System {:?} changed {} on {:?}: {:?}",
-                            prior_change.changed_by,
-                            prior_change.component_type_name,
-                            prior_change.entity_id,
-                            prior_change.reason,
-                        ),
-                    });
-                }
-            }
+            let prior_change = &manifest.component_changes[i];
+            steps.push(CausalStep {
+                tick: prior_change.tick,
+                command_index: prior_change.command_index,
+                system_id: prior_change.changed_by,
+                reason: prior_change.reason.clone(),
+                description: format!(
+                    "System {:?} changed {} on {:?}: {:?}",
+                    prior_change.changed_by,
+                    prior_change.component_type_name,
+                    prior_change.entity_id,
+                    prior_change.reason,
+                ),
+            });
         }
+        steps[run_start..].reverse();
 
         CausalChain {
             entity_id: change.entity_id,
@@ -2046,6 +2121,61 @@ mod tests {
         );
     }
 
+    // -- 22b. Causality index: same-tick changes and eviction ---------------
+
+    #[test]
+    fn causal_chain_index_matches_history_scan() {
+        let mut pipeline = ManifestPipeline::with_max_history(3);
+        let mut world = setup_world();
+
+        let mut buf = CommandBuffer::new();
+        buf.spawn_semantic(
+            player_identity(),
+            vec![("health".to_owned(), serde_json::json!(100))],
+            SystemId(1),
+            CausalReason::GameRule("spawn".to_owned()),
+        );
+        let applied = buf.apply(&mut world);
+        pipeline.begin_tick();
+        pipeline.process_commands(&applied, 0, &world);
+        pipeline.end_tick(0, 0.0, vec![], &world);
+        let entity_id = *pipeline.entity_index().keys().next().unwrap();
+
+        // Two health changes per tick, so one manifest holds several
+        // indexed changes for the same entity + component.
+        for tick in 1..=5u64 {
+            let mut buf2 = CommandBuffer::new();
+            for hit in 0..2u64 {
+                buf2.set_component(
+                    entity_id,
+                    "health",
+                    serde_json::json!(100 - tick * 10 - hit),
+                    SystemId(2),
+                    CausalReason::GameRule(format!("hit_{tick}_{hit}")),
+                );
+            }
+            let applied2 = buf2.apply(&mut world);
+            pipeline.begin_tick();
+            pipeline.process_commands(&applied2, tick, &world);
+            pipeline.end_tick(tick, tick as f64 * 0.016, vec![], &world);
+        }
+
+        let latest = pipeline
+            .manifest_at_tick(5)
+            .unwrap()
+            .component_changes
+            .last()
+            .unwrap()
+            .clone();
+        let chain = pipeline.build_causal_chain(&latest);
+
+        // The change itself, then ticks 4 and 3 (tick 2 and older are
+        // evicted or not prior), each in command order.
+        let ticks: Vec<u64> = chain.steps.iter().map(|s| s.tick).collect();
+        assert_eq!(ticks, vec![5, 4, 4, 3, 3]);
+        assert!(chain.steps[1].command_index < chain.steps[2].command_index);
+    }
+
     // -- 23. Edge case: entity index tracks re-use after despawn + respawn ---
 
     #[test]
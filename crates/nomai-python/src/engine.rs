@@ -15,7 +15,19 @@ use nomai_engine::tick::{InputFrame, TickConfig, TickLoop};
 use nomai_manifest::manifest::TickManifest;
 use nomai_wasm_host::{WasmConfig, WasmModule};
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyTuple};
+use pyo3::types::{PyBytes, PyDict, PyString, PyTuple};
+
+/// Borrows the UTF-8 bytes of a JSON payload passed as `str` or `bytes`.
+///
+/// Neither case copies: `bytes` exposes its buffer directly and `str`
+/// exposes its cached UTF-8 representation. The result feeds
+/// `serde_json::from_slice`.
+fn json_payload<'a>(payload: &'a Bound<'_, PyAny>) -> PyResult<&'a [u8]> {
+    if let Ok(bytes) = payload.downcast::<PyBytes>() {
+        return Ok(bytes.as_bytes());
+    }
+    Ok(payload.downcast::<PyString>()?.to_str()?.as_bytes())
+}
 
 /// Converts a [`TickManifest`] to a Python dict via JSON round-trip.
 ///
@@ -144,6 +156,52 @@ impl PyNomaiEngine {
         Ok(manifests)
     }
 
+    /// Run ticks until a built-in predicate holds or `max_ticks` is reached.
+    ///
+    /// The predicate is evaluated in Rust after every tick, so the loop
+    /// never calls back into Python. Returns every manifest produced,
+    /// including the one that satisfied the predicate.
+    ///
+    /// Args:
+    ///     predicate: One of "tick_at_least", "entity_count_at_least",
+    ///         "entity_count_at_most".
+    ///     threshold: The value the predicate compares against.
+    ///     max_ticks: Upper bound on ticks to run. Unlike `run_ticks` this is
+    ///         not capped: the Python wrapper's callable path has no limit,
+    ///         and the manifest list only grows as ticks actually run.
+    fn run_until(
+        &mut self,
+        py: Python<'_>,
+        predicate: &str,
+        threshold: u64,
+        max_ticks: u64,
+    ) -> PyResult<Vec<PyObject>> {
+        let done: fn(&TickManifest, u64) -> bool = match predicate {
+            "tick_at_least" => |m, n| m.tick >= n,
+            "entity_count_at_least" => |m, n| m.aggregates.total_entity_count as u64 >= n,
+            "entity_count_at_most" => |m, n| m.aggregates.total_entity_count as u64 <= n,
+            other => {
+                return Err(pyo3::exceptions::PyValueError::new_err(format!(
+                    "run_until: unknown predicate '{other}'"
+                )));
+            }
+        };
+        let mut manifests = Vec::new();
+        for _ in 0..max_ticks {
+            self.loop_mut()?.tick();
+            let manifest = self.loop_ref()?.last_manifest().ok_or_else(|| {
+                pyo3::exceptions::PyRuntimeError::new_err(
+                    "no manifest produced after tick -- this should not happen",
+                )
+            })?;
+            manifests.push(manifest_to_pyobject(py, manifest)?);
+            if done(manifest, threshold) {
+                break;
+            }
+        }
+        Ok(manifests)
+    }
+
     /// Get the manifest for the most recent tick as a Python dict.
     ///
     /// Returns None if no ticks have been executed yet.
@@ -174,6 +232,21 @@ impl PyNomaiEngine {
         Ok(result)
     }
 
+    /// Number of manifests currently in the history window.
+    fn history_len(&self) -> PyResult<usize> {
+        Ok(self.loop_ref()?.manifest().history().len())
+    }
+
+    /// Get the manifest at a position in the history window (0 = oldest).
+    ///
+    /// Returns None if the position is past the end of the window.
+    fn manifest_history_at(&self, py: Python<'_>, index: usize) -> PyResult<Option<PyObject>> {
+        match self.loop_ref()?.manifest().history().get(index) {
+            Some(m) => Ok(Some(manifest_to_pyobject(py, m)?)),
+            None => Ok(None),
+        }
+    }
+
     /// Current tick count.
     fn tick_count(&self) -> PyResult<u64> {
         Ok(self.loop_ref()?.tick_count())
@@ -216,6 +289,42 @@ impl PyNomaiEngine {
         Ok(())
     }
 
+    /// Spawn several semantic entities via the command buffer in one call.
+    ///
+    /// Equivalent to calling `spawn_entity` once per spec, in order, but
+    /// crosses the FFI boundary once. All component dicts are converted
+    /// before anything is queued, so an invalid spec queues nothing.
+    ///
+    /// Args:
+    ///     specs: List of `(entity_type, role, components)` tuples.
+    fn spawn_entities(
+        &mut self,
+        specs: Vec<(String, String, Bound<'_, PyDict>)>,
+        py: Python<'_>,
+    ) -> PyResult<()> {
+        let mut converted = Vec::with_capacity(specs.len());
+        for (entity_type, role, components) in specs {
+            let comp_vec = pydict_to_component_vec(&components, py)?;
+            converted.push((entity_type, role, comp_vec));
+        }
+
+        let buffer = self.loop_mut()?.command_buffer_mut();
+        for (entity_type, role, comp_vec) in converted {
+            buffer.spawn_semantic(
+                EntityIdentity {
+                    entity_type,
+                    role,
+                    spawned_by: SystemId(0),
+                    requirement_id: None,
+                },
+                comp_vec,
+                SystemId(0),
+                CausalReason::SystemInternal("python_spawn".to_owned()),
+            );
+        }
+        Ok(())
+    }
+
     /// Despawn an entity via the command buffer.
     ///
     /// The despawn happens when the next tick's command buffer is applied.
@@ -229,6 +338,19 @@ impl PyNomaiEngine {
         Ok(())
     }
 
+    /// Despawn several entities via the command buffer in one call.
+    fn despawn_entities(&mut self, entity_ids: Vec<u64>) -> PyResult<()> {
+        let buffer = self.loop_mut()?.command_buffer_mut();
+        for entity_id in entity_ids {
+            buffer.despawn(
+                EntityId::from_raw(entity_id),
+                SystemId(0),
+                CausalReason::SystemInternal("python_despawn".to_owned()),
+            );
+        }
+        Ok(())
+    }
+
     /// Set a component value via the command buffer.
     ///
     /// The value should be a JSON-serializable Python object. The component
@@ -542,16 +664,29 @@ impl PyNomaiEngine {
         Ok(self.loop_ref()?.world().entity_count())
     }
 
-    /// Return all tracked entities from the manifest pipeline's entity index.
+    /// Return tracked entities from the manifest pipeline's entity index.
     ///
     /// Each entity is returned as a Python dict (via JSON round-trip) containing
     /// fields like `entity_id`, `tier`, `entity_type`, `role`, `alive`,
     /// `spawned_at_tick`, and `despawned_at_tick`.
-    fn entity_index(&self, py: Python<'_>) -> PyResult<Vec<PyObject>> {
+    ///
+    /// When `role` and/or `entity_type` are given, only matching entries are
+    /// serialized and returned; the rest never cross the FFI boundary.
+    #[pyo3(signature = (role=None, entity_type=None))]
+    fn entity_index(
+        &self,
+        py: Python<'_>,
+        role: Option<&str>,
+        entity_type: Option<&str>,
+    ) -> PyResult<Vec<PyObject>> {
         let index = self.loop_ref()?.manifest().entity_index();
         let json_mod = py.import("json")?;
-        let mut result = Vec::with_capacity(index.len());
-        for entry in index.values() {
+        let mut result = Vec::new();
+        let matching = index.values().filter(|entry| {
+            role.is_none_or(|r| entry.role == r)
+                && entity_type.is_none_or(|t| entry.entity_type == t)
+        });
+        for entry in matching {
             let json_str = serde_json::to_string(entry).map_err(|e| {
                 pyo3::exceptions::PyRuntimeError::new_err(format!(
                     "failed to serialize EntityEntry to JSON: {e} \
@@ -669,7 +804,22 @@ impl PyNomaiEngine {
         })
     }
 
-    /// Restore engine state from a JSON snapshot string.
+    /// Capture a snapshot as ``(json, tick_counter, fixed_dt, hash)``.
+    ///
+    /// Same JSON as ``capture_snapshot()``, plus the summary fields read
+    /// straight off the Rust struct so callers need not re-parse the
+    /// (potentially large) world JSON just to get at them.
+    fn capture_snapshot_parts(&self) -> PyResult<(String, u64, f64, String)> {
+        let snapshot = self.loop_ref()?.capture_snapshot();
+        let json = serde_json::to_string(&snapshot).map_err(|e| {
+            pyo3::exceptions::PyRuntimeError::new_err(format!(
+                "failed to serialize EngineSnapshot to JSON: {e}"
+            ))
+        })?;
+        Ok((json, snapshot.tick_counter, snapshot.fixed_dt, snapshot.hash))
+    }
+
+    /// Restore engine state from a JSON snapshot (``str`` or ``bytes``).
     ///
     /// The snapshot must have been produced by ``capture_snapshot()``.
     /// After restore the tick counter and world state match the snapshot;
@@ -677,9 +827,9 @@ impl PyNomaiEngine {
     ///
     /// **Note:** Systems, physics world, and WASM module are NOT restored.
     /// Re-attach them after calling this method if needed.
-    fn restore_snapshot(&mut self, snapshot_json: &str) -> PyResult<()> {
+    fn restore_snapshot(&mut self, snapshot_json: &Bound<'_, PyAny>) -> PyResult<()> {
         let snapshot: nomai_engine::snapshot::EngineSnapshot =
-            serde_json::from_str(snapshot_json).map_err(|e| {
+            serde_json::from_slice(json_payload(snapshot_json)?).map_err(|e| {
                 pyo3::exceptions::PyValueError::new_err(format!(
                     "invalid snapshot JSON: {e} -- ensure the string was produced by capture_snapshot()"
                 ))
@@ -702,7 +852,7 @@ impl PyNomaiEngine {
 
     // -- Replay -------------------------------------------------------------
 
-    /// Replay a recorded log (JSON string) and return the result as JSON.
+    /// Replay a recorded log (JSON ``str`` or ``bytes``) and return the result as JSON.
     ///
     /// The log must have been produced by serializing a ``ReplayLog`` to JSON
     /// (e.g., from the Rust integration tests or via ``ReplayRecorder``).
@@ -711,9 +861,9 @@ impl PyNomaiEngine {
     /// - ``completed``: whether the replay ran to completion.
     /// - ``ticks_replayed``: total ticks replayed.
     /// - ``first_divergence``: the first checkpoint mismatch, if any.
-    fn replay_log(&mut self, replay_log_json: &str) -> PyResult<String> {
+    fn replay_log(&mut self, replay_log_json: &Bound<'_, PyAny>) -> PyResult<String> {
         let log: nomai_engine::replay::ReplayLog =
-            serde_json::from_str(replay_log_json).map_err(|e| {
+            serde_json::from_slice(json_payload(replay_log_json)?).map_err(|e| {
                 pyo3::exceptions::PyValueError::new_err(format!(
                     "invalid replay log JSON: {e} -- ensure the string is a valid ReplayLog"
                 ))
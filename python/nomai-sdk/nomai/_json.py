@@ -0,0 +1,66 @@
+"""JSON encode/decode helpers shared by the SDK's serializable types.
+
+Uses ``orjson`` when it is installed (``pip install nomai-sdk[fast]``)
+and falls back to the stdlib ``json`` module otherwise.
+
+``dumps(data)`` (``indent=None``) always matches ``json.dumps(data)``,
+spaces after separators included, since orjson has no such layout.
+For ``indent=2`` and ``dumps_compact`` both backends accept the same
+inputs and use the same layout, but the text is not byte-identical:
+
+- orjson writes non-ASCII characters as UTF-8 instead of ``\\uXXXX``
+  escapes;
+- orjson spells some floats differently (``1e16`` vs ``1e+16``);
+- orjson encodes NaN and Infinity as ``null``; the stdlib writes the
+  non-standard ``NaN`` / ``Infinity`` literals.
+
+Never hash or byte-compare this output; use a stdlib encoding with
+fixed options when a stable byte form is needed.
+"""
+
+from __future__ import annotations
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+# Stdlib encoders, built once rather than per json.dumps call. Payloads
+# are plain trees, so the circular-reference check is skipped; all other
+# options are the json.dumps defaults, so the text matches it exactly.
+_ENCODE_DEFAULT = json.JSONEncoder(check_circular=False).encode
+_ENCODE_COMPACT = json.JSONEncoder(
+    separators=(",", ":"), check_circular=False,
+).encode
+_ENCODE_INDENT_2 = json.JSONEncoder(indent=2, check_circular=False).encode
+_DECODE = json.JSONDecoder().decode
+
+
+def dumps(data: object, indent: int | None = None) -> str:
+    """Encode *data* as JSON, via orjson for ``indent=2``."""
+    if indent is None:
+        return _ENCODE_DEFAULT(data)
+    if indent == 2:
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+            return orjson.dumps(data, option=option).decode("utf-8")
+        return _ENCODE_INDENT_2(data)
+    return json.dumps(data, indent=indent)
+
+
+def dumps_compact(data: object) -> str:
+    """Encode *data* with no whitespace, like ``separators=(",", ":")``."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return _ENCODE_COMPACT(data)
+
+
+def loads(json_str: str | bytes) -> dict[str, object]:
+    """Decode a JSON object, via orjson when available."""
+    if orjson is not None:
+        return orjson.loads(json_str)  # type: ignore[no-any-return]
+    if isinstance(json_str, bytes):
+        json_str = json_str.decode("utf-8")
+    return _DECODE(json_str)  # type: ignore[no-any-return]
@@ -106,7 +106,7 @@ def _paddle_exists() -> IntentSpec:
         entity_role="paddle",
         must_exist=True,
         must_be_visible=True,
-        required_components=["position", "size"],
+        required_components=("position", "size"),
     )
 
 
@@ -122,7 +122,7 @@ def _ball_exists() -> IntentSpec:
         entity_role="ball",
         must_exist=True,
         must_be_visible=True,
-        required_components=["position", "velocity"],
+        required_components=("position", "velocity"),
     )
 
 
@@ -138,7 +138,7 @@ def _bricks_exist() -> IntentSpec:
         entity_role="brick",
         must_exist=True,
         must_be_visible=True,
-        required_components=["position", "size"],
+        required_components=("position", "size"),
     )
 
 
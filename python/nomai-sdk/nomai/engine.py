@@ -8,18 +8,23 @@ instead of raw dicts.
 from __future__ import annotations
 
 import logging
-from typing import Any, Callable
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, Callable, overload
 
 from nomai.manifest import (
     CausalChain,
     EntityEntry,
     TickManifest,
 )
+from nomai.predicates import NATIVE_PREDICATES
 from nomai.replay import EngineSnapshot, ReplayLog, ReplayResult
 from nomai.scene import SceneSnapshot
 
 logger = logging.getLogger(__name__)
 
+# Largest value the native engine's ``u64`` arguments accept.
+_U64_MAX = 2**64 - 1
+
 
 def _get_native_engine() -> type:
     """Import the native engine, raising a clear error if unavailable."""
@@ -34,6 +39,68 @@ def _get_native_engine() -> type:
         ) from exc
 
 
+class ManifestHistory(Sequence[TickManifest]):
+    """Live view of the engine's rolling manifest history window.
+
+    Index 0 is the oldest manifest still in the window. ``len()`` is a
+    single native call; manifests are fetched and parsed only when
+    indexed or iterated, so checking the window size costs nothing per
+    tick. The view reflects later ticks -- copy with ``list()`` to pin it.
+    """
+
+    __slots__ = ("_engine",)
+
+    def __init__(self, native_engine: Any) -> None:
+        self._engine = native_engine
+
+    def __len__(self) -> int:
+        return self._engine.history_len()
+
+    @overload
+    def __getitem__(self, index: int) -> TickManifest: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[TickManifest]: ...
+
+    def __getitem__(self, index: int | slice) -> TickManifest | list[TickManifest]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        raw = self._engine.manifest_history_at(index) if index >= 0 else None
+        if raw is None:
+            raise IndexError("manifest history index out of range")
+        return TickManifest.from_dict(raw)
+
+
+class TickStream(Iterator[TickManifest]):
+    """Single-pass iterator that runs one tick per ``next()`` call.
+
+    Only the manifest currently being consumed is alive, so scanning a
+    long run keeps peak memory flat regardless of tick count. Ticks run
+    on demand: abandoning the stream early leaves the remaining ticks
+    unrun. ``len()`` is the number of ticks still to come.
+    """
+
+    __slots__ = ("_engine", "_remaining")
+
+    def __init__(self, native_engine: Any, n: int) -> None:
+        self._engine = native_engine
+        self._remaining = max(n, 0)
+
+    def __len__(self) -> int:
+        return self._remaining
+
+    def __iter__(self) -> TickStream:
+        return self
+
+    def __next__(self) -> TickManifest:
+        if self._remaining == 0:
+            raise StopIteration
+        self._remaining -= 1
+        return TickManifest.from_dict(self._engine.tick())
+
+
 class NomaiEngine:
     """High-level wrapper around the Rust NomaiEngine.
 
@@ -75,12 +142,37 @@ class NomaiEngine:
         raws = self._engine.run_ticks(n)
         return [TickManifest.from_dict(r) for r in raws]
 
+    def run_ticks_stream(self, n: int) -> TickStream:
+        """Run N ticks lazily, yielding one manifest at a time.
+
+        Costs one native call per tick, so prefer :meth:`run_ticks` when
+        every manifest is needed anyway.
+        """
+        return TickStream(self._engine, n)
+
     def run_until(
         self,
         condition: Callable[[TickManifest], bool],
         max_ticks: int = 10_000,
     ) -> list[TickManifest]:
-        """Run ticks until condition returns True or max_ticks reached."""
+        """Run ticks until condition returns True or max_ticks reached.
+
+        Predicates from :mod:`nomai.predicates` (e.g. ``TickAtLeast(100)``)
+        are evaluated natively in a single call; any other callable is
+        invoked from Python after every tick. Both paths give the same
+        result for the same arguments.
+        """
+        if isinstance(condition, NATIVE_PREDICATES):
+            predicate, threshold = condition.native_args()
+            # Values the native u64 arguments cannot hold (e.g. negative
+            # counts) take the Python loop, which already handles them.
+            if (
+                isinstance(threshold, int)
+                and 0 <= threshold <= _U64_MAX
+                and 0 <= max_ticks <= _U64_MAX
+            ):
+                raws = self._engine.run_until(predicate, threshold, max_ticks)
+                return [TickManifest.from_dict(r) for r in raws]
         manifests: list[TickManifest] = []
         for _ in range(max_ticks):
             m = self.tick()
@@ -110,9 +202,26 @@ class NomaiEngine:
         raws = self._engine.manifest_history()
         return [TickManifest.from_dict(r) for r in raws]
 
-    def entity_index(self) -> list[EntityEntry]:
-        """Get all tracked entities."""
-        raws = self._engine.entity_index()
+    def manifest_history_view(self) -> ManifestHistory:
+        """Get a lazy, live view of the manifests in the history window.
+
+        Unlike :meth:`manifest_history`, nothing is copied up front, and
+        the view tracks later ticks and restores.
+        """
+        return ManifestHistory(self._engine)
+
+    def entity_index(
+        self,
+        *,
+        role: str | None = None,
+        entity_type: str | None = None,
+    ) -> list[EntityEntry]:
+        """Get tracked entities, optionally filtered by role and/or type.
+
+        Filters are applied on the Rust side, so non-matching entries are
+        never serialized or materialized in Python.
+        """
+        raws = self._engine.entity_index(role=role, entity_type=entity_type)
         return [EntityEntry.from_dict(r) for r in raws]
 
     def get_entity(self, entity_id: int) -> EntityEntry | None:
@@ -147,10 +256,28 @@ class NomaiEngine:
             entity_type, role, components or {}
         )
 
+    def spawn_entities(
+        self,
+        specs: Iterable[tuple[str, str, dict[str, Any] | None]],
+    ) -> None:
+        """Queue many semantic entity spawns in a single native call.
+
+        Each spec is an ``(entity_type, role, components)`` tuple, queued
+        in order exactly as :meth:`spawn_entity` would.
+        """
+        self._engine.spawn_entities([
+            (entity_type, role, components or {})
+            for entity_type, role, components in specs
+        ])
+
     def despawn_entity(self, entity_id: int) -> None:
         """Queue an entity despawn (applied on next tick)."""
         self._engine.despawn_entity(entity_id)
 
+    def despawn_entities(self, entity_ids: Iterable[int]) -> None:
+        """Queue many entity despawns in a single native call."""
+        self._engine.despawn_entities(list(entity_ids))
+
     def set_component(
         self,
         entity_id: int,
@@ -268,8 +395,17 @@ class NomaiEngine:
         fixed_dt, BLAKE3 hash, and the full JSON for round-tripping back
         to ``restore_snapshot()``.
         """
-        json_str: str = self._engine.capture_snapshot()
-        return EngineSnapshot.from_json(json_str)
+        # The summary fields come back alongside the JSON, so the world
+        # payload is never re-parsed on the Python side.
+        json_str, tick_counter, fixed_dt, state_hash = (
+            self._engine.capture_snapshot_parts()
+        )
+        return EngineSnapshot(
+            tick_counter=tick_counter,
+            fixed_dt=fixed_dt,
+            hash=state_hash,
+            raw_json=json_str,
+        )
 
     def restore_snapshot(self, snapshot: EngineSnapshot) -> None:
         """Restore engine state from a previously captured snapshot.
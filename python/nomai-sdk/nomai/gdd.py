@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Self
 
@@ -54,7 +55,7 @@ class BoundsSpec:
         }
 
     @classmethod
-    def from_dict(cls, data: dict[str, object]) -> Self:
+    def from_dict(cls, data: Mapping[str, object]) -> Self:
         """Deserialize from a plain dict."""
         return cls(
             x_min=_opt_float(data.get("x_min")),
@@ -92,7 +93,7 @@ class PlayAreaSpec:
         }
 
     @classmethod
-    def from_dict(cls, data: dict[str, object]) -> Self:
+    def from_dict(cls, data: Mapping[str, object]) -> Self:
         """Deserialize from a plain dict."""
         return cls(
             width=float(data["width"]),  # type: ignore[arg-type]
@@ -155,11 +156,11 @@ class EntitySpec:
         }
 
     @classmethod
-    def from_dict(cls, data: dict[str, object]) -> Self:
+    def from_dict(cls, data: Mapping[str, object]) -> Self:
         """Deserialize from a plain dict."""
         raw_bounds = data.get("bounds")
         bounds: BoundsSpec | None = None
-        if isinstance(raw_bounds, dict):
+        if isinstance(raw_bounds, Mapping):
             bounds = BoundsSpec.from_dict(raw_bounds)
 
         raw_comps = data.get("required_components", ())
@@ -217,7 +218,7 @@ class InteractionSpec:
         }
 
     @classmethod
-    def from_dict(cls, data: dict[str, object]) -> Self:
+    def from_dict(cls, data: Mapping[str, object]) -> Self:
         """Deserialize from a plain dict."""
         return cls(
             entity_a=str(data["entity_a"]),
@@ -272,7 +273,7 @@ class InvariantSpec:
         }
 
     @classmethod
-    def from_dict(cls, data: dict[str, object]) -> Self:
+    def from_dict(cls, data: Mapping[str, object]) -> Self:
         """Deserialize from a plain dict."""
         return cls(
             name=str(data["name"]),
@@ -332,7 +333,7 @@ class DegenerateStateSpec:
         }
 
     @classmethod
-    def from_dict(cls, data: dict[str, object]) -> Self:
+    def from_dict(cls, data: Mapping[str, object]) -> Self:
         """Deserialize from a plain dict."""
         return cls(
             name=str(data["name"]),
@@ -389,7 +390,7 @@ class ClarificationQuestion:
         }
 
     @classmethod
-    def from_dict(cls, data: dict[str, object]) -> Self:
+    def from_dict(cls, data: Mapping[str, object]) -> Self:
         """Deserialize from a plain dict."""
         return cls(
             question=str(data["question"]),
@@ -464,11 +465,11 @@ class GameDesignSpec:
         }
 
     @classmethod
-    def from_dict(cls, data: dict[str, object]) -> Self:
+    def from_dict(cls, data: Mapping[str, object]) -> Self:
         """Deserialize from a plain dict."""
         raw_play_area = data.get("play_area")
         play_area: PlayAreaSpec | None = None
-        if isinstance(raw_play_area, dict):
+        if isinstance(raw_play_area, Mapping):
             play_area = PlayAreaSpec.from_dict(raw_play_area)
 
         raw_entities = data.get("entities", ())
@@ -25,6 +25,7 @@ from __future__ import annotations
 import json
 import logging
 import re
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -70,15 +71,15 @@ class PipelineResult:
 # ---------------------------------------------------------------------------
 
 def run_pipeline(
-    source: str | Path | dict[str, object],
+    source: str | Path | Mapping[str, object],
     output_dir: str | Path | None = None,
     save: bool = True,
 ) -> PipelineResult:
     """Run the GDD pipeline: load, check, generate, save.
 
     Args:
-        source: A ``GameDesignSpec`` dict, a path to a spec JSON file,
-            or a string path to a spec JSON file.
+        source: A ``GameDesignSpec`` dict (or any read-only mapping), a
+            path to a spec JSON file, or a string path to a spec JSON file.
         output_dir: Directory to save artifacts into.  Defaults to
             ``python/nomai-sdk/specs/{slug}/`` based on the spec title.
         save: Whether to save artifacts to disk.  Defaults to ``True``.
@@ -200,6 +201,8 @@ def save_spec(spec: GameDesignSpec, path: str | Path) -> Path:
 
 _PROSE_SUFFIXES: frozenset[str] = frozenset({".md", ".txt", ".markdown"})
 
+_SLUG_INVALID_RE: re.Pattern[str] = re.compile(r"[^a-z0-9]+")
+
 
 def _slugify(title: str) -> str:
     """Convert a game title to a filesystem-safe slug.
@@ -215,18 +218,18 @@ def _slugify(title: str) -> str:
         A filesystem-safe slug string.
     """
     slug = title.lower()
-    slug = re.sub(r"[^a-z0-9]+", "_", slug)
+    slug = _SLUG_INVALID_RE.sub("_", slug)
     slug = slug.strip("_")
     if not slug:
         return "untitled"
     return slug
 
 
-def _load_source(source: str | Path | dict[str, object]) -> GameDesignSpec:
-    """Load a GameDesignSpec from a dict or JSON file path.
+def _load_source(source: str | Path | Mapping[str, object]) -> GameDesignSpec:
+    """Load a GameDesignSpec from a mapping or JSON file path.
 
     Args:
-        source: Either a dict to pass to ``GameDesignSpec.from_dict()``,
+        source: Either a mapping to pass to ``GameDesignSpec.from_dict()``,
             or a string/Path pointing to a JSON file.
 
     Returns:
@@ -237,7 +240,7 @@ def _load_source(source: str | Path | dict[str, object]) -> GameDesignSpec:
             that must be parsed by the /parse-gdd skill first.
         FileNotFoundError: If ``source`` is a path that does not exist.
     """
-    if isinstance(source, dict):
+    if isinstance(source, Mapping):
         return GameDesignSpec.from_dict(source)
 
     p = Path(source)
@@ -9,16 +9,53 @@ All types are JSON-serializable for regression test storage.
 
 from __future__ import annotations
 
-import json
 import logging
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Self
+from typing import Callable, Self, TypeVar
+
+from nomai._json import dumps as _dumps
+from nomai._json import loads as _loads
 
 logger = logging.getLogger(__name__)
 
 
+_Node = TypeVar("_Node")
+
+
+def _child_dicts(data: dict[str, object]) -> list[dict[str, object]]:
+    raw_children = data.get("children", [])
+    if isinstance(raw_children, list):
+        return raw_children  # type: ignore[return-value]
+    return []
+
+
+def _build_tree(
+    data: dict[str, object],
+    make: Callable[[dict[str, object], list[_Node]], _Node],
+) -> _Node:
+    """Rebuild a Trigger/Expected tree without recursion.
+
+    Post-order walk over an explicit stack: a frame is finished once it
+    has built one node per child dict, at which point *make* constructs
+    the parent from those children and appends it to the parent frame.
+    """
+    root: list[_Node] = []
+    stack: list[tuple[dict[str, object], list[dict[str, object]], list[_Node], list[_Node]]] = [
+        (data, _child_dicts(data), [], root),
+    ]
+    while stack:
+        node, pending, built, out = stack[-1]
+        if len(built) < len(pending):
+            child = pending[len(built)]
+            stack.append((child, _child_dicts(child), [], built))
+            continue
+        stack.pop()
+        out.append(make(node, built))
+    return root[0]
+
+
 # ---------------------------------------------------------------------------
 # TriggerType / Trigger
 # ---------------------------------------------------------------------------
@@ -36,7 +73,11 @@ class TriggerType(Enum):
     AFTER = "after"
 
 
-@dataclass(frozen=True)
+# Value -> member lookup, avoiding the Enum constructor's per-call overhead.
+_TRIGGER_TYPE_BY_VALUE: dict[str, TriggerType] = {t.value: t for t in TriggerType}
+
+
+@dataclass(frozen=True, slots=True)
 class Trigger:
     """A trigger expression describing when a behavior should be observed.
 
@@ -45,7 +86,11 @@ class Trigger:
     """
     type: TriggerType
     params: dict[str, object] = field(default_factory=dict)
-    children: list[Trigger] = field(default_factory=list)
+    children: tuple[Trigger, ...] = ()
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.children, tuple):
+            object.__setattr__(self, "children", tuple(self.children))
 
     def to_dict(self) -> dict[str, object]:
         """Serialize to a plain dict for JSON storage."""
@@ -62,23 +107,25 @@ class Trigger:
     @classmethod
     def from_dict(cls, data: dict[str, object]) -> Self:
         """Deserialize from a plain dict."""
+        return _build_tree(data, cls._from_node)
+
+    @classmethod
+    def _from_node(cls, data: dict[str, object], children: list[Self]) -> Self:
+        """Build one node from its dict and its already-built children."""
         raw_type = data.get("type", "")
-        trigger_type = TriggerType(str(raw_type))
+        key = str(raw_type)
+        # Unknown values fall through to the constructor for its ValueError.
+        trigger_type = _TRIGGER_TYPE_BY_VALUE.get(key) or TriggerType(key)
 
         raw_params = data.get("params", {})
         params: dict[str, object] = {}
         if isinstance(raw_params, dict):
             params = dict(raw_params)
 
-        raw_children = data.get("children", [])
-        children: list[Trigger] = []
-        if isinstance(raw_children, list):
-            children = [Trigger.from_dict(c) for c in raw_children]  # type: ignore[arg-type]
-
         return cls(
             type=trigger_type,
             params=params,
-            children=children,
+            children=tuple(children),
         )
 
 
@@ -169,7 +216,7 @@ def and_(*triggers: Trigger) -> Trigger:
     """Combine triggers with AND logic."""
     return Trigger(
         type=TriggerType.AND,
-        children=list(triggers),
+        children=triggers,
     )
 
 
@@ -177,7 +224,7 @@ def or_(*triggers: Trigger) -> Trigger:
     """Combine triggers with OR logic."""
     return Trigger(
         type=TriggerType.OR,
-        children=list(triggers),
+        children=triggers,
     )
 
 
@@ -186,7 +233,7 @@ def after(trigger: Trigger, delay_ticks: int) -> Trigger:
     return Trigger(
         type=TriggerType.AFTER,
         params={"delay_ticks": delay_ticks},
-        children=[trigger],
+        children=(trigger,),
     )
 
 
@@ -206,7 +253,10 @@ class ExpectedType(Enum):
     ANY = "any"
 
 
-@dataclass(frozen=True)
+_EXPECTED_TYPE_BY_VALUE: dict[str, ExpectedType] = {t.value: t for t in ExpectedType}
+
+
+@dataclass(frozen=True, slots=True)
 class Expected:
     """An expected outcome describing what should happen after a trigger fires.
 
@@ -215,7 +265,11 @@ class Expected:
     """
     type: ExpectedType
     params: dict[str, object] = field(default_factory=dict)
-    children: list[Expected] = field(default_factory=list)
+    children: tuple[Expected, ...] = ()
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.children, tuple):
+            object.__setattr__(self, "children", tuple(self.children))
 
     def to_dict(self) -> dict[str, object]:
         """Serialize to a plain dict for JSON storage."""
@@ -232,23 +286,24 @@ class Expected:
     @classmethod
     def from_dict(cls, data: dict[str, object]) -> Self:
         """Deserialize from a plain dict."""
+        return _build_tree(data, cls._from_node)
+
+    @classmethod
+    def _from_node(cls, data: dict[str, object], children: list[Self]) -> Self:
+        """Build one node from its dict and its already-built children."""
         raw_type = data.get("type", "")
-        expected_type = ExpectedType(str(raw_type))
+        key = str(raw_type)
+        expected_type = _EXPECTED_TYPE_BY_VALUE.get(key) or ExpectedType(key)
 
         raw_params = data.get("params", {})
         params: dict[str, object] = {}
         if isinstance(raw_params, dict):
             params = dict(raw_params)
 
-        raw_children = data.get("children", [])
-        children: list[Expected] = []
-        if isinstance(raw_children, list):
-            children = [Expected.from_dict(c) for c in raw_children]  # type: ignore[arg-type]
-
         return cls(
             type=expected_type,
             params=params,
-            children=children,
+            children=tuple(children),
         )
 
 
@@ -370,7 +425,7 @@ def all_(*expectations: Expected) -> Expected:
     """Combine expected outcomes with ALL logic (all must pass)."""
     return Expected(
         type=ExpectedType.ALL,
-        children=list(expectations),
+        children=expectations,
     )
 
 
@@ -378,7 +433,7 @@ def any_(*expectations: Expected) -> Expected:
     """Combine expected outcomes with ANY logic (at least one must pass)."""
     return Expected(
         type=ExpectedType.ANY,
-        children=list(expectations),
+        children=expectations,
     )
 
 
@@ -394,11 +449,14 @@ class IntentKind(Enum):
     INVARIANT = "invariant"
 
 
+_INTENT_KIND_BY_VALUE: dict[str, IntentKind] = {k.value: k for k in IntentKind}
+
+
 # ---------------------------------------------------------------------------
 # IntentSpec
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class IntentSpec:
     """A single verification intent.
 
@@ -421,7 +479,7 @@ class IntentSpec:
     entity_role: str | None = None
     must_exist: bool = True
     must_be_visible: bool = True
-    required_components: list[str] = field(default_factory=list)
+    required_components: tuple[str, ...] = ()
 
     # -- Behavior intent fields ---------------------------------------------
     trigger: Trigger | None = None
@@ -437,6 +495,10 @@ class IntentSpec:
     # -- Invariant intent fields --------------------------------------------
     condition: str | None = None
 
+    def __post_init__(self) -> None:
+        if not isinstance(self.required_components, tuple):
+            self.required_components = tuple(self.required_components)
+
     def to_dict(self) -> dict[str, object]:
         """Serialize to a plain dict for JSON storage."""
         result: dict[str, object] = {
@@ -474,58 +536,24 @@ class IntentSpec:
     @classmethod
     def from_dict(cls, data: dict[str, object]) -> Self:
         """Deserialize from a plain dict."""
-        kind = IntentKind(str(data["kind"]))
+        raw_kind = str(data["kind"])
+        kind = _INTENT_KIND_BY_VALUE.get(raw_kind) or IntentKind(raw_kind)
         spec = cls(
             name=str(data["name"]),
             kind=kind,
             description=str(data["description"]),
         )
-
-        if kind == IntentKind.ENTITY:
-            raw_type = data.get("entity_type")
-            spec.entity_type = str(raw_type) if raw_type is not None else None
-            raw_role = data.get("entity_role")
-            spec.entity_role = str(raw_role) if raw_role is not None else None
-            spec.must_exist = bool(data.get("must_exist", True))
-            spec.must_be_visible = bool(data.get("must_be_visible", True))
-            raw_comps = data.get("required_components", [])
-            if isinstance(raw_comps, list):
-                spec.required_components = [str(c) for c in raw_comps]
-
-        elif kind == IntentKind.BEHAVIOR:
-            raw_trigger = data.get("trigger")
-            if isinstance(raw_trigger, dict):
-                spec.trigger = Trigger.from_dict(raw_trigger)
-            raw_expected = data.get("expected")
-            if isinstance(raw_expected, dict):
-                spec.expected = Expected.from_dict(raw_expected)
-            spec.timeout_ticks = int(data.get("timeout_ticks", 600))  # type: ignore[arg-type]
-
-        elif kind == IntentKind.METRIC:
-            raw_ent = data.get("metric_entity")
-            spec.metric_entity = str(raw_ent) if raw_ent is not None else None
-            raw_comp = data.get("metric_component")
-            spec.metric_component = str(raw_comp) if raw_comp is not None else None
-            raw_field = data.get("metric_field")
-            spec.metric_field = str(raw_field) if raw_field is not None else None
-            raw_range = data.get("metric_range")
-            if isinstance(raw_range, list) and len(raw_range) == 2:
-                spec.metric_range = (float(raw_range[0]), float(raw_range[1]))  # type: ignore[arg-type]
-
-        elif kind == IntentKind.INVARIANT:
-            raw_cond = data.get("condition")
-            spec.condition = str(raw_cond) if raw_cond is not None else None
-
+        _INTENT_FIELD_READERS[kind](spec, data)
         return spec
 
     def to_json(self, indent: int | None = 2) -> str:
         """Serialize to a JSON string."""
-        return json.dumps(self.to_dict(), indent=indent)
+        return _dumps(self.to_dict(), indent)
 
     @classmethod
-    def from_json(cls, json_str: str) -> Self:
+    def from_json(cls, json_str: str | bytes) -> Self:
         """Deserialize from a JSON string."""
-        data: dict[str, object] = json.loads(json_str)
+        data = _loads(json_str)
         return cls.from_dict(data)
 
     def validate(self) -> list[str]:
@@ -578,11 +606,61 @@ class IntentSpec:
         return warnings
 
 
+# -- Per-kind from_dict field readers ---------------------------------------
+
+def _read_entity_fields(spec: IntentSpec, data: dict[str, object]) -> None:
+    raw_type = data.get("entity_type")
+    spec.entity_type = str(raw_type) if raw_type is not None else None
+    raw_role = data.get("entity_role")
+    spec.entity_role = str(raw_role) if raw_role is not None else None
+    spec.must_exist = bool(data.get("must_exist", True))
+    spec.must_be_visible = bool(data.get("must_be_visible", True))
+    raw_comps = data.get("required_components", [])
+    if isinstance(raw_comps, list):
+        spec.required_components = tuple(str(c) for c in raw_comps)
+
+
+def _read_behavior_fields(spec: IntentSpec, data: dict[str, object]) -> None:
+    raw_trigger = data.get("trigger")
+    if isinstance(raw_trigger, dict):
+        spec.trigger = Trigger.from_dict(raw_trigger)
+    raw_expected = data.get("expected")
+    if isinstance(raw_expected, dict):
+        spec.expected = Expected.from_dict(raw_expected)
+    spec.timeout_ticks = int(data.get("timeout_ticks", 600))  # type: ignore[arg-type]
+
+
+def _read_metric_fields(spec: IntentSpec, data: dict[str, object]) -> None:
+    raw_ent = data.get("metric_entity")
+    spec.metric_entity = str(raw_ent) if raw_ent is not None else None
+    raw_comp = data.get("metric_component")
+    spec.metric_component = str(raw_comp) if raw_comp is not None else None
+    raw_field = data.get("metric_field")
+    spec.metric_field = str(raw_field) if raw_field is not None else None
+    raw_range = data.get("metric_range")
+    if isinstance(raw_range, list) and len(raw_range) == 2:
+        spec.metric_range = (float(raw_range[0]), float(raw_range[1]))  # type: ignore[arg-type]
+
+
+def _read_invariant_fields(spec: IntentSpec, data: dict[str, object]) -> None:
+    raw_cond = data.get("condition")
+    spec.condition = str(raw_cond) if raw_cond is not None else None
+
+
+# Dispatch table built once at import, replacing an if/elif chain on kind.
+_INTENT_FIELD_READERS: dict[IntentKind, Callable[[IntentSpec, dict[str, object]], None]] = {
+    IntentKind.ENTITY: _read_entity_fields,
+    IntentKind.BEHAVIOR: _read_behavior_fields,
+    IntentKind.METRIC: _read_metric_fields,
+    IntentKind.INVARIANT: _read_invariant_fields,
+}
+
+
 # ---------------------------------------------------------------------------
 # VerificationSuite
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class VerificationSuite:
     """A collection of intent specs forming a complete verification suite.
 
@@ -616,12 +694,12 @@ class VerificationSuite:
 
     def to_json(self, indent: int | None = 2) -> str:
         """Serialize to a JSON string."""
-        return json.dumps(self.to_dict(), indent=indent)
+        return _dumps(self.to_dict(), indent)
 
     @classmethod
-    def from_json(cls, json_str: str) -> Self:
+    def from_json(cls, json_str: str | bytes) -> Self:
         """Deserialize from a JSON string."""
-        data: dict[str, object] = json.loads(json_str)
+        data = _loads(json_str)
         return cls.from_dict(data)
 
     def validate(self) -> list[str]:
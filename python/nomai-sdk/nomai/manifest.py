@@ -19,16 +19,31 @@ from __future__ import annotations
 
 import json
 import logging
+import sys
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass, field
 from typing import Self
 
+from nomai._json import dumps as _dumps
+from nomai._json import dumps_compact as _dumps_compact
+from nomai._json import loads as _loads
+
 logger = logging.getLogger(__name__)
 
+# Low-cardinality string fields (reason tags, component type names,
+# entity tier/type/role) are interned on parse so repeated values share
+# one object across thousands of records.
+_intern = sys.intern
+
 
 # ---------------------------------------------------------------------------
 # Causal reason parsing helpers
 # ---------------------------------------------------------------------------
 
+# Reason tags whose payload is structured JSON rather than a plain string.
+_STRUCTURED_REASONS = frozenset({"CollisionResponse", "StateTransition"})
+
+
 def _parse_reason(raw: object) -> tuple[str, str]:
     """Parse a serde-serialized ``CausalReason`` into ``(reason_type, reason_detail)``.
 
@@ -45,18 +60,47 @@ def _parse_reason(raw: object) -> tuple[str, str]:
     Returns a ``(reason_type, reason_detail)`` tuple.  For compound
     payloads the detail is a JSON-encoded string.
     """
-    if isinstance(raw, dict):
-        for key, value in raw.items():
-            if isinstance(value, str):
-                return (key, value)
-            if isinstance(value, (list, dict)):
-                return (key, json.dumps(value, separators=(",", ":")))
-            # Fallback: stringify
-            return (key, str(value))
+    reason_type, reason_detail, _ = _parse_reason_payload(raw)
+    return (reason_type, reason_detail)
+
+
+def _parse_reason_payload(raw: object) -> tuple[str, str, object]:
+    """Like ``_parse_reason`` but also return the unencoded payload.
+
+    The payload is what ``_reason_to_dict`` would rebuild from
+    ``reason_detail`` (``str``, ``list`` or ``dict``), so callers that
+    keep it never need to ``json.loads`` ``reason_detail`` again.
+    Structured payloads are copied rather than aliasing *raw*.
+    """
+    if isinstance(raw, dict) and raw:
+        # Externally tagged: exactly one key, so no need to iterate items().
+        # The tag comes from a small closed set, so intern it.
+        key = _intern(next(iter(raw)))
+        value = raw[key]
+        if isinstance(value, str):
+            return (key, value, value)
+        if isinstance(value, (list, dict)):
+            detail = _dumps_compact(value)
+            if key in _STRUCTURED_REASONS:
+                return (key, detail, _copy_payload(value))
+            return (key, detail, detail)
+        # Fallback: stringify
+        return (key, str(value), str(value))
     # If it's already a string (shouldn't happen from serde but be safe)
     if isinstance(raw, str):
-        return ("Unknown", raw)
-    return ("Unknown", str(raw))
+        return ("Unknown", raw, raw)
+    return ("Unknown", str(raw), str(raw))
+
+
+def _copy_payload(payload: object) -> object:
+    """Copy a structured reason payload; strings are returned as-is.
+
+    The Rust ``CollisionResponse`` / ``StateTransition`` payloads are flat
+    (entity ids, state names), so a shallow copy is a full copy.
+    """
+    if isinstance(payload, (list, dict)):
+        return payload.copy()
+    return payload
 
 
 def _reason_to_dict(reason_type: str, reason_detail: str) -> dict[str, object]:
@@ -65,9 +109,9 @@ def _reason_to_dict(reason_type: str, reason_detail: str) -> dict[str, object]:
     Reverses ``_parse_reason``.
     """
     # Attempt to parse detail back to structured JSON for compound types.
-    if reason_type in ("CollisionResponse", "StateTransition"):
+    if reason_type in _STRUCTURED_REASONS:
         try:
-            return {reason_type: json.loads(reason_detail)}
+            return {reason_type: _loads(reason_detail)}
         except (json.JSONDecodeError, TypeError):
             pass
     return {reason_type: reason_detail}
@@ -114,6 +158,14 @@ class ComponentChange:
 
     Mirrors ``nomai_manifest::journal::ComponentChange``.
     """
+    # Declared by hand (rather than ``slots=True``) so the cached reason
+    # payload gets a slot without becoming a dataclass field.
+    __slots__ = (
+        "entity_id", "component_type_name", "old_value", "new_value",
+        "changed_by_system", "reason_type", "reason_detail", "command_index",
+        "tick", "_reason_payload",
+    )
+
     entity_id: int
     component_type_name: str
     old_value: object
@@ -124,6 +176,27 @@ class ComponentChange:
     command_index: int
     tick: int
 
+    @property
+    def reason_payload(self) -> object:
+        """The structured ``CausalReason`` payload (``str``, ``list`` or ``dict``).
+
+        Kept from ``from_dict`` when available; otherwise decoded from
+        ``reason_detail`` once and cached. Structured payloads are returned
+        as a fresh copy, so mutating the result never alters the change.
+        """
+        payload = getattr(self, "_reason_payload", None)
+        if payload is None:
+            payload = _reason_to_dict(self.reason_type, self.reason_detail)[self.reason_type]
+            object.__setattr__(self, "_reason_payload", payload)
+        return _copy_payload(payload)
+
+    def __getstate__(self) -> tuple[object, ...]:
+        return tuple(getattr(self, name, None) for name in self.__slots__)
+
+    def __setstate__(self, state: tuple[object, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
     def to_dict(self) -> dict[str, object]:
         """Serialize to a dict matching the Rust serde JSON layout."""
         return {
@@ -132,7 +205,7 @@ class ComponentChange:
             "old_value": self.old_value,
             "new_value": self.new_value,
             "changed_by": self.changed_by_system,
-            "reason": _reason_to_dict(self.reason_type, self.reason_detail),
+            "reason": {self.reason_type: self.reason_payload},
             "command_index": self.command_index,
             "tick": self.tick,
         }
@@ -140,25 +213,49 @@ class ComponentChange:
     @classmethod
     def from_dict(cls, data: dict[str, object]) -> Self:
         """Parse from a dict matching the Rust serde JSON layout."""
-        reason_type, reason_detail = _parse_reason(data.get("reason", {}))
-        return cls(
-            entity_id=_parse_entity_id(data["entity_id"]),
-            component_type_name=str(data["component_type_name"]),
-            old_value=data.get("old_value"),
-            new_value=data.get("new_value"),
-            changed_by_system=_parse_system_id(data["changed_by"]),
-            reason_type=reason_type,
-            reason_detail=reason_detail,
-            command_index=int(data["command_index"]),  # type: ignore[arg-type]
-            tick=int(data["tick"]),  # type: ignore[arg-type]
-        )
+        return cls._list_from_dicts((data,))[0]
+
+    @classmethod
+    def _list_from_dicts(cls, rows: Sequence[dict[str, object]]) -> list[Self]:
+        """Parse a whole ``component_changes`` array in one loop.
+
+        Equivalent to calling ``from_dict`` per row, with the helper and
+        setter lookups hoisted out of the loop since a tick can carry
+        thousands of changes.
+        """
+        parse_reason = _parse_reason_payload
+        parse_entity = _parse_entity_id
+        parse_system = _parse_system_id
+        set_attr = object.__setattr__
+        changes: list[Self] = []
+        append = changes.append
+        for data in rows:
+            reason_type, reason_detail, payload = parse_reason(data.get("reason", {}))
+            # Exact type check: the transparent newtype form is always a plain int.
+            changed_by = data["changed_by"]
+            change = cls(
+                entity_id=parse_entity(data["entity_id"]),
+                component_type_name=_intern(str(data["component_type_name"])),
+                old_value=data.get("old_value"),
+                new_value=data.get("new_value"),
+                changed_by_system=(
+                    changed_by if type(changed_by) is int else parse_system(changed_by)
+                ),
+                reason_type=reason_type,
+                reason_detail=reason_detail,
+                command_index=int(data["command_index"]),  # type: ignore[arg-type]
+                tick=int(data["tick"]),  # type: ignore[arg-type]
+            )
+            set_attr(change, "_reason_payload", payload)
+            append(change)
+        return changes
 
 
 # ---------------------------------------------------------------------------
 # GameEvent
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameEvent:
     """A game event with involved entities and causality.
 
@@ -191,11 +288,14 @@ class GameEvent:
         entities: list[int] = []
         if isinstance(raw_entities, list):
             entities = [_parse_entity_id(e) for e in raw_entities]
+        caused_by = data["caused_by"]
         return cls(
-            event_type=str(data["event_type"]),
+            event_type=_intern(str(data["event_type"])),
             description=str(data["description"]),
             involved_entities=entities,
-            caused_by_system=_parse_system_id(data["caused_by"]),
+            caused_by_system=(
+                caused_by if type(caused_by) is int else _parse_system_id(caused_by)
+            ),
             reason_type=reason_type,
             reason_detail=reason_detail,
             tick=int(data["tick"]),  # type: ignore[arg-type]
@@ -206,7 +306,7 @@ class GameEvent:
 # Aggregates
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Aggregates:
     """Aggregate statistics computed at end of tick.
 
@@ -253,7 +353,7 @@ class Aggregates:
 # CausalStep
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CausalStep:
     """A single step in a causal chain.
 
@@ -294,7 +394,7 @@ class CausalStep:
 # CausalChain
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CausalChain:
     """A causal chain tracing a component change back to its root cause.
 
@@ -330,7 +430,7 @@ class CausalChain:
 # DiagnosticEntry
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiagnosticEntry:
     """A diagnostic message from the engine.
 
@@ -373,7 +473,7 @@ class DiagnosticEntry:
 # EntityEntry
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EntityEntry:
     """A single entity entry in the entity index.
 
@@ -408,9 +508,9 @@ class EntityEntry:
             despawned = int(raw_despawn)  # type: ignore[arg-type]
         return cls(
             entity_id=_parse_entity_id(data["entity_id"]),
-            tier=str(data["tier"]),
-            entity_type=str(data["entity_type"]),
-            role=str(data["role"]),
+            tier=_intern(str(data["tier"])),
+            entity_type=_intern(str(data["entity_type"])),
+            role=_intern(str(data["role"])),
             alive=bool(data["alive"]),
             spawned_at_tick=int(data["spawned_at_tick"]),  # type: ignore[arg-type]
             despawned_at_tick=despawned,
@@ -421,8 +521,17 @@ class EntityEntry:
 # TickManifest
 # ---------------------------------------------------------------------------
 
-@dataclass
-class TickManifest:
+class _TickManifestIndexes:
+    """Slots for the lazy per-type indexes of :class:`TickManifest`.
+
+    Declared on a base class so they are not dataclass fields: they stay
+    out of ``fields()``, ``asdict()``, equality and pickles.
+    """
+    __slots__ = ("_changes_index", "_events_index")
+
+
+@dataclass(slots=True)
+class TickManifest(_TickManifestIndexes):
     """The complete manifest for a single simulation tick.
 
     Mirrors ``nomai_manifest::manifest::TickManifest``.
@@ -439,6 +548,47 @@ class TickManifest:
     commands_succeeded: int
     diagnostics: list[DiagnosticEntry] = field(default_factory=list)
 
+    def changes_for(self, component_type_name: str) -> Sequence[ComponentChange]:
+        """Component changes of one component type, in manifest order.
+
+        The per-type index is built in a single pass and reused while
+        ``component_changes`` still holds the same items; any mutation of
+        the list rebuilds it on the next call.
+        """
+        changes = tuple(self.component_changes)
+        cached = getattr(self, "_changes_index", None)
+        if cached is None or cached[0] != changes:
+            index: dict[str, list[ComponentChange]] = {}
+            for change in changes:
+                index.setdefault(change.component_type_name, []).append(change)
+            cached = (changes, index)
+            self._changes_index = cached
+        return cached[1].get(component_type_name, ())
+
+    def events_for(self, event_type: str) -> Sequence[GameEvent]:
+        """Events of one event type, in manifest order.
+
+        Indexed lazily like :meth:`changes_for`.
+        """
+        events = tuple(self.events)
+        cached = getattr(self, "_events_index", None)
+        if cached is None or cached[0] != events:
+            index: dict[str, list[GameEvent]] = {}
+            for event in events:
+                index.setdefault(event.event_type, []).append(event)
+            cached = (events, index)
+            self._events_index = cached
+        return cached[1].get(event_type, ())
+
+    def __getstate__(self) -> tuple[object, ...]:
+        # ``__slots__`` here lists the dataclass fields only, so the
+        # indexes are left out and rebuilt on demand after unpickling.
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: tuple[object, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
     def to_dict(self) -> dict[str, object]:
         """Serialize to a dict matching the Rust serde JSON layout."""
         return {
@@ -457,7 +607,7 @@ class TickManifest:
 
     def to_json(self, indent: int | None = 2) -> str:
         """Serialize to a JSON string."""
-        return json.dumps(self.to_dict(), indent=indent)
+        return _dumps(self.to_dict(), indent)
 
     @classmethod
     def from_dict(cls, data: dict[str, object]) -> Self:
@@ -471,15 +621,16 @@ class TickManifest:
 
         spawns: list[int] = []
         if isinstance(raw_spawns, list):
-            spawns = [_parse_entity_id(e) for e in raw_spawns]
+            # Plain ints (the serde newtype form) skip the parser call.
+            spawns = [e if type(e) is int else _parse_entity_id(e) for e in raw_spawns]
 
         despawns: list[int] = []
         if isinstance(raw_despawns, list):
-            despawns = [_parse_entity_id(e) for e in raw_despawns]
+            despawns = [e if type(e) is int else _parse_entity_id(e) for e in raw_despawns]
 
         changes: list[ComponentChange] = []
         if isinstance(raw_changes, list):
-            changes = [ComponentChange.from_dict(c) for c in raw_changes]  # type: ignore[arg-type]
+            changes = ComponentChange._list_from_dicts(raw_changes)  # type: ignore[arg-type]
 
         events: list[GameEvent] = []
         if isinstance(raw_events, list):
@@ -517,10 +668,25 @@ class TickManifest:
         )
 
     @classmethod
-    def from_json(cls, data: dict[str, object]) -> Self:
-        """Parse from a dict produced by Rust ``serde_json`` output.
+    def from_json(cls, data: dict[str, object] | str | bytes) -> Self:
+        """Parse Rust ``serde_json`` output.
 
-        This is an alias for ``from_dict`` provided for clarity at call
-        sites that receive raw JSON-deserialized dicts.
+        Accepts either the raw JSON text (``str`` or ``bytes``, decoded
+        in one pass) or an already-deserialized dict, in which case this
+        is an alias for ``from_dict``.
         """
+        if isinstance(data, (str, bytes)):
+            data = _loads(data)
         return cls.from_dict(data)
+
+    @classmethod
+    def from_ndjson_stream(cls, fp: Iterable[str] | Iterable[bytes]) -> Iterator[Self]:
+        """Lazily parse newline-delimited JSON manifests, one per line.
+
+        *fp* is any iterable of lines -- typically a text or binary file
+        object of an append-only tick log. Blank lines are skipped. Only
+        one tick is held in memory at a time.
+        """
+        for line in fp:
+            if line.strip():
+                yield cls.from_json(line)
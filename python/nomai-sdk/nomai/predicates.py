@@ -0,0 +1,68 @@
+"""Structural ``run_until`` predicates the native engine evaluates itself.
+
+``NomaiEngine.run_until`` accepts any ``Callable[[TickManifest], bool]``,
+but an opaque Python callable forces one FFI round-trip and one manifest
+conversion per tick just to decide whether to stop. The predicates here
+describe common stop conditions as data, so the engine can run the whole
+loop in Rust and cross back into Python once.
+
+Each predicate is also a plain callable, so it behaves identically when
+evaluated in Python (e.g. against recorded manifests).
+
+Usage::
+
+    from nomai.predicates import TickAtLeast
+    manifests = engine.run_until(TickAtLeast(100))
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from nomai.manifest import TickManifest
+
+
+@dataclass(frozen=True, slots=True)
+class TickAtLeast:
+    """Stop once the manifest tick number reaches *tick*."""
+    tick: int
+
+    def __call__(self, manifest: TickManifest) -> bool:
+        return manifest.tick >= self.tick
+
+    def native_args(self) -> tuple[str, int]:
+        """The ``(predicate, threshold)`` pair understood by the engine."""
+        return "tick_at_least", self.tick
+
+
+@dataclass(frozen=True, slots=True)
+class EntityCountAtLeast:
+    """Stop once the total entity count is at least *count*."""
+    count: int
+
+    def __call__(self, manifest: TickManifest) -> bool:
+        return manifest.aggregates.total_entity_count >= self.count
+
+    def native_args(self) -> tuple[str, int]:
+        """The ``(predicate, threshold)`` pair understood by the engine."""
+        return "entity_count_at_least", self.count
+
+
+@dataclass(frozen=True, slots=True)
+class EntityCountAtMost:
+    """Stop once the total entity count has dropped to *count* or below."""
+    count: int
+
+    def __call__(self, manifest: TickManifest) -> bool:
+        return manifest.aggregates.total_entity_count <= self.count
+
+    def native_args(self) -> tuple[str, int]:
+        """The ``(predicate, threshold)`` pair understood by the engine."""
+        return "entity_count_at_most", self.count
+
+
+ManifestPredicate = TickAtLeast | EntityCountAtLeast | EntityCountAtMost
+"""Union of the predicates ``run_until`` can evaluate natively."""
+
+NATIVE_PREDICATES = (TickAtLeast, EntityCountAtLeast, EntityCountAtMost)
+"""The predicate classes, for ``isinstance`` dispatch."""
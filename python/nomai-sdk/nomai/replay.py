@@ -11,9 +11,13 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Self
 
+from nomai._json import dumps as _dumps
+from nomai._json import loads as _loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,7 +26,7 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EngineSnapshot:
     """A captured engine state snapshot.
 
@@ -55,7 +59,7 @@ class EngineSnapshot:
             ValueError: If the JSON is missing required fields or is not valid JSON.
         """
         try:
-            data = json.loads(json_str)
+            data = _loads(json_str)
         except json.JSONDecodeError as exc:
             raise ValueError(f"invalid snapshot JSON: {exc}") from exc
         try:
@@ -82,7 +86,7 @@ class EngineSnapshot:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReplayDivergence:
     """Details about a determinism failure during replay.
 
@@ -119,7 +123,7 @@ class ReplayDivergence:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReplayResult:
     """The outcome of replaying a ``ReplayLog``.
 
@@ -153,7 +157,7 @@ class ReplayResult:
         Args:
             json_str: The JSON string produced by ``NomaiEngine.replay_log()``.
         """
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(_loads(json_str))
 
     def to_dict(self) -> dict[str, object]:
         """Serialize to a dict matching the Rust serde JSON layout."""
@@ -172,7 +176,7 @@ class ReplayResult:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReplayLog:
     """A recorded replay log (opaque JSON blob for the engine).
 
@@ -182,28 +186,65 @@ class ReplayLog:
 
     Fields:
         total_ticks: Number of ticks recorded in the log.
-        raw_json: The full JSON string for round-tripping back to the engine.
+        raw_json: The full JSON (``str`` or UTF-8 ``bytes``) for round-tripping
+            back to the engine, which borrows either form without copying.
     """
 
     total_ticks: int
-    raw_json: str
+    raw_json: str | bytes
 
     @classmethod
-    def from_json(cls, json_str: str) -> Self:
-        """Create from a JSON string.
+    def from_json(cls, json_str: str | bytes) -> Self:
+        """Create from a JSON string or UTF-8 bytes.
+
+        Bytes (e.g. a log read with ``Path.read_bytes()``) are kept as-is
+        and handed to the engine without decoding.
 
         Args:
-            json_str: A JSON string representing a ``ReplayLog``.
+            json_str: JSON representing a ``ReplayLog``.
 
         Returns:
             A typed ``ReplayLog`` instance.
         """
-        data = json.loads(json_str)
+        data = _loads(json_str)
         return cls(
             total_ticks=int(data["total_ticks"]),
             raw_json=json_str,
         )
 
+    @classmethod
+    def from_parts(
+        cls,
+        initial_snapshot: EngineSnapshot,
+        total_ticks: int,
+        entries: Iterable[dict[str, object]] = (),
+        gameplay_module_hash: str | None = None,
+    ) -> Self:
+        """Build a log around an already-captured snapshot.
+
+        The snapshot's ``raw_json`` is spliced into the log verbatim, so the
+        (potentially large) world state is neither re-parsed nor
+        re-serialized. Only the small envelope fields are encoded.
+
+        Args:
+            initial_snapshot: Snapshot the replay starts from.
+            total_ticks: Number of ticks to replay.
+            entries: ``Input`` / ``Checkpoint`` entries in the Rust serde
+                layout, e.g. ``{"Checkpoint": {"tick": 1, "state_hash": h}}``.
+            gameplay_module_hash: Hash of the WASM gameplay module, if any.
+
+        Returns:
+            A typed ``ReplayLog`` instance.
+        """
+        raw_json = (
+            '{"initial_snapshot":' + initial_snapshot.raw_json
+            + ',"gameplay_module_hash":' + _dumps(gameplay_module_hash)
+            + ',"total_ticks":' + _dumps(total_ticks)
+            + ',"entries":' + _dumps(list(entries))
+            + "}"
+        )
+        return cls(total_ticks=total_ticks, raw_json=raw_json)
+
     def to_dict(self) -> dict[str, object]:
         """Serialize to a summary dict (excludes raw_json for readability)."""
         return {
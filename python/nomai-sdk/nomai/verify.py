@@ -12,7 +12,6 @@ All output types are JSON-serializable for regression test storage.
 
 from __future__ import annotations
 
-import json
 import logging
 import time
 from dataclasses import dataclass, field
@@ -22,6 +21,8 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from nomai.physics_sanity import PhysicsEntityInfo
 
+from nomai._json import dumps as _dumps
+from nomai._json import loads as _loads
 from nomai.intents import (
     Expected,
     ExpectedType,
@@ -258,12 +259,12 @@ class VerificationReport:
 
     def to_json(self, indent: int | None = 2) -> str:
         """Serialize to a JSON string."""
-        return json.dumps(self.to_dict(), indent=indent)
+        return _dumps(self.to_dict(), indent=indent)
 
     @classmethod
-    def from_json(cls, json_str: str) -> VerificationReport:
-        """Deserialize from a JSON string."""
-        data: dict[str, object] = json.loads(json_str)
+    def from_json(cls, json_str: str | bytes) -> VerificationReport:
+        """Deserialize from a JSON string or UTF-8 bytes."""
+        data = _loads(json_str)
         return cls.from_dict(data)
 
     def suggested_fixes(self) -> list[SuggestedFix]:
@@ -414,7 +415,7 @@ class RegressionTest:
         """Save this regression test to a JSON file."""
         p = Path(path)
         p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        p.write_text(_dumps(self.to_dict(), indent=2), encoding="utf-8")
 
     @classmethod
     def load(cls, path: str | Path) -> RegressionTest:
@@ -423,7 +424,7 @@ class RegressionTest:
         if not p.exists():
             msg = f"Regression test file not found: {p}"
             raise FileNotFoundError(msg)
-        data: dict[str, object] = json.loads(p.read_text(encoding="utf-8"))
+        data = _loads(p.read_bytes())
         return cls.from_dict(data)
 
 
@@ -431,6 +432,7 @@ class RegressionTest:
 # VerificationEngine
 # ---------------------------------------------------------------------------
 
+@dataclass(frozen=True)
 class VerificationEngine:
     """Engine that verifies intent specs against tick manifest data.
 
@@ -438,6 +440,9 @@ class VerificationEngine:
     :class:`VerificationSuite` against a sequence of tick manifests and
     produces a structured :class:`VerificationReport`.
 
+    The engine is frozen and holds no state, so a single instance can be
+    shared across any number of ``verify`` calls.
+
     Usage::
 
         engine = VerificationEngine()
@@ -470,27 +475,12 @@ class VerificationEngine:
             A :class:`VerificationReport` with per-intent results.
         """
         start_time = time.monotonic()
-        results: list[IntentResult] = []
 
-        if entity_index is None:
-            entity_index = {}
-
-        for intent in suite.intents:
-            if intent.kind == IntentKind.ENTITY:
-                result = self._verify_entity(intent, manifests, entity_index)
-            elif intent.kind == IntentKind.BEHAVIOR:
-                result = self._verify_behavior(intent, manifests)
-            elif intent.kind == IntentKind.METRIC:
-                result = self._verify_metric(intent, manifests)
-            elif intent.kind == IntentKind.INVARIANT:
-                result = self._verify_invariant(intent, manifests)
-            else:
-                result = IntentResult(
-                    intent_name=intent.name,
-                    passed=False,
-                    failure_reason=f"Unknown intent kind: {intent.kind}",
-                )
-            results.append(result)
+        index = entity_index if entity_index is not None else {}
+
+        results = [
+            self._verify_intent(intent, manifests, index) for intent in suite.intents
+        ]
 
         # Run physics sanity checks if registry provided
         if physics_registry is not None:
@@ -526,6 +516,27 @@ class VerificationEngine:
 
         return report
 
+    def _verify_intent(
+        self,
+        intent: IntentSpec,
+        manifests: list[TickManifest],
+        entity_index: dict[str, dict[str, str]],
+    ) -> IntentResult:
+        """Dispatch a single intent to the checker for its kind."""
+        if intent.kind == IntentKind.ENTITY:
+            return self._verify_entity(intent, manifests, entity_index)
+        if intent.kind == IntentKind.BEHAVIOR:
+            return self._verify_behavior(intent, manifests)
+        if intent.kind == IntentKind.METRIC:
+            return self._verify_metric(intent, manifests)
+        if intent.kind == IntentKind.INVARIANT:
+            return self._verify_invariant(intent, manifests)
+        return IntentResult(
+            intent_name=intent.name,
+            passed=False,
+            failure_reason=f"Unknown intent kind: {intent.kind}",
+        )
+
     # -- Entity verification ------------------------------------------------
 
     def _verify_entity(
@@ -568,15 +579,14 @@ class VerificationEngine:
 
         # Fallback: scan manifests for identity component changes with matching role
         for manifest in manifests:
-            for change in manifest.component_changes:
-                if change.component_type_name == "identity":
-                    new_val = change.new_value
-                    if isinstance(new_val, dict) and new_val.get("role") == role:
-                        return IntentResult(
-                            intent_name=intent.name,
-                            passed=True,
-                            evidence=[change],
-                        )
+            for change in manifest.changes_for("identity"):
+                new_val = change.new_value
+                if isinstance(new_val, dict) and new_val.get("role") == role:
+                    return IntentResult(
+                        intent_name=intent.name,
+                        passed=True,
+                        evidence=[change],
+                    )
 
         return IntentResult(
             intent_name=intent.name,
@@ -750,10 +760,7 @@ class VerificationEngine:
         field_name = intent.metric_field or ""
 
         for manifest in manifests:
-            for change in manifest.component_changes:
-                if change.component_type_name != component:
-                    continue
-
+            for change in manifest.changes_for(component):
                 # Extract the field value from new_value
                 value = self._extract_field_value(change.new_value, field_name)
                 if value is None:
@@ -999,9 +1006,7 @@ class VerificationEngine:
             )
 
         for manifest in manifests:
-            for change in manifest.component_changes:
-                if change.component_type_name != component:
-                    continue
+            for change in manifest.changes_for(component):
                 if not self._matches_entity(change, entity_name):
                     continue
                 value = self._extract_field_value(change.new_value, field_name)
@@ -1041,16 +1046,15 @@ class VerificationEngine:
         if trigger.type == TriggerType.EVENT_OCCURRED:
             event_type = str(trigger.params.get("event_type", ""))
             involving = trigger.params.get("involving")
-            for event in manifest.events:
-                if event.event_type == event_type:
-                    if involving is None:
+            for event in manifest.events_for(event_type):
+                if involving is None:
+                    return True
+                if isinstance(involving, list):
+                    detail = event.reason_detail.lower()
+                    desc = event.description.lower()
+                    search_text = f"{detail} {desc}"
+                    if all(name.lower() in search_text for name in involving):
                         return True
-                    if isinstance(involving, list):
-                        detail = event.reason_detail.lower()
-                        desc = event.description.lower()
-                        search_text = f"{detail} {desc}"
-                        if all(name.lower() in search_text for name in involving):
-                            return True
             return False
 
         if trigger.type == TriggerType.COMPONENT_CONDITION:
@@ -1059,9 +1063,7 @@ class VerificationEngine:
             op = str(trigger.params.get("comparison", ""))
             expected_value = trigger.params.get("value")
 
-            for change in manifest.component_changes:
-                if change.component_type_name != component:
-                    continue
+            for change in manifest.changes_for(component):
                 value = self._extract_field_value(change.new_value, field_name)
                 if value is None:
                     continue
@@ -1085,11 +1087,10 @@ class VerificationEngine:
         if trigger.type == TriggerType.COLLISION:
             entity_a = str(trigger.params.get("entity_a", ""))
             entity_b = str(trigger.params.get("entity_b", ""))
-            for event in manifest.events:
-                if event.event_type == "collision":
-                    detail = event.reason_detail.lower()
-                    if entity_a.lower() in detail and entity_b.lower() in detail:
-                        return True
+            for event in manifest.events_for("collision"):
+                detail = event.reason_detail.lower()
+                if entity_a.lower() in detail and entity_b.lower() in detail:
+                    return True
             return False
 
         if trigger.type == TriggerType.AND:
@@ -1135,9 +1136,7 @@ class VerificationEngine:
             expected_value = expected.params.get("expected_value")
             entity_name = expected.params.get("entity")
 
-            for change in manifest.component_changes:
-                if change.component_type_name != component:
-                    continue
+            for change in manifest.changes_for(component):
                 # Filter by entity name if specified
                 if entity_name and not self._matches_entity(change, str(entity_name)):
                     continue
@@ -1203,10 +1202,7 @@ class VerificationEngine:
 
         if expected.type == ExpectedType.EVENT_EMITTED:
             event_type = str(expected.params.get("event_type", ""))
-            for event in manifest.events:
-                if event.event_type == event_type:
-                    return True
-            return False
+            return bool(manifest.events_for(event_type))
 
         if expected.type == ExpectedType.AGGREGATE_CHANGED:
             entity_type = str(expected.params.get("entity_type", ""))
@@ -1220,10 +1216,9 @@ class VerificationEngine:
         if expected.type == ExpectedType.IN_STATE:
             component = str(expected.params.get("component", ""))
             state = str(expected.params.get("state", ""))
-            for change in manifest.component_changes:
-                if change.component_type_name == component:
-                    if change.new_value == state:
-                        return True
+            for change in manifest.changes_for(component):
+                if change.new_value == state:
+                    return True
             return False
 
         if expected.type == ExpectedType.VALUE_RELATION:
@@ -1233,9 +1228,7 @@ class VerificationEngine:
             relation = str(expected.params.get("relation", ""))
             tolerance = float(expected.params.get("tolerance", 0.1))  # type: ignore[arg-type]
 
-            for change in manifest.component_changes:
-                if change.component_type_name != component:
-                    continue
+            for change in manifest.changes_for(component):
                 # Filter by entity name if specified
                 if entity_name and not self._matches_entity(change, str(entity_name)):
                     continue
@@ -0,0 +1,86 @@
+"""Shared pytest fixtures for the nomai SDK tests."""
+
+from __future__ import annotations
+
+import pytest
+
+from nomai.intents import (
+    IntentKind,
+    IntentSpec,
+    VerificationSuite,
+    collision,
+    component_changed,
+)
+
+
+# ---------------------------------------------------------------------------
+# Intent DSL fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="session")
+def dsl_breakout_suite() -> VerificationSuite:
+    """A 5-intent breakout suite written with the intent DSL.
+
+    Built once per session and shared, so tests must not mutate it. Not
+    to be confused with :func:`nomai.breakout_intents.build_breakout_suite`.
+    """
+    return VerificationSuite(
+        name="breakout_verification",
+        description="Complete verification suite for the breakout clone",
+        intents=[
+            # Entity intents
+            IntentSpec(
+                name="paddle_exists",
+                kind=IntentKind.ENTITY,
+                description="Paddle entity must exist",
+                entity_type="character",
+                entity_role="paddle",
+                required_components=("position", "size"),
+            ),
+            IntentSpec(
+                name="ball_exists",
+                kind=IntentKind.ENTITY,
+                description="Ball entity must exist",
+                entity_type="projectile",
+                entity_role="ball",
+                required_components=("position", "velocity"),
+            ),
+            # Behavior intent
+            IntentSpec(
+                name="ball_bounces_off_paddle",
+                kind=IntentKind.BEHAVIOR,
+                description="Ball bounces when hitting paddle",
+                trigger=collision("ball", "paddle"),
+                expected=component_changed("ball", "position", field_name="y"),
+                timeout_ticks=120,
+            ),
+            # Metric intent
+            IntentSpec(
+                name="ball_speed_x_bounded",
+                kind=IntentKind.METRIC,
+                description="Ball speed.x in [-10, 10]",
+                metric_entity="ball",
+                metric_component="velocity",
+                metric_field="dx",
+                metric_range=(-10.0, 10.0),
+            ),
+            # Invariant intent
+            IntentSpec(
+                name="ball_in_bounds",
+                kind=IntentKind.INVARIANT,
+                description="Ball stays in game bounds",
+                condition=(
+                    "entity('ball').position.x >= 0 and "
+                    "entity('ball').position.x <= 800 and "
+                    "entity('ball').position.y >= 0 and "
+                    "entity('ball').position.y <= 600"
+                ),
+            ),
+        ],
+    )
+
+
+@pytest.fixture(scope="session")
+def dsl_breakout_suite_json(dsl_breakout_suite: VerificationSuite) -> str:
+    """``dsl_breakout_suite`` serialized once per session."""
+    return dsl_breakout_suite.to_json()
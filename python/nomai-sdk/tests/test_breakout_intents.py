@@ -20,6 +20,12 @@ class TestBuildBreakoutSuite:
         suite = build_breakout_suite()
         assert isinstance(suite, VerificationSuite)
 
+    def test_suite_is_fresh_per_call(self) -> None:
+        """Each call returns an independent suite, so mutations do not leak."""
+        first = build_breakout_suite()
+        first.intents.clear()
+        assert len(build_breakout_suite().intents) == 13
+
     def test_suite_name_and_description(self) -> None:
         """Suite has expected name and non-empty description."""
         suite = build_breakout_suite()
@@ -2,13 +2,22 @@
 
 Tests validate construction, to_dict/from_dict round-trips, JSON
 serialization, and a complete breakout spec built from the GDD types.
+
+Assertions here compare plain frozen dataclasses, so pytest's assertion
+rewriting is disabled for this module (failures still raise AssertionError):
+
+PYTEST_DONT_REWRITE
 """
 
 from __future__ import annotations
 
 import json
+from collections.abc import Callable
+from dataclasses import FrozenInstanceError, replace
 
 import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
 
 from nomai.gdd import (
     BoundsSpec,
@@ -29,6 +38,16 @@ from nomai.intents import IntentKind, VerificationSuite
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Shared required_components tuples.
+_POS_SIZE_VEL = ("position", "size", "velocity")
+_POS_VEL = ("position", "velocity")
+_POS = ("position",)
+
+# Frozen value objects shared by the CompletenessChecker scenarios.
+_PLAY_800X600 = PlayAreaSpec(width=800.0, height=600.0)
+_FULL_BOUNDS = BoundsSpec(x_min=0, x_max=800, y_min=0, y_max=600)
+
+
 def _make_breakout_spec() -> GameDesignSpec:
     """Build a complete breakout GDD spec for testing.
 
@@ -49,7 +68,7 @@ def _make_breakout_spec() -> GameDesignSpec:
                 body_type="kinematic",
                 bounds=BoundsSpec(y_min=550.0, y_max=550.0),
                 speed_max=8.0,
-                required_components=("position", "size", "velocity"),
+                required_components=_POS_SIZE_VEL,
             ),
             EntitySpec(
                 name="ball",
@@ -58,7 +77,7 @@ def _make_breakout_spec() -> GameDesignSpec:
                 body_type="dynamic",
                 bounds=BoundsSpec(x_min=0.0, x_max=800.0, y_min=0.0, y_max=600.0),
                 speed_max=10.0,
-                required_components=("position", "velocity"),
+                required_components=_POS_VEL,
             ),
             EntitySpec(
                 name="brick",
@@ -119,6 +138,129 @@ def _make_breakout_spec() -> GameDesignSpec:
     )
 
 
+def _by_category(
+    questions: list[ClarificationQuestion],
+) -> dict[str, list[ClarificationQuestion]]:
+    """Group clarification questions by category in a single pass."""
+    grouped: dict[str, list[ClarificationQuestion]] = {}
+    for q in questions:
+        grouped.setdefault(q.category, []).append(q)
+    return grouped
+
+
+# ---------------------------------------------------------------------------
+# Round-trips (dict and JSON) for every leaf spec type
+# ---------------------------------------------------------------------------
+
+_DICT_ROUNDTRIP_CASES = [
+    BoundsSpec(x_min=0.0, x_max=800.0, y_min=0.0, y_max=600.0),
+    PlayAreaSpec(width=800.0, height=600.0),
+    EntitySpec(
+        name="paddle",
+        entity_type="character",
+        role="paddle",
+        body_type="kinematic",
+        bounds=BoundsSpec(y_min=550.0, y_max=550.0),
+        speed_max=8.0,
+        required_components=_POS_SIZE_VEL,
+    ),
+    InteractionSpec(
+        entity_a="ball",
+        entity_b="paddle",
+        behavior="bounce",
+        description="Ball bounces off paddle",
+    ),
+    InvariantSpec(
+        name="ball_in_bounds",
+        entity="ball",
+        component="position",
+        field="x",
+        condition=">= 0 and <= 800",
+        description="Ball x-position within play area",
+    ),
+    DegenerateStateSpec(
+        name="ball_stuck",
+        entity="ball",
+        component="velocity",
+        field="dy",
+        condition="== 0",
+        description="Ball y-velocity should never be zero",
+    ),
+    ClarificationQuestion(
+        question="What happens when the ball hits the top wall?",
+        category="physics",
+        severity="medium",
+        context="No wall bounce behavior specified for top boundary",
+    ),
+]
+
+_ROUNDTRIP_IDS = [
+    "bounds",
+    "play_area",
+    "entity",
+    "interaction",
+    "invariant",
+    "degenerate_state",
+    "clarification_question",
+]
+
+
+@pytest.mark.parametrize("original", _DICT_ROUNDTRIP_CASES, ids=_ROUNDTRIP_IDS)
+def test_dict_roundtrip(original: object) -> None:
+    """Each leaf spec type survives to_dict/from_dict round-trip."""
+    restored = type(original).from_dict(original.to_dict())  # type: ignore[attr-defined]
+    assert restored == original
+
+
+_finite = st.floats(allow_nan=False, allow_infinity=False)
+_opt_finite = st.none() | _finite
+
+_bounds_strategy = st.builds(
+    BoundsSpec, x_min=_opt_finite, x_max=_opt_finite, y_min=_opt_finite, y_max=_opt_finite,
+)
+
+_LEAF_SPEC_STRATEGY = st.one_of(
+    _bounds_strategy,
+    st.builds(PlayAreaSpec, width=_finite, height=_finite),
+    st.builds(
+        EntitySpec,
+        name=st.text(),
+        entity_type=st.text(),
+        role=st.text(),
+        body_type=st.none() | st.text(),
+        bounds=st.none() | _bounds_strategy,
+        speed_max=_opt_finite,
+        required_components=st.lists(st.text(), max_size=4).map(tuple),
+    ),
+    st.builds(
+        InteractionSpec,
+        entity_a=st.text(), entity_b=st.text(), behavior=st.text(), description=st.text(),
+    ),
+    st.builds(
+        InvariantSpec,
+        name=st.text(), entity=st.text(), component=st.text(),
+        field=st.text(), condition=st.text(), description=st.text(),
+    ),
+    st.builds(
+        DegenerateStateSpec,
+        name=st.text(), entity=st.text(), component=st.text(),
+        field=st.text(), condition=st.text(), description=st.text(),
+    ),
+    st.builds(
+        ClarificationQuestion,
+        question=st.text(), category=st.text(), severity=st.text(), context=st.text(),
+    ),
+)
+
+
+@settings(max_examples=50, deadline=None)
+@given(original=_LEAF_SPEC_STRATEGY)
+def test_json_roundtrip(original: object) -> None:
+    """Any leaf spec value survives full JSON serialize/deserialize."""
+    restored = type(original).from_json(original.to_json())  # type: ignore[attr-defined]
+    assert restored == original
+
+
 # ---------------------------------------------------------------------------
 # BoundsSpec
 # ---------------------------------------------------------------------------
@@ -126,13 +268,6 @@ def _make_breakout_spec() -> GameDesignSpec:
 class TestBoundsSpec:
     """Tests for BoundsSpec construction and round-trip."""
 
-    def test_roundtrip(self) -> None:
-        """BoundsSpec survives to_dict/from_dict round-trip."""
-        original = BoundsSpec(x_min=0.0, x_max=800.0, y_min=0.0, y_max=600.0)
-        d = original.to_dict()
-        restored = BoundsSpec.from_dict(d)
-        assert restored == original
-
     def test_partial_bounds(self) -> None:
         """BoundsSpec with only some fields set round-trips correctly."""
         original = BoundsSpec(y_min=550.0, y_max=550.0)
@@ -142,40 +277,13 @@ class TestBoundsSpec:
         assert restored.x_min is None
         assert restored.x_max is None
 
-    def test_json_roundtrip(self) -> None:
-        """BoundsSpec survives full JSON serialize/deserialize."""
-        original = BoundsSpec(x_min=10.0, x_max=790.0)
-        json_str = original.to_json()
-        restored = BoundsSpec.from_json(json_str)
-        assert restored == original
-
     def test_frozen(self) -> None:
         """BoundsSpec is immutable."""
         b = BoundsSpec(x_min=0.0)
-        with pytest.raises(AttributeError):
+        with pytest.raises(FrozenInstanceError):
             b.x_min = 5.0  # type: ignore[misc]
 
 
-# ---------------------------------------------------------------------------
-# PlayAreaSpec
-# ---------------------------------------------------------------------------
-
-class TestPlayAreaSpec:
-    """Tests for PlayAreaSpec construction and round-trip."""
-
-    def test_roundtrip(self) -> None:
-        original = PlayAreaSpec(width=800.0, height=600.0)
-        d = original.to_dict()
-        restored = PlayAreaSpec.from_dict(d)
-        assert restored == original
-
-    def test_json_roundtrip(self) -> None:
-        original = PlayAreaSpec(width=1024.0, height=768.0)
-        json_str = original.to_json()
-        restored = PlayAreaSpec.from_json(json_str)
-        assert restored == original
-
-
 # ---------------------------------------------------------------------------
 # EntitySpec
 # ---------------------------------------------------------------------------
@@ -183,20 +291,6 @@ class TestPlayAreaSpec:
 class TestEntitySpec:
     """Tests for EntitySpec construction and round-trip."""
 
-    def test_roundtrip(self) -> None:
-        original = EntitySpec(
-            name="paddle",
-            entity_type="character",
-            role="paddle",
-            body_type="kinematic",
-            bounds=BoundsSpec(y_min=550.0, y_max=550.0),
-            speed_max=8.0,
-            required_components=("position", "size", "velocity"),
-        )
-        d = original.to_dict()
-        restored = EntitySpec.from_dict(d)
-        assert restored == original
-
     def test_minimal_entity(self) -> None:
         """EntitySpec with no optional fields round-trips correctly."""
         original = EntitySpec(
@@ -212,22 +306,9 @@ class TestEntitySpec:
         assert restored.speed_max is None
         assert restored.required_components == ()
 
-    def test_json_roundtrip(self) -> None:
-        original = EntitySpec(
-            name="ball",
-            entity_type="projectile",
-            role="ball",
-            body_type="dynamic",
-            speed_max=10.0,
-            required_components=("position", "velocity"),
-        )
-        json_str = original.to_json()
-        restored = EntitySpec.from_json(json_str)
-        assert restored == original
-
     def test_frozen(self) -> None:
         e = EntitySpec(name="x", entity_type="y", role="z")
-        with pytest.raises(AttributeError):
+        with pytest.raises(FrozenInstanceError):
             e.name = "changed"  # type: ignore[misc]
 
 
@@ -238,17 +319,6 @@ class TestEntitySpec:
 class TestInteractionSpec:
     """Tests for InteractionSpec construction and round-trip."""
 
-    def test_roundtrip(self) -> None:
-        original = InteractionSpec(
-            entity_a="ball",
-            entity_b="paddle",
-            behavior="bounce",
-            description="Ball bounces off paddle",
-        )
-        d = original.to_dict()
-        restored = InteractionSpec.from_dict(d)
-        assert restored == original
-
     def test_minimal(self) -> None:
         """InteractionSpec with no description round-trips correctly."""
         original = InteractionSpec(
@@ -261,83 +331,6 @@ class TestInteractionSpec:
         assert restored == original
         assert restored.description == ""
 
-    def test_json_roundtrip(self) -> None:
-        original = InteractionSpec(
-            entity_a="player",
-            entity_b="enemy",
-            behavior="damage",
-            description="Player takes damage from enemy",
-        )
-        json_str = original.to_json()
-        restored = InteractionSpec.from_json(json_str)
-        assert restored == original
-
-
-# ---------------------------------------------------------------------------
-# InvariantSpec
-# ---------------------------------------------------------------------------
-
-class TestInvariantSpec:
-    """Tests for InvariantSpec construction and round-trip."""
-
-    def test_roundtrip(self) -> None:
-        original = InvariantSpec(
-            name="ball_in_bounds",
-            entity="ball",
-            component="position",
-            field="x",
-            condition=">= 0 and <= 800",
-            description="Ball x-position within play area",
-        )
-        d = original.to_dict()
-        restored = InvariantSpec.from_dict(d)
-        assert restored == original
-
-    def test_json_roundtrip(self) -> None:
-        original = InvariantSpec(
-            name="speed_cap",
-            entity="ball",
-            component="velocity",
-            field="dx",
-            condition="<= 10.0",
-        )
-        json_str = original.to_json()
-        restored = InvariantSpec.from_json(json_str)
-        assert restored == original
-
-
-# ---------------------------------------------------------------------------
-# DegenerateStateSpec
-# ---------------------------------------------------------------------------
-
-class TestDegenerateStateSpec:
-    """Tests for DegenerateStateSpec construction and round-trip."""
-
-    def test_roundtrip(self) -> None:
-        original = DegenerateStateSpec(
-            name="ball_stuck",
-            entity="ball",
-            component="velocity",
-            field="dy",
-            condition="== 0",
-            description="Ball y-velocity should never be zero",
-        )
-        d = original.to_dict()
-        restored = DegenerateStateSpec.from_dict(d)
-        assert restored == original
-
-    def test_json_roundtrip(self) -> None:
-        original = DegenerateStateSpec(
-            name="paddle_offscreen",
-            entity="paddle",
-            component="position",
-            field="x",
-            condition="< 0 or > 800",
-        )
-        json_str = original.to_json()
-        restored = DegenerateStateSpec.from_json(json_str)
-        assert restored == original
-
 
 # ---------------------------------------------------------------------------
 # ClarificationQuestion
@@ -346,17 +339,6 @@ class TestDegenerateStateSpec:
 class TestClarificationQuestion:
     """Tests for ClarificationQuestion construction and round-trip."""
 
-    def test_roundtrip(self) -> None:
-        original = ClarificationQuestion(
-            question="What happens when the ball hits the top wall?",
-            category="physics",
-            severity="medium",
-            context="No wall bounce behavior specified for top boundary",
-        )
-        d = original.to_dict()
-        restored = ClarificationQuestion.from_dict(d)
-        assert restored == original
-
     def test_minimal(self) -> None:
         """ClarificationQuestion with no context round-trips correctly."""
         original = ClarificationQuestion(
@@ -369,17 +351,6 @@ class TestClarificationQuestion:
         assert restored == original
         assert restored.context == ""
 
-    def test_json_roundtrip(self) -> None:
-        original = ClarificationQuestion(
-            question="What is the win condition?",
-            category="game_flow",
-            severity="high",
-            context="No win condition defined",
-        )
-        json_str = original.to_json()
-        restored = ClarificationQuestion.from_json(json_str)
-        assert restored == original
-
 
 # ---------------------------------------------------------------------------
 # GameDesignSpec
@@ -454,7 +425,7 @@ class TestGameDesignSpec:
     def test_frozen(self) -> None:
         """GameDesignSpec is immutable."""
         spec = GameDesignSpec(title="Test")
-        with pytest.raises(AttributeError):
+        with pytest.raises(FrozenInstanceError):
             spec.title = "Changed"  # type: ignore[misc]
 
 
@@ -476,18 +447,6 @@ class TestListNormalization:
         assert isinstance(e.required_components, tuple)
         assert e.required_components == ("a", "b")
 
-    def test_entity_spec_list_roundtrip_equality(self) -> None:
-        """EntitySpec created with list equals one created with tuple."""
-        from_list = EntitySpec(
-            name="x", entity_type="y", role="z",
-            required_components=["a", "b"],  # type: ignore[arg-type]
-        )
-        from_tuple = EntitySpec(
-            name="x", entity_type="y", role="z",
-            required_components=("a", "b"),
-        )
-        assert from_list == from_tuple
-
     def test_game_design_spec_list_entities(self) -> None:
         """GameDesignSpec accepts lists for collection fields and normalizes to tuples."""
         entity = EntitySpec(name="e", entity_type="t", role="r")
@@ -510,16 +469,25 @@ class TestListNormalization:
         assert isinstance(spec.invariants, tuple)
         assert isinstance(spec.degenerate_states, tuple)
 
-    def test_game_design_spec_list_roundtrip_equality(self) -> None:
-        """GameDesignSpec with list inputs equals same spec with tuple inputs."""
-        entity = EntitySpec(name="e", entity_type="t", role="r")
+    def test_list_inputs_equal_tuple_inputs(self) -> None:
+        """Specs built from lists equal the same specs built from tuples."""
         from_list = GameDesignSpec(
             title="Test",
-            entities=[entity],  # type: ignore[arg-type]
+            entities=[  # type: ignore[arg-type]
+                EntitySpec(
+                    name="x", entity_type="y", role="z",
+                    required_components=["a", "b"],  # type: ignore[arg-type]
+                ),
+            ],
         )
         from_tuple = GameDesignSpec(
             title="Test",
-            entities=(entity,),
+            entities=(
+                EntitySpec(
+                    name="x", entity_type="y", role="z",
+                    required_components=("a", "b"),
+                ),
+            ),
         )
         assert from_list == from_tuple
 
@@ -544,67 +512,64 @@ class TestListNormalization:
         assert spec.entities[0].name == "e"
 
 
-class TestNullHandling:
-    """Verify that JSON null values do not become the string 'None'."""
-
-    def test_interaction_null_description(self) -> None:
-        """InteractionSpec with null description deserializes to empty string."""
-        data = {
-            "entity_a": "a", "entity_b": "b",
-            "behavior": "bounce", "description": None,
-        }
-        spec = InteractionSpec.from_dict(data)
-        assert spec.description == ""
-        assert spec.description != "None"
+_NULL_INTERACTION = {
+    "entity_a": "a", "entity_b": "b",
+    "behavior": "bounce", "description": None,
+}
+_NULL_CONDITION_SPEC = {
+    "name": "n", "entity": "e", "component": "c",
+    "field": "f", "condition": "x", "description": None,
+}
+_NULL_GAME_DESIGN = {
+    "title": "Test",
+    "description": None,
+    "win_condition": None,
+    "lose_condition": None,
+}
 
-    def test_invariant_null_description(self) -> None:
-        """InvariantSpec with null description deserializes to empty string."""
-        data = {
-            "name": "n", "entity": "e", "component": "c",
-            "field": "f", "condition": "x", "description": None,
-        }
-        spec = InvariantSpec.from_dict(data)
-        assert spec.description == ""
 
-    def test_degenerate_null_description(self) -> None:
-        """DegenerateStateSpec with null description deserializes to empty string."""
-        data = {
-            "name": "n", "entity": "e", "component": "c",
-            "field": "f", "condition": "x", "description": None,
-        }
-        spec = DegenerateStateSpec.from_dict(data)
-        assert spec.description == ""
-
-    def test_clarification_null_context(self) -> None:
-        """ClarificationQuestion with null context deserializes to empty string."""
-        data = {
-            "question": "q", "category": "c",
-            "severity": "s", "context": None,
-        }
-        spec = ClarificationQuestion.from_dict(data)
-        assert spec.context == ""
-
-    def test_game_design_spec_null_strings(self) -> None:
-        """GameDesignSpec with null optional string fields deserializes to empty string."""
-        data = {
-            "title": "Test",
-            "description": None,
-            "win_condition": None,
-            "lose_condition": None,
-        }
-        spec = GameDesignSpec.from_dict(data)
-        assert spec.description == ""
-        assert spec.win_condition == ""
-        assert spec.lose_condition == ""
+class TestNullHandling:
+    """Verify that JSON null values do not become the string 'None'."""
 
-    def test_entity_null_body_type_stays_none(self) -> None:
-        """EntitySpec with null body_type deserializes to None (not 'None' string)."""
-        data = {
-            "name": "n", "entity_type": "t", "role": "r",
-            "body_type": None,
-        }
-        spec = EntitySpec.from_dict(data)
-        assert spec.body_type is None
+    @pytest.mark.parametrize(
+        ("cls", "data", "field", "expected"),
+        [
+            (InteractionSpec, _NULL_INTERACTION, "description", ""),
+            (InvariantSpec, _NULL_CONDITION_SPEC, "description", ""),
+            (DegenerateStateSpec, _NULL_CONDITION_SPEC, "description", ""),
+            (
+                ClarificationQuestion,
+                {"question": "q", "category": "c", "severity": "s", "context": None},
+                "context",
+                "",
+            ),
+            (GameDesignSpec, _NULL_GAME_DESIGN, "description", ""),
+            (GameDesignSpec, _NULL_GAME_DESIGN, "win_condition", ""),
+            (GameDesignSpec, _NULL_GAME_DESIGN, "lose_condition", ""),
+            (
+                EntitySpec,
+                {"name": "n", "entity_type": "t", "role": "r", "body_type": None},
+                "body_type",
+                None,
+            ),
+        ],
+        ids=[
+            "interaction_description",
+            "invariant_description",
+            "degenerate_description",
+            "clarification_context",
+            "game_design_description",
+            "game_design_win_condition",
+            "game_design_lose_condition",
+            "entity_body_type_stays_none",
+        ],
+    )
+    def test_null_field(
+        self, cls: type, data: dict[str, object], field: str, expected: str | None,
+    ) -> None:
+        """A null field deserializes to its default, never the string 'None'."""
+        spec = cls.from_dict(data)  # type: ignore[attr-defined]
+        assert getattr(spec, field) == expected
 
     def test_json_null_roundtrip(self) -> None:
         """JSON null values survive full JSON round-trip correctly."""
@@ -630,94 +595,94 @@ class TestCompletenessChecker:
         questions = checker.check(spec)
         assert len(questions) == 0
 
-    def test_missing_bounds_on_dynamic_entity(self) -> None:
-        """Dynamic entity without bounds triggers a bounds question."""
-        spec = GameDesignSpec(
-            title="Test",
-            description="Test",
-            play_area=PlayAreaSpec(width=800.0, height=600.0),
-            entities=(
-                EntitySpec(name="ball", entity_type="projectile", role="ball",
-                           body_type="dynamic", required_components=("position",)),
-            ),
+    @pytest.fixture
+    def base_ball(self) -> EntitySpec:
+        """Dynamic ball with no bounds or speed limit -- each case perturbs it."""
+        return EntitySpec(
+            name="ball", entity_type="projectile", role="ball",
+            body_type="dynamic", required_components=_POS,
         )
-        checker = CompletenessChecker()
-        questions = checker.check(spec)
-        bound_qs = [q for q in questions if q.category == "bounds"]
-        assert len(bound_qs) >= 1
-        assert "ball" in bound_qs[0].question.lower()
 
-    def test_missing_interaction_pair(self) -> None:
-        """Two dynamic/kinematic entities with no interaction spec."""
-        spec = GameDesignSpec(
-            title="Test",
-            description="Test",
-            play_area=PlayAreaSpec(width=800.0, height=600.0),
-            entities=(
-                EntitySpec(name="ball", entity_type="projectile", role="ball",
-                           body_type="dynamic", required_components=("position",)),
-                EntitySpec(name="paddle", entity_type="character", role="paddle",
-                           body_type="kinematic", required_components=("position",)),
+    @pytest.mark.parametrize(
+        ("mutator", "category", "predicate"),
+        [
+            pytest.param(
+                lambda ball: GameDesignSpec(
+                    title="Test", description="Test",
+                    play_area=_PLAY_800X600,
+                    entities=(ball,),
+                ),
+                "bounds",
+                lambda qs: len(qs) >= 1 and "ball" in qs[0].question.lower(),
+                id="missing_bounds_on_dynamic_entity",
             ),
-        )
-        checker = CompletenessChecker()
-        questions = checker.check(spec)
-        interaction_qs = [q for q in questions if q.category == "interaction"]
-        assert len(interaction_qs) >= 1
-
-    def test_missing_speed_limit(self) -> None:
-        """Dynamic entity without speed_max."""
-        spec = GameDesignSpec(
-            title="Test",
-            description="Test",
-            play_area=PlayAreaSpec(width=800.0, height=600.0),
-            entities=(
-                EntitySpec(name="ball", entity_type="projectile", role="ball",
-                           body_type="dynamic",
-                           bounds=BoundsSpec(x_min=0, x_max=800, y_min=0, y_max=600),
-                           required_components=("position",)),
+            pytest.param(
+                lambda ball: GameDesignSpec(
+                    title="Test", description="Test",
+                    play_area=_PLAY_800X600,
+                    entities=(
+                        ball,
+                        EntitySpec(name="paddle", entity_type="character", role="paddle",
+                                   body_type="kinematic", required_components=_POS),
+                    ),
+                ),
+                "interaction",
+                lambda qs: len(qs) >= 1,
+                id="missing_interaction_pair",
             ),
-        )
-        checker = CompletenessChecker()
-        questions = checker.check(spec)
-        speed_qs = [q for q in questions if q.category == "invariant"]
-        assert any("speed" in q.question.lower() for q in speed_qs)
-
-    def test_no_play_area_asks_question(self) -> None:
-        """Missing play area triggers a bounds question about play area."""
-        spec = GameDesignSpec(
-            title="Test",
-            description="Test",
-            play_area=None,
-            entities=(
-                EntitySpec(name="ball", entity_type="projectile", role="ball",
-                           body_type="dynamic", required_components=("position",)),
+            pytest.param(
+                lambda ball: GameDesignSpec(
+                    title="Test", description="Test",
+                    play_area=_PLAY_800X600,
+                    entities=(
+                        replace(ball, bounds=_FULL_BOUNDS),
+                    ),
+                ),
+                "invariant",
+                lambda qs: any("speed" in q.question.lower() for q in qs),
+                id="missing_speed_limit",
             ),
-        )
-        checker = CompletenessChecker()
-        questions = checker.check(spec)
-        area_qs = [q for q in questions if q.category == "bounds"]
-        assert any("play area" in q.question.lower() for q in area_qs)
-
-    def test_no_degenerate_states_asks_question(self) -> None:
-        """Empty degenerate_states triggers a degenerate question."""
-        spec = GameDesignSpec(
-            title="Test",
-            description="Test",
-            play_area=PlayAreaSpec(width=800.0, height=600.0),
-            entities=(
-                EntitySpec(name="ball", entity_type="projectile", role="ball",
-                           body_type="dynamic",
-                           bounds=BoundsSpec(x_min=0, x_max=800, y_min=0, y_max=600),
-                           speed_max=500.0,
-                           required_components=("position",)),
+            pytest.param(
+                lambda ball: GameDesignSpec(
+                    title="Test", description="Test",
+                    play_area=None,
+                    entities=(ball,),
+                ),
+                "bounds",
+                lambda qs: any("play area" in q.question.lower() for q in qs),
+                id="no_play_area_asks_question",
             ),
-            degenerate_states=(),
-        )
+            pytest.param(
+                lambda ball: GameDesignSpec(
+                    title="Test", description="Test",
+                    play_area=_PLAY_800X600,
+                    entities=(
+                        replace(
+                            ball,
+                            bounds=_FULL_BOUNDS,
+                            speed_max=500.0,
+                        ),
+                    ),
+                    degenerate_states=(),
+                ),
+                "degenerate",
+                lambda qs: len(qs) >= 1,
+                id="no_degenerate_states_asks_question",
+            ),
+        ],
+    )
+    def test_gap_produces_question(
+        self,
+        base_ball: EntitySpec,
+        mutator: Callable[[EntitySpec], GameDesignSpec],
+        category: str,
+        predicate: Callable[[list[ClarificationQuestion]], bool],
+    ) -> None:
+        """Each under-specified spec triggers a question in the expected category."""
         checker = CompletenessChecker()
-        questions = checker.check(spec)
-        degen_qs = [q for q in questions if q.category == "degenerate"]
-        assert len(degen_qs) >= 1
+        by_cat = _by_category(checker.check(mutator(base_ball)))
+        matches = by_cat.get(category, [])
+        assert predicate(matches), f"{category} questions: {matches}"
 
 
 # ---------------------------------------------------------------------------
@@ -806,9 +771,9 @@ class TestIntentGenerator:
             title="Test",
             entities=(
                 EntitySpec(name="ball", entity_type="projectile", role="ball",
-                           body_type="dynamic", required_components=("position",)),
+                           body_type="dynamic", required_components=_POS),
                 EntitySpec(name="brick", entity_type="obstacle", role="brick",
-                           body_type="static", required_components=("position",)),
+                           body_type="static", required_components=_POS),
             ),
             interactions=(
                 InteractionSpec(
@@ -901,9 +866,9 @@ class TestFullPipeline:
             play_area=None,
             entities=(
                 EntitySpec(name="ball", entity_type="projectile", role="ball",
-                           body_type="dynamic", required_components=("position",)),
+                           body_type="dynamic", required_components=_POS),
                 EntitySpec(name="paddle", entity_type="character", role="paddle",
-                           body_type="kinematic", required_components=("position",)),
+                           body_type="kinematic", required_components=_POS),
             ),
             interactions=(),
             invariants=(),
@@ -914,8 +879,8 @@ class TestFullPipeline:
         # Should ask about: play area, ball bounds, paddle bounds,
         # ball speed, ball-paddle interaction, degenerate states
         assert len(questions) >= 4
-        categories = {q.category for q in questions}
-        assert "bounds" in categories
-        assert "interaction" in categories
-        assert "invariant" in categories
-        assert "degenerate" in categories
+        by_cat = _by_category(questions)
+        assert by_cat["bounds"]
+        assert by_cat["interaction"]
+        assert by_cat["invariant"]
+        assert by_cat["degenerate"]
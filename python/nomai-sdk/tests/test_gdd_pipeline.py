@@ -8,10 +8,14 @@ use pytest's tmp_path fixture to avoid polluting the working tree.
 from __future__ import annotations
 
 import json
+import re
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 
+from nomai import gdd_pipeline
 from nomai.gdd import (
     GameDesignSpec,
     PlayAreaSpec,
@@ -29,127 +33,147 @@ from nomai.gdd_pipeline import (
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _complete_breakout_dict() -> dict[str, object]:
-    """Build a complete breakout spec as a plain dict.
-
-    This spec passes CompletenessChecker with 0 questions because it
-    has: play_area, bounds on all dynamic/kinematic entities, speed_max
-    on all dynamic entities, interactions covering every movable pair,
-    and at least one degenerate state.
-    """
-    return {
-        "title": "Breakout",
-        "description": "Classic breakout clone with paddle, ball, and bricks",
-        "play_area": {"width": 800.0, "height": 600.0},
-        "entities": [
-            {
-                "name": "paddle",
-                "entity_type": "character",
-                "role": "paddle",
-                "body_type": "kinematic",
-                "bounds": {"y_min": 550.0, "y_max": 550.0},
-                "speed_max": 8.0,
-                "required_components": ["position", "size", "velocity"],
+def _freeze(obj: object) -> object:
+    """Recursively freeze a JSON-like literal (dict -> MappingProxyType, list -> tuple)."""
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+# Complete breakout spec.  Passes CompletenessChecker with 0 questions
+# because it has: play_area, bounds on all dynamic/kinematic entities,
+# speed_max on all dynamic entities, interactions covering every movable
+# pair, and at least one degenerate state.
+_COMPLETE_BREAKOUT: Mapping[str, object] = _freeze({
+    "title": "Breakout",
+    "description": "Classic breakout clone with paddle, ball, and bricks",
+    "play_area": {"width": 800.0, "height": 600.0},
+    "entities": [
+        {
+            "name": "paddle",
+            "entity_type": "character",
+            "role": "paddle",
+            "body_type": "kinematic",
+            "bounds": {"y_min": 550.0, "y_max": 550.0},
+            "speed_max": 8.0,
+            "required_components": ["position", "size", "velocity"],
+        },
+        {
+            "name": "ball",
+            "entity_type": "projectile",
+            "role": "ball",
+            "body_type": "dynamic",
+            "bounds": {
+                "x_min": 0.0,
+                "x_max": 800.0,
+                "y_min": 0.0,
+                "y_max": 600.0,
             },
-            {
-                "name": "ball",
-                "entity_type": "projectile",
-                "role": "ball",
-                "body_type": "dynamic",
-                "bounds": {
-                    "x_min": 0.0,
-                    "x_max": 800.0,
-                    "y_min": 0.0,
-                    "y_max": 600.0,
-                },
-                "speed_max": 10.0,
-                "required_components": ["position", "velocity"],
-            },
-            {
-                "name": "brick",
-                "entity_type": "obstacle",
-                "role": "brick",
-                "body_type": "static",
-                "required_components": ["position", "size", "health"],
-            },
-        ],
-        "interactions": [
-            {
-                "entity_a": "ball",
-                "entity_b": "paddle",
-                "behavior": "bounce",
-                "description": "Ball bounces off the paddle, reversing y-velocity",
-            },
-            {
-                "entity_a": "ball",
-                "entity_b": "brick",
-                "behavior": "destroy",
-                "description": "Ball destroys brick on contact",
-            },
-            {
-                "entity_a": "ball",
-                "entity_b": "wall",
-                "behavior": "bounce",
-                "description": "Ball bounces off walls",
-            },
-            {
-                "entity_a": "paddle",
-                "entity_b": "brick",
-                "behavior": "none",
-                "description": "Paddle and brick do not interact directly",
-            },
-        ],
-        "invariants": [
-            {
-                "name": "ball_in_bounds",
-                "entity": "ball",
-                "component": "position",
-                "field": "x",
-                "condition": ">= 0 and <= 800",
-                "description": "Ball x-position must stay within the play area",
-            },
-        ],
-        "degenerate_states": [
-            {
-                "name": "ball_stuck",
-                "entity": "ball",
-                "component": "velocity",
-                "field": "dy",
-                "condition": "== 0",
-                "description": "Ball y-velocity should never be zero during play",
-            },
-        ],
-        "win_condition": "All bricks destroyed",
-        "lose_condition": "Ball falls below paddle",
-    }
-
-
-def _incomplete_spec_dict() -> dict[str, object]:
-    """Build a minimal incomplete spec dict.
-
-    Missing play_area, bounds, speed_max, interactions, and
-    degenerate_states -- guaranteed to produce multiple questions.
-    """
-    return {
-        "title": "Minimal",
-        "description": "Bare minimum spec",
-        "entities": [
-            {
-                "name": "ball",
-                "entity_type": "projectile",
-                "role": "ball",
-                "body_type": "dynamic",
-                "required_components": ["position"],
-            },
-            {
-                "name": "paddle",
-                "entity_type": "character",
-                "role": "paddle",
-                "body_type": "kinematic",
-                "required_components": ["position"],
-            },
-        ],
-    }
+            "speed_max": 10.0,
+            "required_components": ["position", "velocity"],
+        },
+        {
+            "name": "brick",
+            "entity_type": "obstacle",
+            "role": "brick",
+            "body_type": "static",
+            "required_components": ["position", "size", "health"],
+        },
+    ],
+    "interactions": [
+        {
+            "entity_a": "ball",
+            "entity_b": "paddle",
+            "behavior": "bounce",
+            "description": "Ball bounces off the paddle, reversing y-velocity",
+        },
+        {
+            "entity_a": "ball",
+            "entity_b": "brick",
+            "behavior": "destroy",
+            "description": "Ball destroys brick on contact",
+        },
+        {
+            "entity_a": "ball",
+            "entity_b": "wall",
+            "behavior": "bounce",
+            "description": "Ball bounces off walls",
+        },
+        {
+            "entity_a": "paddle",
+            "entity_b": "brick",
+            "behavior": "none",
+            "description": "Paddle and brick do not interact directly",
+        },
+    ],
+    "invariants": [
+        {
+            "name": "ball_in_bounds",
+            "entity": "ball",
+            "component": "position",
+            "field": "x",
+            "condition": ">= 0 and <= 800",
+            "description": "Ball x-position must stay within the play area",
+        },
+    ],
+    "degenerate_states": [
+        {
+            "name": "ball_stuck",
+            "entity": "ball",
+            "component": "velocity",
+            "field": "dy",
+            "condition": "== 0",
+            "description": "Ball y-velocity should never be zero during play",
+        },
+    ],
+    "win_condition": "All bricks destroyed",
+    "lose_condition": "Ball falls below paddle",
+})  # type: ignore[assignment]
+
+
+# Minimal incomplete spec.  Missing play_area, bounds, speed_max,
+# interactions, and degenerate_states -- guaranteed to produce multiple
+# questions.
+_INCOMPLETE_SPEC: Mapping[str, object] = _freeze({
+    "title": "Minimal",
+    "description": "Bare minimum spec",
+    "entities": [
+        {
+            "name": "ball",
+            "entity_type": "projectile",
+            "role": "ball",
+            "body_type": "dynamic",
+            "required_components": ["position"],
+        },
+        {
+            "name": "paddle",
+            "entity_type": "character",
+            "role": "paddle",
+            "body_type": "kinematic",
+            "required_components": ["position"],
+        },
+    ],
+})  # type: ignore[assignment]
+
+
+@pytest.fixture(scope="session")
+def complete_breakout_spec() -> Mapping[str, object]:
+    """Read-only complete breakout spec, frozen once at import."""
+    return _COMPLETE_BREAKOUT
+
+
+@pytest.fixture(scope="session")
+def incomplete_spec() -> Mapping[str, object]:
+    """Read-only incomplete spec, frozen once at import."""
+    return _INCOMPLETE_SPEC
+
+
+@pytest.fixture(scope="class")
+def shared_out(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One parent output directory shared by the disk-writing tests of a class."""
+    return tmp_path_factory.mktemp("pipeline")
 
 
 # ---------------------------------------------------------------------------
@@ -159,25 +183,30 @@ def _incomplete_spec_dict() -> dict[str, object]:
 class TestSlugify:
     """Tests for the private _slugify helper."""
 
-    def test_normal_title(self) -> None:
-        """Spaces are replaced with underscores and text is lowered."""
-        assert _slugify("My Cool Game") == "my_cool_game"
-
-    def test_special_characters(self) -> None:
-        """Non-alphanumeric characters are collapsed into underscores."""
-        assert _slugify("Match-3 Puzzle!") == "match_3_puzzle"
-
-    def test_empty_string(self) -> None:
-        """Empty input returns the fallback 'untitled'."""
-        assert _slugify("") == "untitled"
-
-    def test_only_special_chars(self) -> None:
-        """Input with only special chars returns 'untitled'."""
-        assert _slugify("!!!@@@") == "untitled"
+    @pytest.mark.parametrize(
+        ("title", "expected"),
+        [
+            # Spaces are replaced with underscores and text is lowered.
+            ("My Cool Game", "my_cool_game"),
+            # Non-alphanumeric characters are collapsed into underscores.
+            ("Match-3 Puzzle!", "match_3_puzzle"),
+            # Empty input returns the fallback 'untitled'.
+            ("", "untitled"),
+            # Input with only special chars returns 'untitled'.
+            ("!!!@@@", "untitled"),
+            # A simple lowercase word passes through unchanged.
+            ("breakout", "breakout"),
+        ],
+        ids=["normal_title", "special_characters", "empty_string",
+             "only_special_chars", "already_slugified"],
+    )
+    def test_slugify(self, title: str, expected: str) -> None:
+        """_slugify maps each title to its filesystem-safe slug."""
+        assert _slugify(title) == expected
 
-    def test_already_slugified(self) -> None:
-        """A simple lowercase word passes through unchanged."""
-        assert _slugify("breakout") == "breakout"
+    def test_slugify_pattern_is_precompiled(self) -> None:
+        """_slugify uses a module-level compiled pattern, not per-call re.sub."""
+        assert isinstance(gdd_pipeline._SLUG_INVALID_RE, re.Pattern)
 
 
 # ---------------------------------------------------------------------------
@@ -242,9 +271,7 @@ class TestSaveSpec:
 
         # Assert
         assert result_path.exists()
-        loaded = GameDesignSpec.from_json(
-            result_path.read_text(encoding="utf-8")
-        )
+        loaded = load_spec(result_path)
         assert loaded.title == "Save Test"
         assert loaded == spec
 
@@ -259,9 +286,7 @@ class TestSaveSpec:
 
         # Assert
         assert result_path.exists()
-        loaded = GameDesignSpec.from_json(
-            result_path.read_text(encoding="utf-8")
-        )
+        loaded = load_spec(result_path)
         assert loaded.title == "Nested Save"
 
 
@@ -272,13 +297,12 @@ class TestSaveSpec:
 class TestRunPipeline:
     """Tests for the run_pipeline orchestration function."""
 
-    def test_complete_spec_returns_suite(self, tmp_path: Path) -> None:
+    def test_complete_spec_returns_suite(
+        self, shared_out: Path, complete_breakout_spec: Mapping[str, object],
+    ) -> None:
         """A complete breakout spec dict produces a suite with no questions."""
-        # Arrange
-        spec_dict = _complete_breakout_dict()
-
         # Act
-        result = run_pipeline(spec_dict, output_dir=tmp_path)
+        result = run_pipeline(complete_breakout_spec, output_dir=shared_out / "complete")
 
         # Assert
         assert isinstance(result, PipelineResult)
@@ -289,40 +313,39 @@ class TestRunPipeline:
         assert result.suite_path is not None
         assert result.suite_path.exists()
 
-    def test_incomplete_spec_returns_questions(self, tmp_path: Path) -> None:
+    def test_incomplete_spec_returns_questions(
+        self, incomplete_spec: Mapping[str, object],
+    ) -> None:
         """A minimal incomplete spec dict produces questions and no suite."""
-        # Arrange
-        spec_dict = _incomplete_spec_dict()
-
         # Act
-        result = run_pipeline(spec_dict, output_dir=tmp_path)
+        result = run_pipeline(incomplete_spec, save=False)
 
         # Assert
         assert len(result.questions) >= 4
         assert result.suite is None
 
-    def test_save_false_skips_disk(self, tmp_path: Path) -> None:
+    def test_save_false_skips_disk(
+        self, tmp_path: Path, complete_breakout_spec: Mapping[str, object],
+    ) -> None:
         """save=False suppresses all file output."""
-        # Arrange
-        spec_dict = _complete_breakout_dict()
-
         # Act
-        result = run_pipeline(spec_dict, output_dir=tmp_path, save=False)
+        result = run_pipeline(complete_breakout_spec, output_dir=tmp_path, save=False)
 
         # Assert
         assert result.spec_path is None
         assert result.suite_path is None
         # No files should have been written under tmp_path
-        assert list(tmp_path.iterdir()) == []
+        assert next(tmp_path.iterdir(), None) is None
 
-    def test_custom_output_dir(self, tmp_path: Path) -> None:
+    def test_custom_output_dir(
+        self, shared_out: Path, complete_breakout_spec: Mapping[str, object],
+    ) -> None:
         """Files are saved into the explicit output_dir."""
         # Arrange
-        spec_dict = _complete_breakout_dict()
-        custom_dir = tmp_path / "custom"
+        custom_dir = shared_out / "custom"
 
         # Act
-        result = run_pipeline(spec_dict, output_dir=custom_dir)
+        result = run_pipeline(complete_breakout_spec, output_dir=custom_dir)
 
         # Assert
         assert result.spec_path is not None
@@ -331,16 +354,18 @@ class TestRunPipeline:
         assert result.suite_path is not None
         assert result.suite_path.exists()
 
-    def test_saves_questions_json(self, tmp_path: Path) -> None:
+    def test_saves_questions_json(
+        self, shared_out: Path, incomplete_spec: Mapping[str, object],
+    ) -> None:
         """Incomplete spec run saves a questions.json with non-empty list."""
         # Arrange
-        spec_dict = _incomplete_spec_dict()
+        out_dir = shared_out / "questions"
 
         # Act
-        result = run_pipeline(spec_dict, output_dir=tmp_path)
+        run_pipeline(incomplete_spec, output_dir=out_dir)
 
         # Assert
-        questions_file = tmp_path / "questions.json"
+        questions_file = out_dir / "questions.json"
         assert questions_file.exists()
         questions_data = json.loads(
             questions_file.read_text(encoding="utf-8")
@@ -356,13 +381,12 @@ class TestRunPipeline:
 class TestPipelineRoundTrip:
     """End-to-end: run pipeline, save, then reload and verify."""
 
-    def test_save_and_reload(self, tmp_path: Path) -> None:
+    def test_save_and_reload(
+        self, tmp_path: Path, complete_breakout_spec: Mapping[str, object],
+    ) -> None:
         """Pipeline output can be reloaded via load_spec."""
-        # Arrange
-        spec_dict = _complete_breakout_dict()
-
         # Act
-        result = run_pipeline(spec_dict, output_dir=tmp_path)
+        result = run_pipeline(complete_breakout_spec, output_dir=tmp_path)
         assert result.spec_path is not None
         reloaded = load_spec(result.spec_path)
 
@@ -10,12 +10,17 @@ The manifest JSON files are exported by the Rust integration tests
 verification intents, and checks the full pass/fail loop.
 """
 
+import functools
 import json
 import logging
+import os
+import pickle
+import re
 from pathlib import Path
 
 import pytest
 
+from nomai._json import loads as _loads
 from nomai.intents import (
     Expected,
     ExpectedType,
@@ -26,43 +31,119 @@ from nomai.intents import (
     VerificationSuite,
 )
 from nomai.manifest import TickManifest
-from nomai.verify import VerificationEngine
+from nomai.verify import VerificationEngine, VerificationReport
 
 logger = logging.getLogger(__name__)
 
-# Path to the exported manifest JSON files.
-# The Rust tests write them to crates/nomai-wasm-host/tests/fixtures/b8_manifests/.
-FIXTURES_DIR = (
-    Path(__file__).parent.parent.parent.parent
-    / "crates"
-    / "nomai-wasm-host"
-    / "tests"
-    / "fixtures"
-    / "b8_manifests"
-)
+_TICK_FILE = re.compile(r"tick_(\d+)\.json")
+
 
+@functools.lru_cache(maxsize=1)
+def _fixtures_root() -> Path:
+    """Directory holding the exported manifest JSON files.
+
+    The Rust tests write them to
+    ``crates/nomai-wasm-host/tests/fixtures/b8_manifests/``; set
+    ``NOMAI_B8_FIXTURES`` to point at an alternative location.
+    """
+    override = os.environ.get("NOMAI_B8_FIXTURES")
+    if override:
+        return Path(override)
+    repo_root = Path(__file__).resolve().parents[3]
+    return repo_root / "crates" / "nomai-wasm-host" / "tests" / "fixtures" / "b8_manifests"
 
-def _load_manifests(scenario: str) -> list[TickManifest]:
+
+def _load_manifests_impl(scenario: str) -> list[TickManifest]:
     """Load exported manifests from the Rust integration test."""
-    scenario_dir = FIXTURES_DIR / scenario
+    scenario_dir = _fixtures_root() / scenario
     if not scenario_dir.exists():
         pytest.skip(
             f"Manifest fixtures not found at {scenario_dir} "
             "-- run `cargo test -p nomai-wasm-host b8` first"
         )
 
-    manifests: list[TickManifest] = []
-    tick_files = sorted(scenario_dir.glob("tick_*.json"))
+    # Sort by tick number, not lexically (tick_10 must follow tick_9).
+    # Stray files without a numeric suffix (e.g. tick_old.json) are ignored.
+    with os.scandir(scenario_dir) as it:
+        entries = [
+            (int(m.group(1)), e.path)
+            for e in it
+            if (m := _TICK_FILE.fullmatch(e.name))
+        ]
+    entries.sort()
+    tick_files = [Path(p) for _, p in entries]
     assert len(tick_files) > 0, f"no tick_*.json files in {scenario_dir}"
 
-    for tick_file in tick_files:
-        data = json.loads(tick_file.read_text())
-        manifest = TickManifest.from_json(data)
-        manifests.append(manifest)
+    # Decode every tick in one loads call over a JSON array built from the
+    # raw bytes (``loads`` accepts bytes, so no per-file str decode).
+    payload = b"[" + b",".join(f.read_bytes() for f in tick_files) + b"]"
+    return [TickManifest.from_json(data) for data in _loads(payload)]
+
+
+@pytest.fixture(scope="session")
+def _cached_manifests(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> dict[str, list[TickManifest]]:
+    """Parsed manifests for both scenarios, keyed by scenario name.
 
+    Under pytest-xdist every worker gets its own session, so the first worker
+    to finish parsing pickles the result into the run's shared base temp dir
+    and the others load it from there instead of re-parsing the JSON.
+    """
+    if os.environ.get("PYTEST_XDIST_WORKER") is None:
+        return {s: _load_manifests_impl(s) for s in ("correct", "buggy")}
+
+    # Worker basetemps are siblings under one per-run directory.
+    cache = tmp_path_factory.getbasetemp().parent / "b8_manifests.pkl"
+    if cache.exists():
+        cached: dict[str, list[TickManifest]] = pickle.loads(cache.read_bytes())
+        return cached
+
+    data = {s: _load_manifests_impl(s) for s in ("correct", "buggy")}
+    # Write then rename so a concurrent reader never sees a partial pickle.
+    partial = cache.with_name(f"{cache.name}.{os.getpid()}")
+    partial.write_bytes(pickle.dumps(data))
+    os.replace(partial, cache)
+    return data
+
+
+@pytest.fixture(scope="session")
+def correct_manifests(
+    _cached_manifests: dict[str, list[TickManifest]],
+) -> list[TickManifest]:
+    """Manifests from the correct scenario, parsed once per session (read-only)."""
+    return _cached_manifests["correct"]
+
+
+@pytest.fixture(scope="session")
+def buggy_manifests(
+    _cached_manifests: dict[str, list[TickManifest]],
+) -> list[TickManifest]:
+    """Manifests from the buggy scenario, parsed once per session (read-only)."""
+    return _cached_manifests["buggy"]
+
+
+@pytest.fixture
+def scenario_manifests(request: pytest.FixtureRequest) -> list[TickManifest]:
+    """Indirection so tests can be parametrized over the scenario fixtures."""
+    manifests: list[TickManifest] = request.getfixturevalue(request.param)
     return manifests
 
 
+def _causality_gaps(manifests: list[TickManifest]) -> list[str]:
+    """Describe every component change lacking WASM gameplay causality."""
+    gaps: list[str] = []
+    for m in manifests:
+        for change in m.component_changes:
+            if change.changed_by_system != 100:
+                gaps.append(f"tick {m.tick}: changed_by should be WASM_GAMEPLAY")
+            if change.reason_type != "GameRule":
+                gaps.append(f"tick {m.tick}: reason_type should be GameRule")
+            if not change.reason_detail:
+                gaps.append(f"tick {m.tick}: reason_detail should not be empty")
+    return gaps
+
+
 def _build_movement_suite() -> VerificationSuite:
     """Build an intent verification suite for movement behavior.
 
@@ -97,40 +178,75 @@ def _build_movement_suite() -> VerificationSuite:
     )
 
 
+@pytest.fixture(scope="session")
+def movement_suite() -> VerificationSuite:
+    """The movement suite, built once per session (read-only)."""
+    return _build_movement_suite()
+
+
+@pytest.fixture(scope="session")
+def verification_engine() -> VerificationEngine:
+    """A shared VerificationEngine -- it holds no per-run state."""
+    return VerificationEngine()
+
+
+@pytest.fixture(scope="session")
+def correct_report(
+    correct_manifests: list[TickManifest],
+    movement_suite: VerificationSuite,
+    verification_engine: VerificationEngine,
+) -> VerificationReport:
+    """Verification report for the correct scenario, computed once (read-only)."""
+    return verification_engine.verify(movement_suite, correct_manifests)
+
+
+@pytest.fixture(scope="session")
+def buggy_report(
+    buggy_manifests: list[TickManifest],
+    movement_suite: VerificationSuite,
+    verification_engine: VerificationEngine,
+) -> VerificationReport:
+    """Verification report for the buggy scenario, computed once (read-only)."""
+    return verification_engine.verify(movement_suite, buggy_manifests)
+
+
 class TestB8ManifestParsing:
     """Verify that Rust-exported manifests can be parsed by the Python SDK."""
 
-    def test_correct_manifests_load(self) -> None:
+    def test_correct_manifests_load(self, correct_manifests: list[TickManifest]) -> None:
         """Correct scenario manifests should load without errors."""
-        manifests = _load_manifests("correct")
+        manifests = correct_manifests
         assert len(manifests) == 5, "should have 5 tick manifests"
 
-    def test_buggy_manifests_load(self) -> None:
+    def test_buggy_manifests_load(self, buggy_manifests: list[TickManifest]) -> None:
         """Buggy scenario manifests should load without errors."""
-        manifests = _load_manifests("buggy")
+        manifests = buggy_manifests
         assert len(manifests) == 5, "should have 5 tick manifests"
 
-    def test_correct_manifest_has_component_changes(self) -> None:
+    def test_correct_manifest_has_component_changes(
+        self,
+        correct_manifests: list[TickManifest],
+    ) -> None:
         """Correct manifests should contain position component changes."""
-        manifests = _load_manifests("correct")
-        m = manifests[0]
+        m = correct_manifests[0]
         assert len(m.component_changes) > 0, "should have component changes"
         change = m.component_changes[0]
         assert change.component_type_name == "position"
 
-    def test_correct_manifest_field_values(self) -> None:
+    def test_correct_manifest_field_values(
+        self,
+        correct_manifests: list[TickManifest],
+    ) -> None:
         """Correct manifests should have expected field values."""
-        manifests = _load_manifests("correct")
-        m = manifests[0]
+        m = correct_manifests[0]
         assert m.tick == 1
         assert m.commands_processed == 1
         assert m.commands_succeeded == 1
         assert "wasm_gameplay" in m.systems_executed
 
-    def test_correct_manifest_causality(self) -> None:
+    def test_correct_manifest_causality(self, correct_manifests: list[TickManifest]) -> None:
         """Correct manifests should carry WASM causality metadata."""
-        manifests = _load_manifests("correct")
-        m = manifests[0]
+        m = correct_manifests[0]
         change = m.component_changes[0]
         # SystemId::WASM_GAMEPLAY = 100
         assert change.changed_by_system == 100, (
@@ -139,10 +255,9 @@ class TestB8ManifestParsing:
         assert change.reason_type == "GameRule"
         assert change.reason_detail == "move_toward_target"
 
-    def test_buggy_manifest_causality(self) -> None:
+    def test_buggy_manifest_causality(self, buggy_manifests: list[TickManifest]) -> None:
         """Buggy manifests should carry different causality metadata."""
-        manifests = _load_manifests("buggy")
-        m = manifests[0]
+        m = buggy_manifests[0]
         change = m.component_changes[0]
         assert change.changed_by_system == 100
         assert change.reason_type == "GameRule"
@@ -152,38 +267,32 @@ class TestB8ManifestParsing:
 class TestB8VerificationLoop:
     """B8: Correct gameplay passes, buggy gameplay fails with diagnosis."""
 
-    def test_correct_gameplay_passes_verification(self) -> None:
+    def test_correct_gameplay_passes_verification(
+        self, correct_report: VerificationReport,
+    ) -> None:
         """Correct WASM module should pass all verification intents."""
-        manifests = _load_manifests("correct")
-        suite = _build_movement_suite()
-        engine = VerificationEngine()
-        report = engine.verify(suite, manifests)
-
+        report = correct_report
         assert report.all_passed, (
             f"Correct gameplay should pass verification.\n"
             f"Summary:\n{report.summary()}\n"
             f"Failures: {[f.failure_reason for f in report.failures()]}"
         )
 
-    def test_buggy_gameplay_fails_verification(self) -> None:
+    def test_buggy_gameplay_fails_verification(
+        self, buggy_report: VerificationReport,
+    ) -> None:
         """Buggy WASM module should fail verification."""
-        manifests = _load_manifests("buggy")
-        suite = _build_movement_suite()
-        engine = VerificationEngine()
-        report = engine.verify(suite, manifests)
-
+        report = buggy_report
         assert not report.all_passed, (
             "Buggy gameplay should FAIL verification but it passed.\n"
             f"Summary:\n{report.summary()}"
         )
 
-    def test_buggy_failure_has_diagnosis(self) -> None:
+    def test_buggy_failure_has_diagnosis(
+        self, buggy_report: VerificationReport,
+    ) -> None:
         """Failed verification should include a failure reason for diagnosis."""
-        manifests = _load_manifests("buggy")
-        suite = _build_movement_suite()
-        engine = VerificationEngine()
-        report = engine.verify(suite, manifests)
-
+        report = buggy_report
         failed = [r for r in report.results if not r.passed]
         assert len(failed) > 0, "should have at least one failed intent"
 
@@ -198,29 +307,29 @@ class TestB8VerificationLoop:
             "diagnosis should name the failed intent"
         )
 
-    def test_verification_report_is_json_serializable(self) -> None:
+    def test_verification_report_is_json_serializable(
+        self, buggy_report: VerificationReport,
+    ) -> None:
         """Verification report should serialize to JSON cleanly."""
-        manifests = _load_manifests("buggy")
-        suite = _build_movement_suite()
-        engine = VerificationEngine()
-        report = engine.verify(suite, manifests)
-
+        report = buggy_report
         report_dict = report.to_dict()
-        json_str = json.dumps(report_dict)
-        roundtrip = json.loads(json_str)
+        json.dumps(report_dict)  # must not raise
 
-        assert roundtrip["suite_name"] == "movement_verification"
-        assert roundtrip["total_intents"] == 1
-        assert roundtrip["failed"] == 1
-        assert roundtrip["all_passed"] is False
+        assert report_dict["suite_name"] == "movement_verification"
+        assert report_dict["total_intents"] == 1
+        assert report_dict["failed"] == 1
+        assert report_dict["all_passed"] is False
 
 
 class TestB8CausalDiagnosis:
     """Verify that the causal chain across the WASM boundary is visible."""
 
-    def test_correct_manifests_have_wasm_causality(self) -> None:
+    def test_correct_manifests_have_wasm_causality(
+        self,
+        correct_manifests: list[TickManifest],
+    ) -> None:
         """Manifests from correct gameplay should carry WASM causality."""
-        manifests = _load_manifests("correct")
+        manifests = correct_manifests
         assert len(manifests) > 0, "should have manifests"
 
         m = manifests[0]
@@ -233,19 +342,25 @@ class TestB8CausalDiagnosis:
             f"should be WASM_GAMEPLAY (100), got {change.changed_by_system}"
         )
 
-    def test_buggy_manifests_have_wasm_causality(self) -> None:
+    def test_buggy_manifests_have_wasm_causality(
+        self,
+        buggy_manifests: list[TickManifest],
+    ) -> None:
         """Manifests from buggy gameplay should also carry WASM causality."""
-        manifests = _load_manifests("buggy")
-        m = manifests[0]
+        m = buggy_manifests[0]
         change = m.component_changes[0]
 
         assert change.changed_by_system == 100
         assert change.reason_type == "GameRule"
 
-    def test_correct_and_buggy_have_different_reasons(self) -> None:
+    def test_correct_and_buggy_have_different_reasons(
+        self,
+        correct_manifests: list[TickManifest],
+        buggy_manifests: list[TickManifest],
+    ) -> None:
         """Correct and buggy modules should have different causal reasons."""
-        correct = _load_manifests("correct")
-        buggy = _load_manifests("buggy")
+        correct = correct_manifests
+        buggy = buggy_manifests
 
         correct_reason = correct[0].component_changes[0].reason_detail
         buggy_reason = buggy[0].component_changes[0].reason_detail
@@ -255,18 +370,17 @@ class TestB8CausalDiagnosis:
             "should have different causal reasons"
         )
 
-    def test_all_ticks_carry_causality(self) -> None:
+    @pytest.mark.parametrize(
+        "scenario_manifests", ["correct_manifests", "buggy_manifests"], indirect=True,
+    )
+    def test_all_ticks_carry_causality(
+        self, scenario_manifests: list[TickManifest],
+    ) -> None:
         """Every tick in both scenarios should have causality metadata."""
-        for scenario in ("correct", "buggy"):
-            manifests = _load_manifests(scenario)
-            for i, m in enumerate(manifests):
-                for change in m.component_changes:
-                    assert change.changed_by_system == 100, (
-                        f"{scenario} tick {i + 1}: changed_by should be WASM_GAMEPLAY"
-                    )
-                    assert change.reason_type == "GameRule", (
-                        f"{scenario} tick {i + 1}: reason_type should be GameRule"
-                    )
-                    assert len(change.reason_detail) > 0, (
-                        f"{scenario} tick {i + 1}: reason_detail should not be empty"
-                    )
+        # all() short-circuits on the happy path; the per-change report is
+        # only built (as the assertion message) when something is missing.
+        assert all(
+            c.changed_by_system == 100 and c.reason_type == "GameRule" and c.reason_detail
+            for m in scenario_manifests
+            for c in m.component_changes
+        ), _causality_gaps(scenario_manifests)
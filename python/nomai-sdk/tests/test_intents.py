@@ -7,6 +7,9 @@ complete breakout verification suite expressed using the intent DSL.
 from __future__ import annotations
 
 import json
+import sys
+from collections.abc import Callable
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 
 import pytest
@@ -38,6 +41,114 @@ from nomai.intents import (
 )
 
 
+# ---------------------------------------------------------------------------
+# Shared test data
+# ---------------------------------------------------------------------------
+
+_PADDLE_COMPONENTS = ("position", "size")
+_BALL_COMPONENTS = ("position", "velocity")
+_BALL_SPEED_RANGE = (-10.0, 10.0)
+_BALL_BOUNDS_CONDITION = (
+    "entity('ball').position.x >= 0 and "
+    "entity('ball').position.x <= 800 and "
+    "entity('ball').position.y >= 0 and "
+    "entity('ball').position.y <= 600"
+)
+_REQUIRED_BOUND_SUBSTRINGS = ("position.x >= 0", "position.y <= 600", "800")
+
+
+# Leaf constructor cases: (factory, expected type, expected params).
+_TRIGGER_LEAF_CASES = [
+    pytest.param(
+        lambda: collision("ball", "paddle"),
+        TriggerType.COLLISION,
+        {"entity_a": "ball", "entity_b": "paddle"},
+        id="collision",
+    ),
+    pytest.param(
+        lambda: state_transition("player", "alive", "dead"),
+        TriggerType.STATE_TRANSITION,
+        {"entity": "player", "from_state": "alive", "to_state": "dead"},
+        id="state_transition",
+    ),
+    pytest.param(
+        lambda: aggregate_condition("brick", "==", 0),
+        TriggerType.AGGREGATE_CONDITION,
+        {"entity_type": "brick", "comparison": "==", "value": 0},
+        id="aggregate_condition",
+    ),
+    pytest.param(
+        lambda: component_condition("ball", "velocity", "dx", ">", 0),
+        TriggerType.COMPONENT_CONDITION,
+        {"entity": "ball", "component": "velocity", "field": "dx", "comparison": ">", "value": 0},
+        id="component_condition",
+    ),
+    pytest.param(
+        lambda: event_occurred("collision", involving=["ball", "brick"]),
+        TriggerType.EVENT_OCCURRED,
+        {"event_type": "collision", "involving": ["ball", "brick"]},
+        id="event_occurred",
+    ),
+    pytest.param(
+        lambda: event_occurred("level_up"),
+        TriggerType.EVENT_OCCURRED,
+        {"event_type": "level_up"},
+        id="event_occurred_no_involving",
+    ),
+    pytest.param(
+        lambda: tick_reached(100),
+        TriggerType.TICK_REACHED,
+        {"tick": 100},
+        id="tick_reached",
+    ),
+]
+
+_EXPECTED_LEAF_CASES = [
+    pytest.param(
+        lambda: component_changed("ball", "position", field_name="y"),
+        ExpectedType.COMPONENT_CHANGED,
+        {"entity": "ball", "component": "position", "field": "y"},
+        id="component_changed",
+    ),
+    pytest.param(
+        lambda: component_changed("score", "value", expected_value=100),
+        ExpectedType.COMPONENT_CHANGED,
+        {"entity": "score", "component": "value", "expected_value": 100},
+        id="component_changed_with_value",
+    ),
+    pytest.param(
+        lambda: entity_despawned("brick_0"),
+        ExpectedType.ENTITY_DESPAWNED,
+        {"entity": "brick_0"},
+        id="entity_despawned",
+    ),
+    pytest.param(
+        lambda: aggregate_changed("brick", "<", 10),
+        ExpectedType.AGGREGATE_CHANGED,
+        {"entity_type": "brick", "comparison": "<", "value": 10},
+        id="aggregate_changed",
+    ),
+    pytest.param(
+        lambda: in_state("player", "state", "alive"),
+        ExpectedType.IN_STATE,
+        {"entity": "player", "component": "state", "state": "alive"},
+        id="in_state",
+    ),
+    pytest.param(
+        lambda: event_emitted("score_change", involving=["player"]),
+        ExpectedType.EVENT_EMITTED,
+        {"event_type": "score_change", "involving": ["player"]},
+        id="event_emitted",
+    ),
+    pytest.param(
+        lambda: event_emitted("game_over"),
+        ExpectedType.EVENT_EMITTED,
+        {"event_type": "game_over"},
+        id="event_emitted_no_involving",
+    ),
+]
+
+
 # ---------------------------------------------------------------------------
 # Trigger construction and round-trip
 # ---------------------------------------------------------------------------
@@ -45,50 +156,17 @@ from nomai.intents import (
 class TestTrigger:
     """Tests for Trigger and its constructor functions."""
 
-    def test_collision(self) -> None:
-        t = collision("ball", "paddle")
-        assert t.type == TriggerType.COLLISION
-        assert t.params["entity_a"] == "ball"
-        assert t.params["entity_b"] == "paddle"
-        assert t.children == []
-
-    def test_state_transition(self) -> None:
-        t = state_transition("player", "alive", "dead")
-        assert t.type == TriggerType.STATE_TRANSITION
-        assert t.params["entity"] == "player"
-        assert t.params["from_state"] == "alive"
-        assert t.params["to_state"] == "dead"
-
-    def test_aggregate_condition(self) -> None:
-        t = aggregate_condition("brick", "==", 0)
-        assert t.type == TriggerType.AGGREGATE_CONDITION
-        assert t.params["entity_type"] == "brick"
-        assert t.params["comparison"] == "=="
-        assert t.params["value"] == 0
-
-    def test_component_condition(self) -> None:
-        t = component_condition("ball", "velocity", "dx", ">", 0)
-        assert t.type == TriggerType.COMPONENT_CONDITION
-        assert t.params["entity"] == "ball"
-        assert t.params["component"] == "velocity"
-        assert t.params["field"] == "dx"
-
-    def test_event_occurred(self) -> None:
-        t = event_occurred("collision", involving=["ball", "brick"])
-        assert t.type == TriggerType.EVENT_OCCURRED
-        assert t.params["event_type"] == "collision"
-        assert t.params["involving"] == ["ball", "brick"]
-
-    def test_event_occurred_no_involving(self) -> None:
-        t = event_occurred("level_up")
-        assert t.type == TriggerType.EVENT_OCCURRED
-        assert t.params["event_type"] == "level_up"
-        assert "involving" not in t.params
-
-    def test_tick_reached(self) -> None:
-        t = tick_reached(100)
-        assert t.type == TriggerType.TICK_REACHED
-        assert t.params["tick"] == 100
+    @pytest.mark.parametrize(("make", "expected_type", "expected_params"), _TRIGGER_LEAF_CASES)
+    def test_leaf_constructor(
+        self,
+        make: Callable[[], Trigger],
+        expected_type: TriggerType,
+        expected_params: dict[str, object],
+    ) -> None:
+        t = make()
+        assert t.type == expected_type
+        assert t.params == expected_params
+        assert t.children == ()
 
     def test_and_composite(self) -> None:
         t = and_(
@@ -115,7 +193,7 @@ class TestTrigger:
         restored = Trigger.from_dict(d)
         assert restored.type == original.type
         assert restored.params == original.params
-        assert restored.children == []
+        assert restored.children == ()
 
     def test_to_dict_roundtrip_composite(self) -> None:
         """Composite trigger round-trips through to_dict/from_dict."""
@@ -128,11 +206,7 @@ class TestTrigger:
         )
         d = original.to_dict()
         restored = Trigger.from_dict(d)
-        assert restored.type == TriggerType.AND
-        assert len(restored.children) == 2
-        assert restored.children[0].type == TriggerType.COLLISION
-        assert restored.children[1].type == TriggerType.OR
-        assert len(restored.children[1].children) == 2
+        assert restored == original
 
     def test_json_roundtrip(self) -> None:
         """Trigger survives full JSON serialize/deserialize."""
@@ -143,8 +217,7 @@ class TestTrigger:
         json_str = json.dumps(original.to_dict())
         data = json.loads(json_str)
         restored = Trigger.from_dict(data)
-        assert restored.type == original.type
-        assert len(restored.children) == len(original.children)
+        assert restored == original
 
     def test_after_trigger(self) -> None:
         """After trigger wraps a child trigger with a tick delay."""
@@ -166,11 +239,28 @@ class TestTrigger:
     def test_frozen(self) -> None:
         """Trigger is immutable."""
         t = collision("a", "b")
-        try:
+        with pytest.raises(FrozenInstanceError):
             t.type = TriggerType.AND  # type: ignore[misc]
-            assert False, "Should have raised FrozenInstanceError"
-        except AttributeError:
-            pass
+
+    def test_to_dict_returns_independent_copies(self) -> None:
+        """Mutating a to_dict result does not leak into later calls."""
+        t = collision("ball", "paddle")
+        d = t.to_dict()
+        d["params"]["entity_a"] = "HACK"  # type: ignore[index]
+        assert t.to_dict()["params"]["entity_a"] == "ball"  # type: ignore[index]
+        assert Trigger.from_dict(t.to_dict()) == t
+
+    def test_from_dict_deep_tree_does_not_recurse(self) -> None:
+        """from_dict handles nesting deeper than the interpreter recursion limit."""
+        depth = sys.getrecursionlimit() + 100
+        d: dict[str, object] = {"type": "tick_reached", "params": {"tick": 1}, "children": []}
+        for _ in range(depth):
+            d = {"type": "and", "params": {}, "children": [d]}
+        node = Trigger.from_dict(d)
+        for _ in range(depth):
+            assert node.type == TriggerType.AND
+            node = node.children[0]
+        assert node.type == TriggerType.TICK_REACHED
 
 
 # ---------------------------------------------------------------------------
@@ -180,46 +270,17 @@ class TestTrigger:
 class TestExpected:
     """Tests for Expected and its constructor functions."""
 
-    def test_component_changed(self) -> None:
-        e = component_changed("ball", "position", field_name="y")
-        assert e.type == ExpectedType.COMPONENT_CHANGED
-        assert e.params["entity"] == "ball"
-        assert e.params["component"] == "position"
-        assert e.params["field"] == "y"
-
-    def test_component_changed_with_value(self) -> None:
-        e = component_changed("score", "value", expected_value=100)
-        assert e.params["expected_value"] == 100
-
-    def test_entity_despawned(self) -> None:
-        e = entity_despawned("brick_0")
-        assert e.type == ExpectedType.ENTITY_DESPAWNED
-        assert e.params["entity"] == "brick_0"
-
-    def test_aggregate_changed(self) -> None:
-        e = aggregate_changed("brick", "<", 10)
-        assert e.type == ExpectedType.AGGREGATE_CHANGED
-        assert e.params["entity_type"] == "brick"
-        assert e.params["comparison"] == "<"
-        assert e.params["value"] == 10
-
-    def test_in_state(self) -> None:
-        e = in_state("player", "state", "alive")
-        assert e.type == ExpectedType.IN_STATE
-        assert e.params["entity"] == "player"
-        assert e.params["component"] == "state"
-        assert e.params["state"] == "alive"
-
-    def test_event_emitted(self) -> None:
-        e = event_emitted("score_change", involving=["player"])
-        assert e.type == ExpectedType.EVENT_EMITTED
-        assert e.params["event_type"] == "score_change"
-        assert e.params["involving"] == ["player"]
-
-    def test_event_emitted_no_involving(self) -> None:
-        e = event_emitted("game_over")
-        assert e.type == ExpectedType.EVENT_EMITTED
-        assert "involving" not in e.params
+    @pytest.mark.parametrize(("make", "expected_type", "expected_params"), _EXPECTED_LEAF_CASES)
+    def test_leaf_constructor(
+        self,
+        make: Callable[[], Expected],
+        expected_type: ExpectedType,
+        expected_params: dict[str, object],
+    ) -> None:
+        e = make()
+        assert e.type == expected_type
+        assert e.params == expected_params
+        assert e.children == ()
 
     def test_all_composite(self) -> None:
         e = all_(
@@ -254,9 +315,7 @@ class TestExpected:
         )
         d = original.to_dict()
         restored = Expected.from_dict(d)
-        assert restored.type == ExpectedType.ALL
-        assert len(restored.children) == 2
-        assert restored.children[1].type == ExpectedType.ANY
+        assert restored == original
 
     def test_json_roundtrip(self) -> None:
         original = all_(
@@ -266,16 +325,12 @@ class TestExpected:
         json_str = json.dumps(original.to_dict())
         data = json.loads(json_str)
         restored = Expected.from_dict(data)
-        assert restored.type == original.type
-        assert len(restored.children) == 2
+        assert restored == original
 
     def test_frozen(self) -> None:
         e = entity_despawned("brick")
-        try:
+        with pytest.raises(FrozenInstanceError):
             e.type = ExpectedType.ALL  # type: ignore[misc]
-            assert False, "Should have raised FrozenInstanceError"
-        except AttributeError:
-            pass
 
 
 # ---------------------------------------------------------------------------
@@ -295,13 +350,13 @@ class TestIntentSpec:
             entity_role="paddle",
             must_exist=True,
             must_be_visible=True,
-            required_components=["position", "size"],
+            required_components=_PADDLE_COMPONENTS,
         )
         assert spec.name == "paddle_exists"
         assert spec.kind == IntentKind.ENTITY
         assert spec.entity_type == "character"
         assert spec.entity_role == "paddle"
-        assert spec.required_components == ["position", "size"]
+        assert spec.required_components == ("position", "size")
 
     def test_behavior_intent(self) -> None:
         """Construct a behavior intent spec."""
@@ -329,13 +384,13 @@ class TestIntentSpec:
             metric_entity="ball",
             metric_component="velocity",
             metric_field="dx",
-            metric_range=(-10.0, 10.0),
+            metric_range=_BALL_SPEED_RANGE,
         )
         assert spec.kind == IntentKind.METRIC
         assert spec.metric_entity == "ball"
         assert spec.metric_component == "velocity"
         assert spec.metric_field == "dx"
-        assert spec.metric_range == (-10.0, 10.0)
+        assert spec.metric_range == _BALL_SPEED_RANGE
 
     def test_invariant_intent(self) -> None:
         """Construct an invariant intent spec."""
@@ -358,7 +413,7 @@ class TestIntentSpec:
             entity_role="paddle",
             must_exist=True,
             must_be_visible=True,
-            required_components=["position", "size"],
+            required_components=_PADDLE_COMPONENTS,
         )
         d = original.to_dict()
         restored = IntentSpec.from_dict(d)
@@ -397,7 +452,7 @@ class TestIntentSpec:
             metric_entity="ball",
             metric_component="velocity",
             metric_field="dx",
-            metric_range=(-10.0, 10.0),
+            metric_range=_BALL_SPEED_RANGE,
         )
         d = original.to_dict()
         restored = IntentSpec.from_dict(d)
@@ -407,8 +462,8 @@ class TestIntentSpec:
         assert restored.metric_component == original.metric_component
         assert restored.metric_field == original.metric_field
         assert restored.metric_range is not None
-        assert abs(restored.metric_range[0] - (-10.0)) < 1e-10
-        assert abs(restored.metric_range[1] - 10.0) < 1e-10
+        assert restored.metric_range[0] == -10.0
+        assert restored.metric_range[1] == 10.0
 
     def test_invariant_to_dict_roundtrip(self) -> None:
         original = IntentSpec(
@@ -478,7 +533,7 @@ class TestVerificationSuite:
                     description="Paddle exists with correct role",
                     entity_type="character",
                     entity_role="paddle",
-                    required_components=["position", "size"],
+                    required_components=_PADDLE_COMPONENTS,
                 ),
                 IntentSpec(
                     name="ball_exists",
@@ -486,7 +541,7 @@ class TestVerificationSuite:
                     description="Ball exists with correct role",
                     entity_type="projectile",
                     entity_role="ball",
-                    required_components=["position", "velocity"],
+                    required_components=_BALL_COMPONENTS,
                 ),
                 IntentSpec(
                     name="ball_bounces",
@@ -503,13 +558,13 @@ class TestVerificationSuite:
                     metric_entity="ball",
                     metric_component="velocity",
                     metric_field="dx",
-                    metric_range=(-10.0, 10.0),
+                    metric_range=_BALL_SPEED_RANGE,
                 ),
                 IntentSpec(
                     name="ball_in_bounds",
                     kind=IntentKind.INVARIANT,
                     description="Ball position within bounds every tick",
-                    condition="entity('ball').position.x >= 0 and entity('ball').position.x <= 800 and entity('ball').position.y >= 0 and entity('ball').position.y <= 600",
+                    condition=_BALL_BOUNDS_CONDITION,
                 ),
             ],
         )
@@ -591,7 +646,7 @@ class TestBreakoutIntents:
             entity_role="paddle",
             must_exist=True,
             must_be_visible=True,
-            required_components=["position", "size"],
+            required_components=_PADDLE_COMPONENTS,
         )
         assert spec.entity_role == "paddle"
         assert spec.must_exist is True
@@ -600,7 +655,7 @@ class TestBreakoutIntents:
         json_str = spec.to_json()
         restored = IntentSpec.from_json(json_str)
         assert restored.entity_role == "paddle"
-        assert restored.required_components == ["position", "size"]
+        assert restored.required_components == ("position", "size")
 
     def test_ball_entity_intent(self) -> None:
         """Entity: ball exists with role 'ball'."""
@@ -612,7 +667,7 @@ class TestBreakoutIntents:
             entity_role="ball",
             must_exist=True,
             must_be_visible=True,
-            required_components=["position", "velocity"],
+            required_components=_BALL_COMPONENTS,
         )
         assert spec.entity_role == "ball"
 
@@ -657,9 +712,9 @@ class TestBreakoutIntents:
             metric_entity="ball",
             metric_component="velocity",
             metric_field="dx",
-            metric_range=(-10.0, 10.0),
+            metric_range=_BALL_SPEED_RANGE,
         )
-        assert spec.metric_range == (-10.0, 10.0)
+        assert spec.metric_range == _BALL_SPEED_RANGE
 
         json_str = spec.to_json()
         restored = IntentSpec.from_json(json_str)
@@ -673,84 +728,24 @@ class TestBreakoutIntents:
             name="ball_in_bounds",
             kind=IntentKind.INVARIANT,
             description="Ball position must stay within game bounds (0-800 x, 0-600 y) every tick",
-            condition=(
-                "entity('ball').position.x >= 0 and "
-                "entity('ball').position.x <= 800 and "
-                "entity('ball').position.y >= 0 and "
-                "entity('ball').position.y <= 600"
-            ),
+            condition=_BALL_BOUNDS_CONDITION,
         )
-        assert "position.x >= 0" in (spec.condition or "")
-        assert "position.y <= 600" in (spec.condition or "")
+        cond = spec.condition or ""
+        assert all(s in cond for s in _REQUIRED_BOUND_SUBSTRINGS)
 
         json_str = spec.to_json()
         restored = IntentSpec.from_json(json_str)
         assert restored.condition is not None
-        assert "800" in restored.condition
+        assert all(s in restored.condition for s in _REQUIRED_BOUND_SUBSTRINGS)
 
-    def test_complete_breakout_suite(self) -> None:
+    def test_complete_breakout_suite(
+        self, dsl_breakout_suite: VerificationSuite, dsl_breakout_suite_json: str,
+    ) -> None:
         """Build and serialize a complete breakout verification suite."""
-        suite = VerificationSuite(
-            name="breakout_verification",
-            description="Complete verification suite for the breakout clone",
-            intents=[
-                # Entity intents
-                IntentSpec(
-                    name="paddle_exists",
-                    kind=IntentKind.ENTITY,
-                    description="Paddle entity must exist",
-                    entity_type="character",
-                    entity_role="paddle",
-                    required_components=["position", "size"],
-                ),
-                IntentSpec(
-                    name="ball_exists",
-                    kind=IntentKind.ENTITY,
-                    description="Ball entity must exist",
-                    entity_type="projectile",
-                    entity_role="ball",
-                    required_components=["position", "velocity"],
-                ),
-                # Behavior intent
-                IntentSpec(
-                    name="ball_bounces_off_paddle",
-                    kind=IntentKind.BEHAVIOR,
-                    description="Ball bounces when hitting paddle",
-                    trigger=collision("ball", "paddle"),
-                    expected=component_changed("ball", "position", field_name="y"),
-                    timeout_ticks=120,
-                ),
-                # Metric intent
-                IntentSpec(
-                    name="ball_speed_x_bounded",
-                    kind=IntentKind.METRIC,
-                    description="Ball speed.x in [-10, 10]",
-                    metric_entity="ball",
-                    metric_component="velocity",
-                    metric_field="dx",
-                    metric_range=(-10.0, 10.0),
-                ),
-                # Invariant intent
-                IntentSpec(
-                    name="ball_in_bounds",
-                    kind=IntentKind.INVARIANT,
-                    description="Ball stays in game bounds",
-                    condition=(
-                        "entity('ball').position.x >= 0 and "
-                        "entity('ball').position.x <= 800 and "
-                        "entity('ball').position.y >= 0 and "
-                        "entity('ball').position.y <= 600"
-                    ),
-                ),
-            ],
-        )
-
-        # Serialize and restore
-        json_str = suite.to_json()
+        json_str = dsl_breakout_suite_json
         restored = VerificationSuite.from_json(json_str)
 
-        assert restored.name == "breakout_verification"
-        assert len(restored.intents) == 5
+        assert restored == dsl_breakout_suite
 
         # Verify each kind
         kinds = [i.kind for i in restored.intents]
@@ -761,6 +756,8 @@ class TestBreakoutIntents:
             IntentKind.METRIC,
             IntentKind.INVARIANT,
         ]
+        cond = restored.intents[4].condition or ""
+        assert all(s in cond for s in _REQUIRED_BOUND_SUBSTRINGS)
 
         # Verify the JSON is valid and parseable
         parsed = json.loads(json_str)
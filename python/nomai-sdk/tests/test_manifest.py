@@ -6,7 +6,11 @@ the exact JSON format that the Rust engine produces via ``serde_json``.
 
 from __future__ import annotations
 
-import json
+import io
+import pickle
+from dataclasses import asdict, fields, replace
+
+import pytest
 
 from nomai.manifest import (
     Aggregates,
@@ -24,22 +28,28 @@ from nomai.manifest import (
 # ComponentChange
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(scope="module")
+def base_change() -> ComponentChange:
+    """A frozen modification change shared by the ComponentChange tests."""
+    return ComponentChange(
+        entity_id=42,
+        component_type_name="health",
+        old_value=100,
+        new_value=75,
+        changed_by_system=1,
+        reason_type="GameRule",
+        reason_detail="damage_applied",
+        command_index=0,
+        tick=5,
+    )
+
+
 class TestComponentChange:
     """Tests for ComponentChange dataclass."""
 
-    def test_construction_modification(self) -> None:
+    def test_construction_modification(self, base_change: ComponentChange) -> None:
         """A modification change has both old_value and new_value."""
-        change = ComponentChange(
-            entity_id=42,
-            component_type_name="health",
-            old_value=100,
-            new_value=75,
-            changed_by_system=1,
-            reason_type="GameRule",
-            reason_detail="damage_applied",
-            command_index=0,
-            tick=5,
-        )
+        change = base_change
         assert change.entity_id == 42
         assert change.component_type_name == "health"
         assert change.old_value == 100
@@ -50,61 +60,57 @@ class TestComponentChange:
         assert change.command_index == 0
         assert change.tick == 5
 
-    def test_construction_spawn(self) -> None:
+    def test_reason_payload_cache_is_not_a_field(
+        self, base_change: ComponentChange,
+    ) -> None:
+        """The cached reason payload stays out of fields()/asdict() but pickles."""
+        assert base_change.reason_payload == "damage_applied"
+        assert "_reason_payload" not in {f.name for f in fields(ComponentChange)}
+        assert "_reason_payload" not in asdict(base_change)
+        restored = pickle.loads(pickle.dumps(base_change))
+        assert restored == base_change
+        assert restored.reason_payload == "damage_applied"
+
+    def test_construction_spawn(self, base_change: ComponentChange) -> None:
         """A spawn change has old_value=None."""
-        change = ComponentChange(
+        change = replace(
+            base_change,
             entity_id=0,
             component_type_name="position",
             old_value=None,
             new_value={"x": 10.0, "y": 20.0},
-            changed_by_system=1,
-            reason_type="GameRule",
             reason_detail="player_spawn",
-            command_index=0,
             tick=1,
         )
         assert change.old_value is None
         assert change.new_value == {"x": 10.0, "y": 20.0}
 
-    def test_construction_removal(self) -> None:
+    def test_construction_removal(self, base_change: ComponentChange) -> None:
         """A removal/despawn change has new_value=None."""
-        change = ComponentChange(
+        change = replace(
+            base_change,
             entity_id=3,
-            component_type_name="health",
             old_value=0,
             new_value=None,
             changed_by_system=100,
-            reason_type="GameRule",
             reason_detail="entity_destroyed",
-            command_index=0,
             tick=10,
         )
         assert change.old_value == 0
         assert change.new_value is None
 
-    def test_frozen(self) -> None:
+    def test_frozen(self, base_change: ComponentChange) -> None:
         """ComponentChange is immutable."""
-        change = ComponentChange(
-            entity_id=0,
-            component_type_name="health",
-            old_value=100,
-            new_value=50,
-            changed_by_system=0,
-            reason_type="GameRule",
-            reason_detail="test",
-            command_index=0,
-            tick=1,
-        )
         try:
-            change.tick = 99  # type: ignore[misc]
+            base_change.tick = 99  # type: ignore[misc]
             assert False, "Should have raised FrozenInstanceError"
         except AttributeError:
             pass
 
-    def test_to_dict_roundtrip(self) -> None:
+    def test_to_dict_roundtrip(self, base_change: ComponentChange) -> None:
         """to_dict -> from_dict produces an equivalent object."""
-        original = ComponentChange(
-            entity_id=42,
+        original = replace(
+            base_change,
             component_type_name="position",
             old_value={"x": 0.0, "y": 0.0},
             new_value={"x": 1.0, "y": 0.0},
@@ -160,6 +166,7 @@ class TestComponentChange:
         change = ComponentChange.from_dict(rust_json)
         assert change.reason_type == "CollisionResponse"
         assert change.reason_detail == "[0,1]"
+        assert change.reason_payload == [0, 1]
 
     def test_state_transition_reason(self) -> None:
         """Parse StateTransition causal reason (object payload)."""
@@ -175,10 +182,74 @@ class TestComponentChange:
         }
         change = ComponentChange.from_dict(rust_json)
         assert change.reason_type == "StateTransition"
-        # Detail is JSON-encoded dict
-        detail_parsed = json.loads(change.reason_detail)
-        assert detail_parsed["from"] == "grounded"
-        assert detail_parsed["to"] == "airborne"
+        # Detail is the compact JSON-encoded dict; the payload keeps the dict
+        assert change.reason_detail == '{"from":"grounded","to":"airborne"}'
+        assert change.reason_payload == {"from": "grounded", "to": "airborne"}
+
+    def test_reason_payload_decoded_from_detail(self) -> None:
+        """Directly constructed changes decode the payload from reason_detail."""
+        change = ComponentChange(
+            entity_id=5,
+            component_type_name="state",
+            old_value="grounded",
+            new_value="airborne",
+            changed_by_system=3,
+            reason_type="StateTransition",
+            reason_detail='{"from":"grounded","to":"airborne"}',
+            command_index=2,
+            tick=10,
+        )
+        assert change.reason_payload == {"from": "grounded", "to": "airborne"}
+        assert change.to_dict()["reason"] == {
+            "StateTransition": {"from": "grounded", "to": "airborne"},
+        }
+
+    def test_reason_payload_does_not_alias(self) -> None:
+        """Mutating from_dict input or to_dict output leaves the payload intact."""
+        reason = {"StateTransition": {"from": "grounded", "to": "airborne"}}
+        change = ComponentChange.from_dict({
+            "entity_id": 5,
+            "component_type_name": "state",
+            "old_value": "grounded",
+            "new_value": "airborne",
+            "changed_by": 3,
+            "reason": reason,
+            "command_index": 2,
+            "tick": 10,
+        })
+        reason["StateTransition"]["to"] = "swimming"
+        change.to_dict()["reason"]["StateTransition"]["from"] = "falling"  # type: ignore[index]
+        change.reason_payload["to"] = "diving"  # type: ignore[index]
+
+        assert change.reason_payload == {"from": "grounded", "to": "airborne"}
+
+    def test_unstructured_reason_payload_matches_construction(self) -> None:
+        """A compound value under a string-payload tag round-trips as its JSON text."""
+        data = {
+            "entity_id": 1,
+            "component_type_name": "health",
+            "old_value": 1,
+            "new_value": 0,
+            "changed_by": 3,
+            "reason": {"GameRule": {"rule": "damage"}},
+            "command_index": 0,
+            "tick": 1,
+        }
+        parsed = ComponentChange.from_dict(data)
+        direct = ComponentChange(
+            entity_id=1,
+            component_type_name="health",
+            old_value=1,
+            new_value=0,
+            changed_by_system=3,
+            reason_type="GameRule",
+            reason_detail='{"rule":"damage"}',
+            command_index=0,
+            tick=1,
+        )
+
+        assert parsed.to_dict() == direct.to_dict()
+        assert parsed.reason_payload == '{"rule":"damage"}'
 
 
 # ---------------------------------------------------------------------------
@@ -243,6 +314,23 @@ class TestGameEvent:
         assert restored.reason_detail == original.reason_detail
         assert restored.tick == original.tick
 
+    def test_parsed_strings_are_interned(self) -> None:
+        """Repeated event_type / reason tags share one string object."""
+        def parse() -> GameEvent:
+            # Built at runtime so the two inputs are distinct objects.
+            return GameEvent.from_dict({
+                "event_type": "".join(["colli", "sion"]),
+                "description": "hit",
+                "involved_entities": [],
+                "caused_by": 1,
+                "reason": {"".join(["Game", "Rule"]): "hit"},
+                "tick": 0,
+            })
+
+        first, second = parse(), parse()
+        assert first.event_type is second.event_type
+        assert first.reason_type is second.reason_type
+
     def test_from_rust_json(self) -> None:
         """Parse the exact JSON that Rust serde_json produces."""
         rust_json = {
@@ -433,6 +521,18 @@ class TestEntityEntry:
         assert restored.spawned_at_tick == original.spawned_at_tick
         assert restored.despawned_at_tick == original.despawned_at_tick
 
+    def test_hash_matches_equality(self) -> None:
+        """Equal entries hash equally, including after a pickle round-trip."""
+        a = EntityEntry(
+            entity_id=5, tier="Semantic", entity_type="character", role="enemy",
+            alive=True, spawned_at_tick=3, despawned_at_tick=None,
+        )
+        b = EntityEntry.from_dict(a.to_dict())
+        assert a == b
+        assert hash(a) == hash(b) == hash(a)
+        assert len({a, b}) == 1
+        assert hash(pickle.loads(pickle.dumps(a))) == hash(a)
+
 
 # ---------------------------------------------------------------------------
 # TickManifest
@@ -585,9 +685,8 @@ class TestTickManifest:
             commands_succeeded=2,
         )
 
-        json_str = original.to_json()
-        data = json.loads(json_str)
-        restored = TickManifest.from_json(data)
+        json_bytes = original.to_json().encode("utf-8")
+        restored = TickManifest.from_json(json_bytes)
 
         assert restored.tick == original.tick
         assert abs(restored.sim_time - original.sim_time) < 1e-15
@@ -679,6 +778,82 @@ class TestTickManifest:
         assert manifest.entity_spawns[2] == 8589934592
         assert manifest.aggregates.total_entity_count == 3
 
+    def test_from_ndjson_stream(self) -> None:
+        """NDJSON tick logs are parsed lazily, one manifest per line."""
+        ticks = [
+            TickManifest.from_dict({"tick": 1, "entity_spawns": [0]}),
+            TickManifest.from_dict({"tick": 2, "entity_despawns": [0]}),
+        ]
+        log = "\n".join(m.to_json(indent=None) for m in ticks) + "\n\n"
+        stream = TickManifest.from_ndjson_stream(io.BytesIO(log.encode("utf-8")))
+
+        first = next(stream)
+        assert first.tick == 1
+        assert first.entity_spawns == [0]
+        rest = list(stream)
+        assert [m.tick for m in rest] == [2]
+        assert rest[0].entity_despawns == [0]
+
+    def test_changes_for_and_events_for(self) -> None:
+        """Per-type lookups return matching records in manifest order."""
+        def change(component: str, entity_id: int) -> dict[str, object]:
+            return {
+                "entity_id": entity_id,
+                "component_type_name": component,
+                "old_value": None,
+                "new_value": 1,
+                "changed_by": 1,
+                "reason": {"GameRule": "test"},
+                "command_index": 0,
+                "tick": 3,
+            }
+
+        manifest = TickManifest.from_dict({
+            "tick": 3,
+            "component_changes": [
+                change("position", 0),
+                change("velocity", 0),
+                change("position", 1),
+            ],
+            "events": [
+                {
+                    "event_type": "collision",
+                    "description": "hit",
+                    "involved_entities": [0, 1],
+                    "caused_by": 1,
+                    "reason": {"GameRule": "hit"},
+                    "tick": 3,
+                },
+            ],
+        })
+
+        assert [c.entity_id for c in manifest.changes_for("position")] == [0, 1]
+        assert len(manifest.changes_for("velocity")) == 1
+        assert list(manifest.changes_for("health")) == []
+        assert len(manifest.events_for("collision")) == 1
+        assert list(manifest.events_for("score")) == []
+        # The lazily built index does not take part in equality.
+        assert manifest == TickManifest.from_dict(manifest.to_dict())
+
+        # Mutating the lists after a lookup is picked up by the next one.
+        manifest.component_changes.append(ComponentChange.from_dict(change("health", 2)))
+        manifest.events.clear()
+        assert [c.entity_id for c in manifest.changes_for("health")] == [2]
+        assert list(manifest.events_for("collision")) == []
+
+    def test_lookup_indexes_are_not_fields(self) -> None:
+        """The per-type indexes stay out of fields(), asdict() and pickles."""
+        manifest = TickManifest.from_dict({"tick": 1})
+        manifest.changes_for("position")
+        manifest.events_for("collision")
+
+        names = {f.name for f in fields(TickManifest)}
+        assert not names & {"_changes_index", "_events_index"}
+        assert set(asdict(manifest)) == names
+        restored = pickle.loads(pickle.dumps(manifest))
+        assert restored == manifest
+        assert not hasattr(restored, "_changes_index")
+
 
 # ---------------------------------------------------------------------------
 # DiagnosticEntry
@@ -877,9 +1052,7 @@ class TestTickManifestDiagnostics:
                 ),
             ],
         )
-        json_str = original.to_json()
-        data = json.loads(json_str)
-        restored = TickManifest.from_json(data)
+        restored = TickManifest.from_json(original.to_json())
 
         assert len(restored.diagnostics) == 1
         assert restored.diagnostics[0].severity == "warning"
@@ -13,6 +13,7 @@ import logging
 import pytest
 from nomai.engine import NomaiEngine
 from nomai.manifest import TickManifest, EntityEntry, CausalChain
+from nomai.predicates import EntityCountAtLeast, EntityCountAtMost, TickAtLeast
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +61,20 @@ class TestMilestoneWeek34:
             assert isinstance(m, TickManifest)
             assert m.tick == i
 
+    def test_run_ticks_stream_is_lazy(self) -> None:
+        """run_ticks_stream only advances the engine as it is consumed."""
+        engine = NomaiEngine(headless=True)
+        engine.register_component("counter")
+
+        stream = engine.run_ticks_stream(10)
+        assert len(stream) == 10
+        assert engine.tick_count == 0
+        assert next(stream).tick == 0
+        assert engine.tick_count == 1
+        assert len(stream) == 9
+        assert [m.tick for m in stream] == list(range(1, 10))
+        assert engine.tick_count == 10
+
     def test_entity_index_tracks_spawns(self) -> None:
         """Entity index tracks spawned entities with identity info."""
         engine = NomaiEngine(headless=True)
@@ -72,7 +87,7 @@ class TestMilestoneWeek34:
 
         index = engine.entity_index()
         assert len(index) >= 1
-        bullet = [e for e in index if e.entity_type == "projectile"]
+        bullet = engine.entity_index(entity_type="projectile")
         assert len(bullet) == 1
         assert bullet[0].role == "bullet"
         assert bullet[0].alive is True
@@ -101,8 +116,7 @@ class TestMilestoneWeek34:
         engine.tick()  # Apply spawn
 
         # Get entity ID from index.
-        index = engine.entity_index()
-        hero = [e for e in index if e.role == "hero"][0]
+        hero = next(e for e in engine.entity_index() if e.role == "hero")
 
         engine.set_component(hero.entity_id, "score", 100)
         manifest = engine.tick()  # Apply set_component
@@ -122,6 +136,17 @@ class TestMilestoneWeek34:
 
         history = engine.manifest_history()
         assert len(history) == 20
+        assert history[0].tick == 0
+        assert history[-1].tick == 19
+        assert [m.tick for m in history[-3:]] == [17, 18, 19]
+
+        # The lazy view sees the same window and follows later ticks.
+        view = engine.manifest_history_view()
+        assert len(view) == 20
+        assert view[-1].tick == 19
+        engine.tick()
+        assert view[-1].tick == 20
+        assert history[-1].tick == 19
 
         # Each tick is accessible by number.
         for tick_num in range(20):
@@ -140,8 +165,7 @@ class TestMilestoneWeek34:
         engine.tick()  # Apply spawn (tick 0)
 
         # Get entity ID.
-        index = engine.entity_index()
-        mover = [e for e in index if e.role == "mover"][0]
+        mover = next(e for e in engine.entity_index() if e.role == "mover")
 
         # Move the entity.
         engine.set_component(mover.entity_id, "position", {"x": 5.0, "y": 10.0})
@@ -158,7 +182,19 @@ class TestMilestoneWeek34:
         assert chain.steps[0].reason_detail == "python_set"
 
     def test_run_until_with_condition(self) -> None:
-        """run_until stops when the condition is met."""
+        """run_until stops when a native predicate is met."""
+        engine = NomaiEngine(headless=True)
+        engine.register_component("counter")
+
+        manifests = engine.run_until(
+            condition=TickAtLeast(5),
+            max_ticks=100,
+        )
+        assert len(manifests) == 6  # ticks 0-5
+        assert manifests[-1].tick == 5
+
+    def test_run_until_with_python_callable(self) -> None:
+        """Arbitrary callables fall back to per-tick evaluation in Python."""
         engine = NomaiEngine(headless=True)
         engine.register_component("counter")
 
@@ -169,6 +205,35 @@ class TestMilestoneWeek34:
         assert len(manifests) == 6  # ticks 0-5
         assert manifests[-1].tick == 5
 
+    def test_run_until_native_allows_large_max_ticks(self) -> None:
+        """A native predicate accepts any max_ticks the callable path does."""
+        native = NomaiEngine(headless=True).run_until(TickAtLeast(3), max_ticks=1_000_000)
+        python = NomaiEngine(headless=True).run_until(
+            lambda m: m.tick >= 3, max_ticks=1_000_000,
+        )
+        assert [m.tick for m in native] == [m.tick for m in python] == [0, 1, 2, 3]
+
+    @pytest.mark.parametrize(
+        ("predicate", "max_ticks"),
+        [
+            (TickAtLeast(-1), 10),
+            (EntityCountAtLeast(-5), 10),
+            (EntityCountAtMost(-1), 3),
+            (TickAtLeast(2), -1),
+        ],
+    )
+    def test_run_until_native_matches_callable_on_negative_values(
+        self,
+        predicate: TickAtLeast | EntityCountAtLeast | EntityCountAtMost,
+        max_ticks: int,
+    ) -> None:
+        """Negative thresholds or max_ticks behave as with a plain callable."""
+        native = NomaiEngine(headless=True).run_until(predicate, max_ticks=max_ticks)
+        python = NomaiEngine(headless=True).run_until(
+            lambda m: predicate(m), max_ticks=max_ticks,
+        )
+        assert [m.tick for m in native] == [m.tick for m in python]
+
     def test_100_ticks_end_to_end(self) -> None:
         """Full 100-tick simulation with spawns, mutations, and manifest queries."""
         engine = NomaiEngine(headless=True)
@@ -176,31 +241,30 @@ class TestMilestoneWeek34:
         engine.register_component("health")
         engine.register_component("score")
 
-        # Spawn 10 entities.
-        for i in range(10):
-            engine.spawn_entity("unit", f"soldier_{i}", {
+        # Spawn 10 entities in one batch.
+        engine.spawn_entities(
+            ("unit", f"soldier_{i}", {
                 "position": {"x": float(i), "y": 0.0},
                 "health": 100,
                 "score": 0,
             })
+            for i in range(10)
+        )
 
-        manifests = engine.run_ticks(100)
-        assert len(manifests) == 100
-
-        # Verify spawns appeared in first tick.
-        assert len(manifests[0].entity_spawns) == 10
+        # Stream the run so only one manifest is alive at a time.
+        ticks_seen = 0
+        for i, m in enumerate(engine.run_ticks_stream(100)):
+            # Verify spawns appeared in first tick.
+            if i == 0:
+                assert len(m.entity_spawns) == 10
+            # Verify manifests have correct tick numbers and valid aggregates.
+            assert m.tick == i
+            assert m.aggregates.total_entity_count >= 0
+            ticks_seen += 1
+        assert ticks_seen == 100
 
         # Verify entity index has all 10.
-        index = engine.entity_index()
-        soldiers = [e for e in index if e.entity_type == "unit"]
+        soldiers = engine.entity_index(entity_type="unit")
         assert len(soldiers) == 10
 
-        # Verify manifests have correct tick numbers.
-        for i, m in enumerate(manifests):
-            assert m.tick == i
-
-        # All manifests have valid aggregates.
-        for m in manifests:
-            assert m.aggregates.total_entity_count >= 0
-
-        logger.info("Milestone PASS: 100 ticks, %d entities tracked", len(index))
+        logger.info("Milestone PASS: 100 ticks, %d entities tracked", len(soldiers))
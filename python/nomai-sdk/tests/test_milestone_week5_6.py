@@ -9,8 +9,12 @@ Validates:
 
 from __future__ import annotations
 
+import copy
+import functools
 from pathlib import Path
 
+import pytest
+
 from nomai.breakout_intents import build_breakout_suite
 from nomai.intents import IntentKind, VerificationSuite
 from nomai.manifest import (
@@ -22,6 +26,7 @@ from nomai.manifest import (
 from nomai.verify import (
     RegressionTest,
     VerificationEngine,
+    VerificationReport,
 )
 
 
@@ -281,6 +286,52 @@ def _build_correct_gameplay_manifests() -> list[TickManifest]:
     return manifests
 
 
+# ---------------------------------------------------------------------------
+# Shared fixtures
+# ---------------------------------------------------------------------------
+#
+# ``VerificationEngine.verify`` only reads its inputs, so the suite, the
+# correct-gameplay manifests, the entity index and the engine itself are
+# built once per session. Tests must not mutate them.
+
+
+@pytest.fixture(scope="session")
+def breakout_suite() -> VerificationSuite:
+    """The full 13-intent breakout suite."""
+    return build_breakout_suite()
+
+
+@pytest.fixture(scope="session")
+def correct_manifests() -> list[TickManifest]:
+    """Manifests for a correct breakout playthrough."""
+    return _build_correct_gameplay_manifests()
+
+
+@pytest.fixture(scope="session")
+def entity_index() -> dict[str, dict[str, str]]:
+    """Entity index for the breakout scene."""
+    return _breakout_entity_index()
+
+
+@pytest.fixture(scope="session")
+def verification_engine() -> VerificationEngine:
+    """A stateless engine shared by every test."""
+    return VerificationEngine()
+
+
+@pytest.fixture(scope="session")
+def correct_report(
+    breakout_suite: VerificationSuite,
+    correct_manifests: list[TickManifest],
+    entity_index: dict[str, dict[str, str]],
+    verification_engine: VerificationEngine,
+) -> VerificationReport:
+    """The full suite verified once against the correct-gameplay manifests."""
+    return verification_engine.verify(
+        breakout_suite, correct_manifests, entity_index,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Milestone tests
 # ---------------------------------------------------------------------------
@@ -289,54 +340,59 @@ def _build_correct_gameplay_manifests() -> list[TickManifest]:
 class TestCorrectGameplayPasses:
     """1. Correct gameplay -> all breakout intents pass."""
 
-    def test_all_intents_pass_with_correct_gameplay(self) -> None:
+    def test_all_intents_pass_with_correct_gameplay(
+        self, correct_report: VerificationReport,
+    ) -> None:
         """Complete correct gameplay manifests pass all intents."""
-        suite = build_breakout_suite()
-        engine = VerificationEngine()
-        manifests = _build_correct_gameplay_manifests()
-        entity_index = _breakout_entity_index()
-
-        report = engine.verify(suite, manifests, entity_index)
-
-        assert report.all_passed, (
-            f"Expected all intents to pass, but {report.failed} failed:\n"
-            f"{report.diagnosis()}"
+        assert correct_report.all_passed, (
+            f"Expected all intents to pass, but {correct_report.failed} "
+            f"failed:\n"
+            f"{correct_report.diagnosis()}"
         )
 
-    def test_report_has_correct_intent_count(self) -> None:
+    def test_report_has_correct_intent_count(
+        self, correct_report: VerificationReport,
+    ) -> None:
         """Report covers all 13 intents."""
-        suite = build_breakout_suite()
-        engine = VerificationEngine()
-        manifests = _build_correct_gameplay_manifests()
-        entity_index = _breakout_entity_index()
+        assert correct_report.total_intents == 13
+        assert correct_report.passed == 13
+        assert correct_report.failed == 0
 
-        report = engine.verify(suite, manifests, entity_index)
-
-        assert report.total_intents == 13
-        assert report.passed == 13
-        assert report.failed == 0
-
-    def test_report_summary_is_nonempty(self) -> None:
+    def test_report_summary_is_nonempty(
+        self, correct_report: VerificationReport,
+    ) -> None:
         """Report summary is a non-empty string."""
-        suite = build_breakout_suite()
-        engine = VerificationEngine()
-        manifests = _build_correct_gameplay_manifests()
-        entity_index = _breakout_entity_index()
-
-        report = engine.verify(suite, manifests, entity_index)
+        assert len(correct_report.summary()) > 0
 
-        assert len(report.summary()) > 0
-
-    def test_no_suggested_fixes_when_all_pass(self) -> None:
+    def test_no_suggested_fixes_when_all_pass(
+        self, correct_report: VerificationReport,
+    ) -> None:
         """No suggested fixes when all intents pass."""
-        suite = build_breakout_suite()
-        engine = VerificationEngine()
-        manifests = _build_correct_gameplay_manifests()
-        entity_index = _breakout_entity_index()
-
-        report = engine.verify(suite, manifests, entity_index)
+        assert correct_report.suggested_fixes() == []
+
+    def test_verify_does_not_mutate_shared_inputs(
+        self,
+        breakout_suite: VerificationSuite,
+        verification_engine: VerificationEngine,
+        correct_manifests: list[TickManifest],
+        entity_index: dict[str, dict[str, str]],
+    ) -> None:
+        """Sharing the session fixtures is safe: verify() only reads them."""
+        suite_before = breakout_suite.to_dict()
+        manifests_before = [m.to_dict() for m in correct_manifests]
+        index_before = copy.deepcopy(entity_index)
+
+        first = verification_engine.verify(
+            breakout_suite, correct_manifests, entity_index,
+        )
+        second = verification_engine.verify(
+            breakout_suite, correct_manifests, entity_index,
+        )
 
-        assert report.suggested_fixes() == []
+        assert first is not second
+        assert breakout_suite.to_dict() == suite_before
+        assert [m.to_dict() for m in correct_manifests] == manifests_before
+        assert entity_index == index_before
 
 
 class TestBuggyBallDoesNotBounce:
@@ -367,14 +423,18 @@ class TestBuggyBallDoesNotBounce:
             _make_manifest(tick=3, aggregates=_aggregates(brick_count=20)),
         ]
 
-    def test_ball_bounces_off_paddle_fails(self) -> None:
+    def test_ball_bounces_off_paddle_fails(
+        self,
+        breakout_suite: VerificationSuite,
+        verification_engine: VerificationEngine,
+        entity_index: dict[str, dict[str, str]],
+    ) -> None:
         """ball_bounces_off_paddle intent fails when velocity doesn't change."""
-        suite = build_breakout_suite()
-        engine = VerificationEngine()
         manifests = self._build_no_bounce_manifests()
-        entity_index = _breakout_entity_index()
 
-        report = engine.verify(suite, manifests, entity_index)
+        report = verification_engine.verify(
+            breakout_suite, manifests, entity_index,
+        )
 
         # Find the specific intent result
         bounce_result = next(
@@ -384,26 +444,34 @@ class TestBuggyBallDoesNotBounce:
         assert not bounce_result.passed
         assert not report.all_passed
 
-    def test_diagnosis_mentions_failure(self) -> None:
+    def test_diagnosis_mentions_failure(
+        self,
+        breakout_suite: VerificationSuite,
+        verification_engine: VerificationEngine,
+        entity_index: dict[str, dict[str, str]],
+    ) -> None:
         """Diagnosis output mentions the bounce failure."""
-        suite = build_breakout_suite()
-        engine = VerificationEngine()
         manifests = self._build_no_bounce_manifests()
-        entity_index = _breakout_entity_index()
 
-        report = engine.verify(suite, manifests, entity_index)
+        report = verification_engine.verify(
+            breakout_suite, manifests, entity_index,
+        )
 
         diagnosis = report.diagnosis()
         assert "ball_bounces_off_paddle" in diagnosis
 
-    def test_suggested_fixes_are_actionable(self) -> None:
+    def test_suggested_fixes_are_actionable(
+        self,
+        breakout_suite: VerificationSuite,
+        verification_engine: VerificationEngine,
+        entity_index: dict[str, dict[str, str]],
+    ) -> None:
         """Suggested fixes include at least one fix for the bounce failure."""
-        suite = build_breakout_suite()
-        engine = VerificationEngine()
         manifests = self._build_no_bounce_manifests()
-        entity_index = _breakout_entity_index()
 
-        report = engine.verify(suite, manifests, entity_index)
+        report = verification_engine.verify(
+            breakout_suite, manifests, entity_index,
+        )
 
         fixes = report.suggested_fixes()
         assert len(fixes) > 0
@@ -465,14 +533,18 @@ class TestBuggyBricksDoNotDespawn:
             _make_manifest(tick=4, aggregates=_aggregates(brick_count=20)),
         ]
 
-    def test_brick_destroyed_on_hit_fails(self) -> None:
+    def test_brick_destroyed_on_hit_fails(
+        self,
+        breakout_suite: VerificationSuite,
+        verification_engine: VerificationEngine,
+        entity_index: dict[str, dict[str, str]],
+    ) -> None:
         """brick_destroyed_on_hit intent fails when bricks don't despawn."""
-        suite = build_breakout_suite()
-        engine = VerificationEngine()
         manifests = self._build_no_despawn_manifests()
-        entity_index = _breakout_entity_index()
 
-        report = engine.verify(suite, manifests, entity_index)
+        report = verification_engine.verify(
+            breakout_suite, manifests, entity_index,
+        )
 
         brick_result = next(
             r for r in report.results
@@ -480,26 +552,34 @@ class TestBuggyBricksDoNotDespawn:
         )
         assert not brick_result.passed
 
-    def test_diagnosis_mentions_brick_failure(self) -> None:
+    def test_diagnosis_mentions_brick_failure(
+        self,
+        breakout_suite: VerificationSuite,
+        verification_engine: VerificationEngine,
+        entity_index: dict[str, dict[str, str]],
+    ) -> None:
         """Diagnosis mentions the brick destruction failure."""
-        suite = build_breakout_suite()
-        engine = VerificationEngine()
         manifests = self._build_no_despawn_manifests()
-        entity_index = _breakout_entity_index()
 
-        report = engine.verify(suite, manifests, entity_index)
+        report = verification_engine.verify(
+            breakout_suite, manifests, entity_index,
+        )
 
         diagnosis = report.diagnosis()
         assert "brick_destroyed_on_hit" in diagnosis
 
-    def test_suggested_fixes_for_brick_failure(self) -> None:
+    def test_suggested_fixes_for_brick_failure(
+        self,
+        breakout_suite: VerificationSuite,
+        verification_engine: VerificationEngine,
+        entity_index: dict[str, dict[str, str]],
+    ) -> None:
         """Suggested fixes include a fix for brick destruction failure."""
-        suite = build_breakout_suite()
-        engine = VerificationEngine()
         manifests = self._build_no_despawn_manifests()
-        entity_index = _breakout_entity_index()
 
-        report = engine.verify(suite, manifests, entity_index)
+        report = verification_engine.verify(
+            breakout_suite, manifests, entity_index,
+        )
 
         fixes = report.suggested_fixes()
         brick_fixes = [
@@ -518,8 +598,12 @@ class TestRegressionTestRoundTrip:
     """
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def _replay_suite() -> VerificationSuite:
-        """Build a suite excluding entity intents for replay compatibility."""
+        """Build a suite excluding entity intents for replay compatibility.
+
+        Cached, so callers share one instance and must not mutate it.
+        """
         full = build_breakout_suite()
         return VerificationSuite(
             name=full.name,
@@ -529,35 +613,44 @@ class TestRegressionTestRoundTrip:
             ],
         )
 
-    def test_regression_test_from_passing_run(self) -> None:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def replay_report(
+        cls,
+        correct_manifests: list[TickManifest],
+        verification_engine: VerificationEngine,
+    ) -> VerificationReport:
+        """The replay suite verified once against the correct manifests."""
+        return verification_engine.verify(cls._replay_suite(), correct_manifests)
+
+    def test_regression_test_from_passing_run(
+        self,
+        breakout_suite: VerificationSuite,
+        correct_manifests: list[TickManifest],
+        correct_report: VerificationReport,
+    ) -> None:
         """Create a RegressionTest from a passing verification run."""
-        suite = build_breakout_suite()
-        engine = VerificationEngine()
-        manifests = _build_correct_gameplay_manifests()
-        entity_index = _breakout_entity_index()
-
-        report = engine.verify(suite, manifests, entity_index)
-        assert report.all_passed
+        assert correct_report.all_passed
 
         regression = RegressionTest.create(
             name="breakout-regression-v1",
-            suite=suite,
-            manifests=manifests,
-            report=report,
+            suite=breakout_suite,
+            manifests=correct_manifests,
+            report=correct_report,
         )
         assert regression.name == "breakout-regression-v1"
         assert regression.expected_pass_count == 13
         assert regression.expected_fail_count == 0
 
-    def test_regression_save_and_load(self, tmp_path: Path) -> None:
+    def test_regression_save_and_load(
+        self,
+        tmp_path: Path,
+        correct_manifests: list[TickManifest],
+        replay_report: VerificationReport,
+    ) -> None:
         """Regression test survives save/load cycle."""
-        suite = self._replay_suite()
-        engine = VerificationEngine()
-        manifests = _build_correct_gameplay_manifests()
-
-        report = engine.verify(suite, manifests)
         regression = RegressionTest.create(
-            "breakout-rt", suite, manifests, report,
+            "breakout-rt", self._replay_suite(), correct_manifests, replay_report,
         )
 
         filepath = tmp_path / "breakout_regression.json"
@@ -565,47 +658,48 @@ class TestRegressionTestRoundTrip:
         loaded = RegressionTest.load(filepath)
 
         assert loaded.name == "breakout-rt"
-        assert len(loaded.manifests) == len(manifests)
+        assert len(loaded.manifests) == len(correct_manifests)
         assert loaded.expected_pass_count == regression.expected_pass_count
         assert loaded.expected_fail_count == regression.expected_fail_count
 
-    def test_regression_replay_passes_with_same_manifests(self) -> None:
+    def test_regression_replay_passes_with_same_manifests(
+        self,
+        verification_engine: VerificationEngine,
+        correct_manifests: list[TickManifest],
+        replay_report: VerificationReport,
+    ) -> None:
         """Replaying with same manifests produces same pass/fail counts."""
-        suite = self._replay_suite()
-        engine = VerificationEngine()
-        manifests = _build_correct_gameplay_manifests()
-
-        report = engine.verify(suite, manifests)
-        assert report.all_passed
+        assert replay_report.all_passed
 
         regression = RegressionTest.create(
-            "replay-test", suite, manifests, report,
+            "replay-test", self._replay_suite(), correct_manifests, replay_report,
         )
 
-        replay_result = regression.replay(engine)
+        replay_result = regression.replay(verification_engine)
         assert replay_result.passed
         # 10 = 13 total intents - 3 entity intents (excluded from replay suite)
         assert replay_result.actual_passed == 10
         assert replay_result.actual_failed == 0
 
-    def test_regression_replay_full_roundtrip(self, tmp_path: Path) -> None:
+    def test_regression_replay_full_roundtrip(
+        self,
+        tmp_path: Path,
+        verification_engine: VerificationEngine,
+        correct_manifests: list[TickManifest],
+        replay_report: VerificationReport,
+    ) -> None:
         """Full round-trip: create, save, load, replay -- all passing."""
-        suite = self._replay_suite()
-        engine = VerificationEngine()
-        manifests = _build_correct_gameplay_manifests()
-
-        report = engine.verify(suite, manifests)
-        assert report.all_passed
+        assert replay_report.all_passed
 
         regression = RegressionTest.create(
-            "full-rt", suite, manifests, report,
+            "full-rt", self._replay_suite(), correct_manifests, replay_report,
         )
 
         filepath = tmp_path / "full_roundtrip.json"
         regression.save(filepath)
         loaded = RegressionTest.load(filepath)
 
-        replay_result = loaded.replay(engine)
+        replay_result = loaded.replay(verification_engine)
         assert replay_result.passed, (
             f"Replay failed: expected {replay_result.expected_passed}p/"
             f"{replay_result.expected_failed}f, got "
@@ -0,0 +1,53 @@
+"""Tests for the native-evaluable run_until predicates."""
+
+from __future__ import annotations
+
+import pytest
+
+from nomai.manifest import TickManifest
+from nomai.predicates import (
+    NATIVE_PREDICATES,
+    EntityCountAtLeast,
+    EntityCountAtMost,
+    TickAtLeast,
+)
+
+
+def _manifest(tick: int, entities: int) -> TickManifest:
+    return TickManifest.from_dict({
+        "tick": tick,
+        "aggregates": {"total_entity_count": entities},
+    })
+
+
+@pytest.mark.parametrize(
+    ("predicate", "manifest", "expected"),
+    [
+        (TickAtLeast(5), _manifest(4, 0), False),
+        (TickAtLeast(5), _manifest(5, 0), True),
+        (EntityCountAtLeast(3), _manifest(0, 2), False),
+        (EntityCountAtLeast(3), _manifest(0, 3), True),
+        (EntityCountAtMost(1), _manifest(0, 2), False),
+        (EntityCountAtMost(1), _manifest(0, 1), True),
+    ],
+)
+def test_predicate_evaluates_in_python(
+    predicate: TickAtLeast | EntityCountAtLeast | EntityCountAtMost,
+    manifest: TickManifest,
+    expected: bool,
+) -> None:
+    """Each predicate is a plain callable over a TickManifest."""
+    assert predicate(manifest) is expected
+
+
+def test_native_args() -> None:
+    """Predicates lower to the (name, threshold) pairs the engine accepts."""
+    assert TickAtLeast(5).native_args() == ("tick_at_least", 5)
+    assert EntityCountAtLeast(3).native_args() == ("entity_count_at_least", 3)
+    assert EntityCountAtMost(0).native_args() == ("entity_count_at_most", 0)
+
+
+def test_lambdas_are_not_native() -> None:
+    """Only the predicate classes take the native run_until path."""
+    assert isinstance(TickAtLeast(1), NATIVE_PREDICATES)
+    assert not isinstance(lambda m: True, NATIVE_PREDICATES)
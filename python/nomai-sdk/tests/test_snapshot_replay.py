@@ -43,10 +43,12 @@ class TestEngineSnapshotDataclass:
         "current_input": {"inputs": {}},
         "hash": "a" * 64,
     })
+    # Parsed once; EngineSnapshot is frozen, so tests can share it.
+    SAMPLE_SNAP = EngineSnapshot.from_json(SAMPLE_JSON)
 
     def test_from_json_parses_fields(self) -> None:
         """from_json extracts tick_counter, fixed_dt, and hash."""
-        snap = EngineSnapshot.from_json(self.SAMPLE_JSON)
+        snap = self.SAMPLE_SNAP
         assert snap.tick_counter == 42
         assert abs(snap.fixed_dt - 1.0 / 60.0) < 1e-10
         assert snap.hash == "a" * 64
@@ -58,8 +60,7 @@ class TestEngineSnapshotDataclass:
 
     def test_to_dict_excludes_raw_json(self) -> None:
         """to_dict returns a summary without raw_json."""
-        snap = EngineSnapshot.from_json(self.SAMPLE_JSON)
-        d = snap.to_dict()
+        d = self.SAMPLE_SNAP.to_dict()
         assert "raw_json" not in d
         assert d["tick_counter"] == 42
         assert d["hash"] == "a" * 64
@@ -158,18 +159,42 @@ class TestReplayLogDataclass:
         "total_ticks": 50,
         "entries": [],
     })
+    SAMPLE_LOG = ReplayLog.from_json(SAMPLE_LOG_JSON)
 
     def test_from_json_parses_total_ticks(self) -> None:
-        log = ReplayLog.from_json(self.SAMPLE_LOG_JSON)
-        assert log.total_ticks == 50
+        assert self.SAMPLE_LOG.total_ticks == 50
 
     def test_from_json_preserves_raw_json(self) -> None:
         log = ReplayLog.from_json(self.SAMPLE_LOG_JSON)
         assert log.raw_json == self.SAMPLE_LOG_JSON
 
+    def test_from_json_accepts_bytes(self) -> None:
+        """Bytes input is parsed and kept as-is for the engine."""
+        raw = self.SAMPLE_LOG_JSON.encode()
+        log = ReplayLog.from_json(raw)
+        assert log.total_ticks == 50
+        assert log.raw_json is raw
+
+    def test_from_parts_matches_hand_built_log(self) -> None:
+        """from_parts splices the snapshot JSON into an equivalent log."""
+        snap = EngineSnapshot.from_json(
+            json.dumps(json.loads(self.SAMPLE_LOG_JSON)["initial_snapshot"])
+        )
+        log = ReplayLog.from_parts(snap, 50)
+        assert log.total_ticks == 50
+        assert json.loads(log.raw_json) == json.loads(self.SAMPLE_LOG_JSON)
+
+    def test_from_parts_encodes_entries(self) -> None:
+        snap = TestEngineSnapshotDataclass.SAMPLE_SNAP
+        entries = [{"Checkpoint": {"tick": 3, "state_hash": "c" * 64}}]
+        log = ReplayLog.from_parts(snap, 5, entries, gameplay_module_hash="d" * 64)
+        data = json.loads(log.raw_json)
+        assert data["entries"] == entries
+        assert data["gameplay_module_hash"] == "d" * 64
+        assert data["initial_snapshot"]["tick_counter"] == 42
+
     def test_to_dict_summary(self) -> None:
-        log = ReplayLog.from_json(self.SAMPLE_LOG_JSON)
-        d = log.to_dict()
+        d = self.SAMPLE_LOG.to_dict()
         assert d["total_ticks"] == 50
         assert "raw_json" not in d
 
@@ -198,6 +223,28 @@ def _make_engine() -> "NomaiEngine":
     return engine
 
 
+@pytest.fixture(scope="module")
+def _shared_engine() -> tuple["NomaiEngine", EngineSnapshot]:
+    """One engine per module, plus a snapshot of its freshly-built state."""
+    _skip_if_no_native()
+    engine = _make_engine()
+    return engine, engine.capture_snapshot()
+
+
+@pytest.fixture
+def engine(_shared_engine: tuple["NomaiEngine", EngineSnapshot]) -> "NomaiEngine":
+    """The shared engine, restored to its pristine state for this test.
+
+    Restore is deterministic (see ``test_restore_then_run_produces_same_hash``)
+    and resets the tick counter, world, input frame, manifest pipeline and
+    command buffer, so each test sees the same state a fresh
+    ``_make_engine()`` would give without booting a new engine.
+    """
+    shared, pristine = _shared_engine
+    shared.restore_snapshot(pristine)
+    return shared
+
+
 class TestSnapshotIntegration:
     """Integration tests for snapshot/restore via the Python SDK."""
 
@@ -205,9 +252,8 @@ class TestSnapshotIntegration:
     def _require_native(self) -> None:
         _skip_if_no_native()
 
-    def test_capture_snapshot_returns_typed_object(self) -> None:
+    def test_capture_snapshot_returns_typed_object(self, engine: "NomaiEngine") -> None:
         """capture_snapshot returns an EngineSnapshot with correct fields."""
-        engine = _make_engine()
         engine.tick()
 
         snap = engine.capture_snapshot()
@@ -217,10 +263,8 @@ class TestSnapshotIntegration:
         assert len(snap.hash) == 64
         assert len(snap.raw_json) > 0
 
-    def test_snapshot_restore_resets_tick_count(self) -> None:
+    def test_snapshot_restore_resets_tick_count(self, engine: "NomaiEngine") -> None:
         """Restore resets the tick counter to the snapshot's value."""
-        engine = _make_engine()
-
         # Run 5 ticks, capture.
         engine.run_ticks(5)
         assert engine.tick_count == 5
@@ -234,26 +278,23 @@ class TestSnapshotIntegration:
         engine.restore_snapshot(snap)
         assert engine.tick_count == 5
 
-    def test_state_hash_returns_hex_string(self) -> None:
+    def test_state_hash_returns_hex_string(self, engine: "NomaiEngine") -> None:
         """state_hash returns a 64-character lowercase hex string."""
-        engine = _make_engine()
         h = engine.state_hash()
         assert len(h) == 64
         assert re.fullmatch(r"[0-9a-f]{64}", h), (
             f"state_hash should be 64 hex chars, got: {h!r}"
         )
 
-    def test_state_hash_changes_after_tick(self) -> None:
+    def test_state_hash_changes_after_tick(self, engine: "NomaiEngine") -> None:
         """State hash changes after running a tick."""
-        engine = _make_engine()
         h1 = engine.state_hash()
         engine.tick()
         h2 = engine.state_hash()
         assert h1 != h2, "state hash should change after a tick"
 
-    def test_snapshot_json_roundtrip(self) -> None:
+    def test_snapshot_json_roundtrip(self, engine: "NomaiEngine") -> None:
         """Snapshot JSON can be parsed and restored."""
-        engine = _make_engine()
         engine.spawn_entity("unit", "test", {"position": {"x": 1.0, "y": 2.0}})
         engine.tick()
 
@@ -274,9 +315,8 @@ class TestSnapshotIntegration:
         engine.restore_snapshot(snap2)
         assert engine.tick_count == 1
 
-    def test_restore_then_run_produces_same_hash(self) -> None:
+    def test_restore_then_run_produces_same_hash(self, engine: "NomaiEngine") -> None:
         """Restore + same ticks produces the same state hash (determinism)."""
-        engine = _make_engine()
         engine.spawn_entity("unit", "test", {"counter": 0})
         engine.tick()  # tick 0: apply spawn
 
@@ -296,9 +336,8 @@ class TestSnapshotIntegration:
             "an identical state hash (determinism guarantee)"
         )
 
-    def test_snapshot_capture_at_tick_zero(self) -> None:
+    def test_snapshot_capture_at_tick_zero(self, engine: "NomaiEngine") -> None:
         """Snapshot at tick 0 (before any ticks) is valid."""
-        engine = _make_engine()
         snap = engine.capture_snapshot()
         assert snap.tick_counter == 0
 
@@ -315,17 +354,15 @@ class TestInputFrameIntegration:
     def _require_native(self) -> None:
         _skip_if_no_native()
 
-    def test_set_input_changes_state_hash(self) -> None:
+    def test_set_input_changes_state_hash(self, engine: "NomaiEngine") -> None:
         """Setting an input frame changes the state hash."""
-        engine = _make_engine()
         h1 = engine.state_hash()
         engine.set_input({"move_x": 1.0, "move_y": -1.0})
         h2 = engine.state_hash()
         assert h1 != h2, "state hash should change after set_input"
 
-    def test_set_input_with_complex_values(self) -> None:
+    def test_set_input_with_complex_values(self, engine: "NomaiEngine") -> None:
         """set_input handles various JSON-serializable value types."""
-        engine = _make_engine()
         # Should not raise.
         engine.set_input({
             "int_val": 42,
@@ -340,9 +377,8 @@ class TestInputFrameIntegration:
         engine.tick()
         assert engine.tick_count == 1
 
-    def test_empty_input_is_valid(self) -> None:
+    def test_empty_input_is_valid(self, engine: "NomaiEngine") -> None:
         """An empty input dict is valid."""
-        engine = _make_engine()
         engine.set_input({})
         engine.tick()
         assert engine.tick_count == 1
@@ -360,31 +396,23 @@ class TestReplayIntegration:
     def _require_native(self) -> None:
         _skip_if_no_native()
 
-    def test_replay_deterministic_no_inputs(self) -> None:
+    def test_replay_deterministic_no_inputs(self, engine: "NomaiEngine") -> None:
         """Replay with no inputs or checkpoints completes successfully."""
-        engine = _make_engine()
         engine.spawn_entity("unit", "test", {"counter": 0})
         engine.tick()  # tick 0: apply spawn
 
         snap = engine.capture_snapshot()
 
         # Build a minimal replay log: 5 ticks, no inputs, no checkpoints.
-        log_data = {
-            "initial_snapshot": json.loads(snap.raw_json),
-            "gameplay_module_hash": None,
-            "total_ticks": 5,
-            "entries": [],
-        }
-        log = ReplayLog.from_json(json.dumps(log_data))
+        log = ReplayLog.from_parts(snap, 5)
 
         result = engine.replay(log)
         assert result.completed is True
         assert result.ticks_replayed == 5
         assert result.first_divergence is None
 
-    def test_replay_with_checkpoint_passes(self) -> None:
+    def test_replay_with_checkpoint_passes(self, engine: "NomaiEngine") -> None:
         """Replay with a valid checkpoint produces no divergence."""
-        engine = _make_engine()
         engine.spawn_entity("unit", "test", {"counter": 0})
         engine.tick()  # tick 0: apply spawn
 
@@ -397,11 +425,10 @@ class TestReplayIntegration:
         start_hash = engine.state_hash()
 
         # Build replay log with a single checkpoint at the start tick.
-        log_data = {
-            "initial_snapshot": json.loads(snap.raw_json),
-            "gameplay_module_hash": None,
-            "total_ticks": 3,
-            "entries": [
+        log = ReplayLog.from_parts(
+            snap,
+            3,
+            [
                 {
                     "Checkpoint": {
                         "tick": start_tick,
@@ -409,16 +436,16 @@ class TestReplayIntegration:
                     }
                 }
             ],
-        }
-        log = ReplayLog.from_json(json.dumps(log_data))
+        )
 
         result = engine.replay(log)
         assert result.completed is True
         assert result.first_divergence is None
 
-    def test_replay_with_wrong_checkpoint_detects_divergence(self) -> None:
+    def test_replay_with_wrong_checkpoint_detects_divergence(
+        self, engine: "NomaiEngine",
+    ) -> None:
         """Replay with a deliberately wrong checkpoint detects divergence."""
-        engine = _make_engine()
         engine.spawn_entity("unit", "test", {"counter": 0})
         engine.tick()
 
@@ -426,11 +453,10 @@ class TestReplayIntegration:
         start_tick = snap.tick_counter
 
         # Use a bogus hash for the checkpoint.
-        log_data = {
-            "initial_snapshot": json.loads(snap.raw_json),
-            "gameplay_module_hash": None,
-            "total_ticks": 3,
-            "entries": [
+        log = ReplayLog.from_parts(
+            snap,
+            3,
+            [
                 {
                     "Checkpoint": {
                         "tick": start_tick,
@@ -438,8 +464,7 @@ class TestReplayIntegration:
                     }
                 }
             ],
-        }
-        log = ReplayLog.from_json(json.dumps(log_data))
+        )
 
         result = engine.replay(log)
         assert result.completed is False
@@ -448,36 +473,22 @@ class TestReplayIntegration:
         assert result.first_divergence.expected_hash == "0" * 64
         assert result.first_divergence.actual_hash != "0" * 64
 
-    def test_replay_zero_ticks(self) -> None:
+    def test_replay_zero_ticks(self, engine: "NomaiEngine") -> None:
         """Replay with zero ticks completes immediately."""
-        engine = _make_engine()
         snap = engine.capture_snapshot()
 
-        log_data = {
-            "initial_snapshot": json.loads(snap.raw_json),
-            "gameplay_module_hash": None,
-            "total_ticks": 0,
-            "entries": [],
-        }
-        log = ReplayLog.from_json(json.dumps(log_data))
+        log = ReplayLog.from_parts(snap, 0)
 
         result = engine.replay(log)
         assert result.completed is True
         assert result.ticks_replayed == 0
         assert result.first_divergence is None
 
-    def test_replay_result_is_json_serializable(self) -> None:
+    def test_replay_result_is_json_serializable(self, engine: "NomaiEngine") -> None:
         """ReplayResult round-trips through JSON cleanly."""
-        engine = _make_engine()
         snap = engine.capture_snapshot()
 
-        log_data = {
-            "initial_snapshot": json.loads(snap.raw_json),
-            "gameplay_module_hash": None,
-            "total_ticks": 3,
-            "entries": [],
-        }
-        log = ReplayLog.from_json(json.dumps(log_data))
+        log = ReplayLog.from_parts(snap, 3)
 
         result = engine.replay(log)
         d = result.to_dict()
@@ -494,9 +505,8 @@ class TestErrorPaths:
     def _require_native(self) -> None:
         _skip_if_no_native()
 
-    def test_restore_tampered_snapshot_raises(self) -> None:
+    def test_restore_tampered_snapshot_raises(self, engine: "NomaiEngine") -> None:
         """Restoring a snapshot with a tampered hash raises RuntimeError."""
-        engine = _make_engine()
         engine.tick()
         snap = engine.capture_snapshot()
 
@@ -508,47 +518,42 @@ class TestErrorPaths:
         with pytest.raises(RuntimeError, match="hash mismatch"):
             engine.restore_snapshot(tampered)
 
-    def test_replay_duplicate_input_entries_raises(self) -> None:
+    def test_replay_duplicate_input_entries_raises(self, engine: "NomaiEngine") -> None:
         """Replay log with duplicate Input entries at the same tick raises."""
-        engine = _make_engine()
         snap = engine.capture_snapshot()
 
-        log_data = {
-            "initial_snapshot": json.loads(snap.raw_json),
-            "gameplay_module_hash": None,
-            "total_ticks": 3,
-            "entries": [
+        log = ReplayLog.from_parts(
+            snap,
+            3,
+            [
                 {"Input": {"tick": 0, "input": {"inputs": {"a": 1}}}},
                 {"Input": {"tick": 0, "input": {"inputs": {"b": 2}}}},
             ],
-        }
-        log = ReplayLog.from_json(json.dumps(log_data))
+        )
 
         with pytest.raises(RuntimeError, match="duplicate Input"):
             engine.replay(log)
 
-    def test_replay_duplicate_checkpoint_entries_raises(self) -> None:
+    def test_replay_duplicate_checkpoint_entries_raises(
+        self, engine: "NomaiEngine",
+    ) -> None:
         """Replay log with duplicate Checkpoint entries at same tick raises."""
-        engine = _make_engine()
         snap = engine.capture_snapshot()
 
-        log_data = {
-            "initial_snapshot": json.loads(snap.raw_json),
-            "gameplay_module_hash": None,
-            "total_ticks": 3,
-            "entries": [
+        log = ReplayLog.from_parts(
+            snap,
+            3,
+            [
                 {"Checkpoint": {"tick": 0, "state_hash": "a" * 64}},
                 {"Checkpoint": {"tick": 0, "state_hash": "b" * 64}},
             ],
-        }
-        log = ReplayLog.from_json(json.dumps(log_data))
+        )
 
         with pytest.raises(RuntimeError, match="duplicate Checkpoint"):
             engine.replay(log)
 
-    def test_replay_malformed_log_json_raises(self) -> None:
+    def test_replay_malformed_log_json_raises(self, engine: "NomaiEngine") -> None:
         """Replay with invalid JSON raises ValueError."""
-        engine = _make_engine()
         # Construct a ReplayLog with garbage raw_json manually.
         # We need to bypass from_json since it would fail to parse.
         log = ReplayLog(total_ticks=1, raw_json="not valid json")
@@ -556,9 +561,10 @@ class TestErrorPaths:
         with pytest.raises(ValueError, match="invalid replay log JSON"):
             engine.replay(log)
 
-    def test_restore_malformed_snapshot_json_raises(self) -> None:
+    def test_restore_malformed_snapshot_json_raises(
+        self, engine: "NomaiEngine",
+    ) -> None:
         """Restore with invalid JSON raises ValueError."""
-        engine = _make_engine()
         snap = EngineSnapshot(
             tick_counter=0, fixed_dt=1.0 / 60.0, hash="x" * 64,
             raw_json="not valid json",
@@ -6,8 +6,11 @@ against mock tick manifests, covering both pass and fail cases.
 
 from __future__ import annotations
 
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 
+import pytest
+
 from nomai.intents import (
     IntentKind,
     IntentSpec,
@@ -1765,6 +1768,19 @@ class TestReportSerialization:
         assert restored.suite_name == "json-test"
         assert restored.all_passed
 
+    def test_verification_report_from_json_bytes(self) -> None:
+        """from_json accepts UTF-8 bytes as well as str."""
+        report = VerificationReport(
+            suite_name="bytes-test",
+            total_intents=1,
+            passed=1,
+            failed=0,
+            results=[IntentResult(intent_name="ok", passed=True)],
+        )
+        restored = VerificationReport.from_json(report.to_json().encode())
+        assert restored.suite_name == "bytes-test"
+        assert restored.all_passed
+
 
 # ---------------------------------------------------------------------------
 # Regression test
@@ -2288,3 +2304,43 @@ class TestCompareHelper:
         """Unknown operator returns False."""
         engine = VerificationEngine()
         assert not engine._compare(5.0, "~=", 5.0)
+
+
+class TestVerificationEngineSharing:
+    """The engine is frozen and stateless, so one instance can be reused."""
+
+    def test_engine_is_frozen(self) -> None:
+        """Assigning an attribute on the engine raises."""
+        engine = VerificationEngine()
+        with pytest.raises(FrozenInstanceError):
+            engine.cache = {}  # type: ignore[attr-defined]
+
+    def test_shared_engine_does_not_leak_state(self) -> None:
+        """A failing run on a shared engine does not affect the next run."""
+        # Arrange
+        engine = VerificationEngine()
+        suite = VerificationSuite(
+            name="test",
+            description="test",
+            intents=[
+                IntentSpec(
+                    name="paddle_exists",
+                    kind=IntentKind.ENTITY,
+                    description="Paddle must exist",
+                    entity_type="character",
+                    entity_role="paddle",
+                ),
+            ],
+        )
+        entity_index = {
+            "paddle": {"entity_type": "character", "role": "paddle", "tier": "Semantic"},
+        }
+        manifests = [_make_manifest(tick=1)]
+
+        # Act
+        failing = engine.verify(suite, manifests, {})
+        passing = engine.verify(suite, manifests, entity_index)
+
+        # Assert
+        assert not failing.all_passed
+        assert passing.all_passed